@@ -36,4 +36,24 @@ def create_app(config_class=Config):
     app.register_blueprint(utility_bp,     url_prefix='/talk')
     app.register_blueprint(translation_bp, url_prefix='/talk')
     
+    # 요청 / 처리 단계별 지연 시간 메트릭 (/talk/metrics)
+    from app.services import metrics
+    metrics.init_app(app)
+    
+    # 요청별 trace (X-Trace-Id, /talk/traces)
+    from app.services import tracing
+    tracing.init_app(app)
+    
+    # GPT 클라이언트 수명 주기 (시작/종료/fork)
+    from app.services import gpt_client_registry
+    gpt_client_registry.init_app(app)
+    
+    # 모델 워밍업 (백그라운드에서 병렬 로드, 준비 상태는 /talk/ready)
+    from app.services import model_warmup
+    model_warmup.init_app(app)
+    
+    # 스트리밍 STT (WebSocket, 별도 포트)
+    from app.services import stt_stream_service
+    stt_stream_service.init_app(app)
+    
     return app
\ No newline at end of file
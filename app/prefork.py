@@ -0,0 +1,190 @@
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from waitress import serve
+from config.settings import Config
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 부모 프로세스에서 미리 로드할 모델 (GPT 클라이언트는 소켓을 가지므로 자식마다 생성)
+PRELOAD_MODELS = ('whisper', 'tts_en', 'tts_ja')
+
+# 자식이 이 시간(초) 안에 종료되면 비정상 종료로 보고 재시작을 지연
+MIN_CHILD_LIFETIME = 5.0
+
+
+def _parent_config(config_class):
+    class PreforkParentConfig(config_class):
+        # fork 전 부모 프로세스에는 백그라운드 스레드를 만들지 않음 (워밍업, 스트리밍 STT 서버는 자식에서 실행)
+        MODEL_WARMUP_ENABLED = False
+        STT_STREAM_ENABLED = False
+
+    return PreforkParentConfig
+
+
+def _preload_models(app):
+    """
+    부모 프로세스에서 모델 가중치를 로드합니다. 자식 프로세스는 fork 후 copy-on-write로 같은 메모리를 공유합니다.
+    """
+    from app.services.model_warmup import ModelWarmup
+    from app.services.torch_optimizer import configure_torch_threads
+
+    # 부모에서 OpenMP 스레드 풀이 생성되면 fork된 자식의 병렬 연산이 멈출 수 있으므로 단일 스레드로 로드
+    configure_torch_threads(1, 1)
+
+    configured = [name.strip() for name in app.config.get('MODEL_WARMUP_MODELS', '').split(',') if name.strip()]
+    models = [name for name in configured if name in PRELOAD_MODELS]
+
+    # 더미 추론은 자식에서 실행 (부모에서는 가중치만 로드)
+    warmup = ModelWarmup(models, inference=False)
+    with app.app_context():
+        warmup.run()
+    if not warmup.is_ready():
+        logger.warning(f"일부 모델 사전 로드 실패, 자식 프로세스에서 다시 로드합니다: {warmup.status()}")
+
+    # 로드된 객체를 GC 추적 대상에서 제외하여, 자식에서 GC가 객체 헤더를 건드려 페이지가 복사되는 것을 방지
+    gc.collect()
+    gc.freeze()
+
+
+def _create_listen_socket(host, port, backlog=1024):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_child(app, sock, threads, config_class):
+    """
+    자식 프로세스: 공유 소켓에서 Waitress로 요청을 처리합니다.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    from app.services import model_warmup, stt_stream_service
+    from app.services.torch_optimizer import configure_torch_threads
+
+    # 프로세스별 torch 스레드 수 (CPU 코어 수 / SERVER_WORKERS)
+    with app.app_context():
+        configure_torch_threads()
+
+    # 모델은 이미 로드되어 있으므로 자식의 워밍업은 더미 추론과 GPT 클라이언트 생성만 수행
+    app.config['MODEL_WARMUP_ENABLED'] = config_class.MODEL_WARMUP_ENABLED
+    model_warmup.init_app(app)
+
+    # 스트리밍 STT 서버는 워커마다 SO_REUSEPORT로 같은 포트를 열어 연결을 나눠 받음
+    app.config['STT_STREAM_ENABLED'] = config_class.STT_STREAM_ENABLED
+    stt_stream_service.init_app(app)
+
+    serve(app, sockets=[sock], threads=threads)
+
+
+class PreforkServer:
+    """
+    모델을 한 번 로드한 부모 프로세스가 여러 Waitress 워커 프로세스를 fork하고 감시하는 서버.
+    워커들은 같은 리슨 소켓을 공유하며, 모델 가중치는 copy-on-write로 공유되어 중복 로드되지 않습니다.
+    """
+
+    def __init__(self, app, sock, workers, threads, config_class):
+        self.app = app
+        self.sock = sock
+        self.workers = max(1, int(workers))
+        self.threads = threads
+        self.config_class = config_class
+        self._children = {}  # pid -> 시작 시각
+        self._stopping = False
+
+    def spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_child(self.app, self.sock, self.threads, self.config_class)
+            except Exception as e:
+                logger.error(f"워커 프로세스 오류: {str(e)}")
+                import traceback
+                logger.error(traceback.format_exc())
+                code = 1
+            finally:
+                os._exit(code)
+
+        self._children[pid] = time.monotonic()
+        logger.info(f"워커 프로세스 시작: pid={pid}")
+        return pid
+
+    def stop(self, signum=None, frame=None):
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        for _ in range(self.workers):
+            self.spawn()
+
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+
+            started = self._children.pop(pid, None)
+            if started is None:
+                continue
+            if self._stopping:
+                logger.info(f"워커 프로세스 종료: pid={pid}")
+                continue
+
+            logger.warning(f"워커 프로세스가 예기치 않게 종료됨: pid={pid}, status={status}. 재시작합니다.")
+            if time.monotonic() - started < MIN_CHILD_LIFETIME:
+                # 시작 직후 반복 종료 시 과도한 재시작 방지
+                time.sleep(MIN_CHILD_LIFETIME)
+            if not self._stopping:
+                self.spawn()
+
+        self.sock.close()
+        logger.info("prefork 서버 종료")
+
+
+def serve_prefork(app_factory, host="0.0.0.0", port=5000, workers=2, threads=8, config_class=Config):
+    """
+    prefork 모드로 서버를 실행합니다.
+
+    Args:
+        app_factory (callable): 설정 클래스를 받아 Flask 앱을 생성하는 함수 (create_app)
+        host (str): 바인드 주소
+        port (int): 포트
+        workers (int): 워커 프로세스 수
+        threads (int): 워커별 Waitress 스레드 수
+        config_class (type): 설정 클래스
+    """
+    app = app_factory(_parent_config(config_class))
+
+    if not hasattr(os, 'fork'):
+        # Windows 등 fork를 지원하지 않는 환경은 단일 프로세스로 실행
+        logger.warning("fork를 지원하지 않는 환경입니다. 단일 프로세스로 실행합니다.")
+        app.config['MODEL_WARMUP_ENABLED'] = config_class.MODEL_WARMUP_ENABLED
+        app.config['STT_STREAM_ENABLED'] = config_class.STT_STREAM_ENABLED
+        from app.services import model_warmup, stt_stream_service
+        model_warmup.init_app(app)
+        stt_stream_service.init_app(app)
+        serve(app, host=host, port=port, threads=threads)
+        return
+
+    _preload_models(app)
+    sock = _create_listen_socket(host, port)
+    logger.info(f"prefork 서버 시작: {host}:{port}, workers={workers}, threads={threads}")
+    PreforkServer(app, sock, workers, threads, config_class).run()
@@ -0,0 +1,306 @@
+import asyncio
+import logging
+import os
+import queue
+import threading
+import httpx
+from openai import AsyncOpenAI
+from config.settings import get_setting
+from app.services.metrics import GPT_TOKENS, record_gpt_usage, track_stage
+from app.services import tracing
+from app.services.gpt_service import (
+    GPTService,
+    build_chat_messages,
+    build_extended_chat_messages,
+    build_conversation_messages,
+    build_translation_messages
+)
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def _http2_available():
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_async_http_client():
+    """
+    OpenAI 호출용으로 튜닝된 httpx.AsyncClient를 생성합니다.
+    (HTTP/2, keep-alive 풀 크기, 단계별 타임아웃)
+    """
+    http2 = get_setting('GPT_HTTP2_ENABLED', True)
+    if http2 and not _http2_available():
+        logger.warning("h2 패키지가 없어 HTTP/1.1로 OpenAI에 연결합니다.")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=get_setting('GPT_HTTP_MAX_CONNECTIONS', 20),
+        max_keepalive_connections=get_setting('GPT_HTTP_MAX_KEEPALIVE', 10),
+        keepalive_expiry=get_setting('GPT_HTTP_KEEPALIVE_EXPIRY', 60.0)
+    )
+    timeout = httpx.Timeout(
+        connect=get_setting('GPT_CONNECT_TIMEOUT', 5.0),
+        read=get_setting('GPT_READ_TIMEOUT', 60.0),
+        write=get_setting('GPT_WRITE_TIMEOUT', 10.0),
+        pool=get_setting('GPT_POOL_TIMEOUT', 5.0)
+    )
+
+    # transport를 직접 지정하면 limits/http2는 transport에 넘겨야 적용됨
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=2, http2=http2, limits=limits),
+        timeout=timeout
+    )
+
+
+class AsyncGPTService:
+    """
+    AsyncOpenAI 기반 GPT 서비스. GPTService와 같은 프롬프트와 응답 형식을 사용합니다.
+    """
+
+    # 응답 포맷팅은 동기 서비스와 동일
+    format_learning_response = GPTService.format_learning_response
+    format_extended_response = GPTService.format_extended_response
+
+    def __init__(self, http_client=None):
+        # OpenAI API 키 설정
+        self.api_key = os.getenv("OPENAI_API_KEY")
+
+        if not self.api_key:
+            logger.error("OPENAI_API_KEY가 설정되지 않았습니다.")
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+
+        self.http_client = http_client or create_async_http_client()
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self.http_client)
+
+        # 기본 모델 설정
+        self.model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+
+        logger.info(f"AsyncGPTService 초기화 완료: 모델={self.model}")
+
+    async def _complete(self, messages, temperature, max_tokens, label):
+        try:
+            # run_coroutine_threadsafe는 제출한 스레드의 컨텍스트를 복사하므로 요청 trace가 이어짐
+            with track_stage('gpt_request'), tracing.span('gpt.async_completion', {
+                'gpt.model': self.model,
+                'gpt.max_tokens': max_tokens
+            }) as gpt_span:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+
+            # 응답 추출
+            response_text = response.choices[0].message.content
+            usage = response.usage.total_tokens if hasattr(response, 'usage') else None
+            record_gpt_usage(getattr(response, 'usage', None), gpt_span)
+
+            logger.info(f"{label} 응답 성공: 토큰 사용량={usage}")
+
+            return {
+                "answer": response_text,
+                "model": self.model,
+                "usage": {"total_tokens": usage} if usage else None
+            }
+
+        except Exception as e:
+            logger.error(f"{label} 호출 중 오류 발생: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise e
+
+    async def get_chat_response(self, user_message, language="en"):
+        """
+        GPT 모델을 사용하여 채팅 응답을 가져옵니다. (GPTService.get_chat_response와 동일한 결과 형식)
+        """
+        return await self._complete(build_chat_messages(user_message, language), 0.7, 1000, "비동기 GPT API")
+
+    async def get_chat_response_extended(self, user_message, language="en"):
+        """
+        확장된 채팅 응답(응답, 어휘, 예시 응답)을 가져옵니다.
+        """
+        return await self._complete(build_extended_chat_messages(user_message, language), 0.7, 1500, "비동기 확장 GPT API")
+
+    async def get_chat_conversation(self, user_message, chat_history=None, language="en"):
+        """
+        이전 대화 기록을 고려한 GPT 응답을 가져옵니다.
+        """
+        return await self._complete(build_conversation_messages(user_message, chat_history, language), 0.7, 1500, "비동기 대화 기록 GPT API")
+
+    async def get_translation(self, text, source_language, target_language):
+        """
+        텍스트를 번역합니다. 결과 형식은 GPTService.get_translation과 같습니다.
+        """
+        result = await self._complete(build_translation_messages(text, source_language, target_language), 0.3, 1500, "비동기 번역 API")
+        return {
+            "translated_text": result["answer"].strip(),
+            "model": result["model"],
+            "usage": result["usage"]
+        }
+
+    async def _stream(self, messages, temperature, max_tokens):
+        """
+        stream=True로 GPT API를 호출하고 도착하는 텍스트 조각을 반환하는 비동기 제너레이터입니다.
+        """
+        with track_stage('gpt_request'), tracing.span('gpt.async_stream_completion', {
+            'gpt.model': self.model,
+            'gpt.max_tokens': max_tokens
+        }) as gpt_span:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            chunks = 0
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    GPT_TOKENS.inc(kind='stream_chunks')
+                    if chunks == 0:
+                        gpt_span.set_attribute('gpt.first_chunk_ms', round(gpt_span.duration_ms, 1))
+                    chunks += 1
+                    gpt_span.set_attribute('gpt.stream_chunks', chunks)
+                    yield delta
+
+    def stream_chat_response(self, user_message, language="en"):
+        return self._stream(build_chat_messages(user_message, language), 0.7, 1000)
+
+    def stream_chat_response_extended(self, user_message, language="en"):
+        return self._stream(build_extended_chat_messages(user_message, language), 0.7, 1500)
+
+    def stream_chat_conversation(self, user_message, chat_history=None, language="en"):
+        return self._stream(build_conversation_messages(user_message, chat_history, language), 0.7, 1500)
+
+    async def aclose(self):
+        """
+        HTTP 연결 풀을 닫습니다.
+        """
+        await self.http_client.aclose()
+
+
+class AsyncGPTBridge:
+    """
+    동기 Flask 라우트에서 AsyncGPTService를 사용하기 위한 브리지.
+
+    전용 이벤트 루프 스레드 하나에서 모든 GPT 요청의 네트워크 I/O를 처리하고,
+    GPTService와 같은 동기 메서드와 Future를 반환하는 submit_* 메서드를 제공합니다.
+    """
+
+    def __init__(self, timeout=120.0):
+        """
+        Args:
+            timeout (float): 동기 메서드가 결과를 기다리는 최대 시간(초)
+        """
+        self.timeout = float(timeout)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='gpt-event-loop', daemon=True)
+        self._thread.start()
+
+        # httpx.AsyncClient는 사용할 이벤트 루프 안에서 생성
+        self.service = self.submit(self._create_service()).result(timeout=30)
+        self.model = self.service.model
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _create_service():
+        return AsyncGPTService()
+
+    def submit(self, coro):
+        """
+        코루틴을 이벤트 루프에 제출하고 concurrent.futures.Future를 반환합니다.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def submit_chat_response(self, user_message, language="en"):
+        return self.submit(self.service.get_chat_response(user_message, language))
+
+    def submit_chat_response_extended(self, user_message, language="en"):
+        return self.submit(self.service.get_chat_response_extended(user_message, language))
+
+    def submit_chat_conversation(self, user_message, chat_history=None, language="en"):
+        return self.submit(self.service.get_chat_conversation(user_message, chat_history, language))
+
+    def submit_translation(self, text, source_language, target_language):
+        return self.submit(self.service.get_translation(text, source_language, target_language))
+
+    # GPTService와 같은 동기 인터페이스
+    def get_chat_response(self, user_message, language="en"):
+        return self.submit_chat_response(user_message, language).result(timeout=self.timeout)
+
+    def get_chat_response_extended(self, user_message, language="en"):
+        return self.submit_chat_response_extended(user_message, language).result(timeout=self.timeout)
+
+    def get_chat_conversation(self, user_message, chat_history=None, language="en"):
+        return self.submit_chat_conversation(user_message, chat_history, language).result(timeout=self.timeout)
+
+    def get_translation(self, text, source_language, target_language):
+        return self.submit_translation(text, source_language, target_language).result(timeout=self.timeout)
+
+    def stream_chat_response(self, user_message, language="en"):
+        return self._iterate(self.service.stream_chat_response(user_message, language))
+
+    def stream_chat_response_extended(self, user_message, language="en"):
+        return self._iterate(self.service.stream_chat_response_extended(user_message, language))
+
+    def stream_chat_conversation(self, user_message, chat_history=None, language="en"):
+        return self._iterate(self.service.stream_chat_conversation(user_message, chat_history, language))
+
+    def _iterate(self, async_gen):
+        """
+        이벤트 루프의 비동기 제너레이터를 동기 제너레이터로 변환합니다.
+        소비자가 중간에 멈추면(클라이언트 연결 종료 등) 스트림도 취소합니다.
+        """
+        items = queue.Queue()
+
+        async def pump():
+            try:
+                async for item in async_gen:
+                    items.put(('data', item))
+            except Exception as e:
+                items.put(('error', e))
+            finally:
+                items.put(('done', None))
+
+        future = self.submit(pump())
+        try:
+            while True:
+                kind, value = items.get(timeout=self.timeout)
+                if kind == 'done':
+                    break
+                if kind == 'error':
+                    raise value
+                yield value
+        finally:
+            future.cancel()
+
+    def format_learning_response(self, response_text, language="en"):
+        return self.service.format_learning_response(response_text, language)
+
+    def format_extended_response(self, response_text, language="en"):
+        return self.service.format_extended_response(response_text, language)
+
+    def close(self):
+        """
+        HTTP 연결 풀을 닫고 이벤트 루프 스레드를 종료합니다.
+        """
+        if not self._loop.is_running():
+            return
+        try:
+            self.submit(self.service.aclose()).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"비동기 GPT 클라이언트 종료 중 오류: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
@@ -0,0 +1,293 @@
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import numpy as np
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def _decode_with_pyav(data, sample_rate):
+    """
+    PyAV(libav)로 프로세스 내부에서 디코딩합니다. ffmpeg 프로세스를 새로 띄우지 않습니다.
+    """
+    import av
+
+    chunks = []
+    resampler = av.AudioResampler(format='s16', layout='mono', rate=sample_rate)
+    with av.open(io.BytesIO(data)) as container:
+        for frame in container.decode(audio=0):
+            frame.pts = None
+            resampled = resampler.resample(frame)
+            for out in (resampled if isinstance(resampled, list) else [resampled]):
+                if out is not None:
+                    chunks.append(out.to_ndarray().reshape(-1))
+        # 리샘플러 버퍼 비우기
+        flushed = resampler.resample(None)
+        for out in (flushed if isinstance(flushed, list) else [flushed]):
+            if out is not None:
+                chunks.append(out.to_ndarray().reshape(-1))
+
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32) / 32768.0
+
+
+def _decoder_worker_main(conn, sample_rate):
+    """
+    디코더 워커 프로세스의 메인 루프.
+    파이프로 ('decode', bytes) 요청을 받아 float32 PCM 바이트를 돌려줍니다.
+    """
+    try:
+        import av  # noqa: F401
+        use_pyav = True
+    except ImportError:
+        use_pyav = False
+
+    from app.services.audio_service import decode_audio_bytes
+
+    while True:
+        try:
+            kind, payload = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        if kind == 'ping':
+            conn.send(('pong', os.getpid()))
+            continue
+        if kind == 'stop':
+            break
+
+        try:
+            audio = None
+            if use_pyav:
+                try:
+                    audio = _decode_with_pyav(payload, sample_rate)
+                except Exception:
+                    # PyAV가 처리하지 못하는 입력은 기본 디코더로 재시도
+                    audio = None
+            if audio is None:
+                audio = decode_audio_bytes(payload, sample_rate)
+            conn.send(('ok', np.ascontiguousarray(audio, dtype=np.float32).tobytes()))
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+    conn.close()
+
+
+class _DecoderWorker:
+    __slots__ = ('process', 'conn')
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def close(self, timeout=1.0):
+        try:
+            self.conn.send(('stop', None))
+        except (OSError, EOFError, BrokenPipeError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+class AudioDecoderPool:
+    """
+    상주 오디오 디코더 워커 풀.
+
+    워커 프로세스는 한 번만 생성되고 파이프로 인코딩된 오디오를 받아 PCM을 반환합니다.
+    요청마다 ffmpeg 프로세스를 생성하는 비용을 없애고, 대기 큐 크기를 제한해
+    동시 업로드가 몰려도 CPU 사용량이 워커 수 이상으로 치솟지 않게 합니다.
+    """
+
+    def __init__(self, num_workers=2, max_queue=32, timeout=30.0, sample_rate=16000, health_interval=30.0):
+        """
+        Args:
+            num_workers (int): 워커 프로세스 수
+            max_queue (int): 워커를 기다릴 수 있는 최대 요청 수 (초과 시 즉시 실패)
+            timeout (float): 요청 하나의 최대 디코딩 시간(초)
+            sample_rate (int): 출력 샘플링 레이트
+            health_interval (float): 헬스 체크 주기(초). 0이면 주기적 체크 비활성화
+        """
+        self.num_workers = max(1, int(num_workers))
+        self.max_queue = max(0, int(max_queue))
+        self.timeout = float(timeout)
+        self.sample_rate = int(sample_rate)
+        self.health_interval = float(health_interval)
+
+        # spawn 컨텍스트 사용 (torch 등이 로드된 부모 프로세스를 fork하지 않음)
+        self._ctx = multiprocessing.get_context('spawn')
+        self._idle = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.num_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopped = threading.Event()
+        self._health_thread = None
+        self._restarts = 0
+        self._decoded = 0
+        self._failures = 0
+
+    def start(self):
+        """
+        워커 프로세스와 헬스 체크 스레드를 시작합니다.
+        """
+        with self._lock:
+            if self._started:
+                return
+            for _ in range(self.num_workers):
+                self._idle.put(self._spawn_worker())
+            self._started = True
+            self._stopped.clear()
+
+            if self.health_interval > 0:
+                self._health_thread = threading.Thread(target=self._health_loop, name='audio-decoder-health', daemon=True)
+                self._health_thread.start()
+
+        logger.info(f"오디오 디코더 풀 시작: workers={self.num_workers}, max_queue={self.max_queue}")
+
+    def decode(self, data):
+        """
+        인코딩된 오디오 바이트를 워커 프로세스에서 디코딩합니다.
+
+        Args:
+            data (bytes): 인코딩된 오디오 데이터
+
+        Returns:
+            numpy.ndarray: mono float32 오디오
+        """
+        self.start()
+
+        if not self._slots.acquire(blocking=False):
+            raise RuntimeError("오디오 디코더 대기열이 가득 찼습니다.")
+
+        try:
+            try:
+                worker = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise RuntimeError("사용 가능한 오디오 디코더 워커가 없습니다.")
+
+            try:
+                worker.conn.send(('decode', data))
+                if not worker.conn.poll(self.timeout):
+                    raise TimeoutError(f"오디오 디코딩 시간 초과 ({self.timeout}s)")
+                kind, payload = worker.conn.recv()
+            except (EOFError, OSError, TimeoutError) as e:
+                # 응답이 없거나 죽은 워커는 교체
+                self._failures += 1
+                self._replace_worker(worker)
+                raise RuntimeError(f"오디오 디코더 워커 오류: {str(e)}") from e
+
+            self._idle.put(worker)
+
+            if kind == 'error':
+                self._failures += 1
+                raise RuntimeError(f"오디오 디코딩 실패: {payload}")
+
+            self._decoded += 1
+            return np.frombuffer(payload, dtype=np.float32).copy()
+        finally:
+            self._slots.release()
+
+    def health_check(self, timeout=2.0):
+        """
+        유휴 워커에 ping을 보내고 응답이 없는 워커를 교체합니다.
+
+        Returns:
+            dict: 워커 상태 요약
+        """
+        checked = []
+        while True:
+            try:
+                checked.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        alive = 0
+        for worker in checked:
+            healthy = False
+            try:
+                if worker.is_alive():
+                    worker.conn.send(('ping', None))
+                    if worker.conn.poll(timeout):
+                        kind, _ = worker.conn.recv()
+                        healthy = kind == 'pong'
+            except (EOFError, OSError):
+                healthy = False
+
+            if healthy:
+                alive += 1
+                self._idle.put(worker)
+            else:
+                logger.warning(f"오디오 디코더 워커 응답 없음, 재시작: pid={worker.process.pid}")
+                self._replace_worker(worker)
+
+        return self.stats(checked_workers=len(checked), healthy_workers=alive)
+
+    def stats(self, **extra):
+        """
+        풀 상태 및 카운터를 반환합니다.
+        """
+        result = {
+            'workers': self.num_workers,
+            'idle_workers': self._idle.qsize(),
+            'decoded': self._decoded,
+            'failures': self._failures,
+            'restarts': self._restarts
+        }
+        result.update(extra)
+        return result
+
+    def shutdown(self):
+        """
+        모든 워커 프로세스를 종료합니다.
+        """
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+            self._stopped.set()
+
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        logger.info("오디오 디코더 풀 종료")
+
+    def _spawn_worker(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_decoder_worker_main,
+            args=(child_conn, self.sample_rate),
+            name='audio-decoder',
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _DecoderWorker(process, parent_conn)
+
+    def _replace_worker(self, worker):
+        try:
+            worker.close(timeout=0.5)
+        except Exception:
+            pass
+        if self._stopped.is_set():
+            return
+        self._restarts += 1
+        self._idle.put(self._spawn_worker())
+
+    def _health_loop(self):
+        while not self._stopped.wait(self.health_interval):
+            try:
+                self.health_check()
+            except Exception as e:
+                logger.error(f"오디오 디코더 헬스 체크 중 오류 발생: {str(e)}")
@@ -0,0 +1,159 @@
+import io
+import logging
+import subprocess
+import threading
+import numpy as np
+from config.settings import get_setting
+from app.services.audio_decoder_pool import AudioDecoderPool
+from app.services.metrics import track_stage
+from app.services import tracing
+
+# soundfile은 WAV/FLAC/OGG를 프로세스 안에서 바로 디코딩할 수 있을 때만 사용
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# Whisper 입력 형식: 16kHz mono float32
+SAMPLE_RATE = 16000
+
+# 상주 디코더 워커 풀
+_decoder_pool = None
+_decoder_pool_lock = threading.Lock()
+
+def get_audio_decoder_pool():
+    """
+    상주 오디오 디코더 워커 풀을 반환합니다.
+    풀은 한 번만 생성되고 캐싱됩니다.
+    """
+    global _decoder_pool
+    if _decoder_pool is None:
+        with _decoder_pool_lock:
+            if _decoder_pool is None:
+                _decoder_pool = AudioDecoderPool(
+                    num_workers=get_setting('AUDIO_DECODER_WORKERS', 2),
+                    max_queue=get_setting('AUDIO_DECODER_MAX_QUEUE', 32),
+                    timeout=get_setting('AUDIO_DECODER_TIMEOUT', 30.0),
+                    sample_rate=SAMPLE_RATE,
+                    health_interval=get_setting('AUDIO_DECODER_HEALTH_INTERVAL', 30.0)
+                )
+    return _decoder_pool
+
+def decode_audio(source, sample_rate=SAMPLE_RATE):
+    """
+    인코딩된 오디오 데이터를 디스크를 거치지 않고 mono float32 배열로 디코딩합니다.
+
+    Args:
+        source (bytes | file-like): 오디오 바이트 또는 읽기 가능한 스트림 (SpooledTemporaryFile 등)
+        sample_rate (int): 출력 샘플링 레이트
+
+    Returns:
+        numpy.ndarray: [-1, 1] 범위의 mono float32 오디오
+    """
+    data = _read_bytes(source)
+    if not data:
+        raise ValueError("오디오 데이터가 비어 있습니다.")
+
+    with track_stage('decode'), tracing.span('audio.decode', {'audio.bytes': len(data)}) as decode_span:
+        # 디코더 풀이 켜져 있으면 상주 워커 프로세스에서 디코딩
+        if sample_rate == SAMPLE_RATE and get_setting('AUDIO_DECODER_POOL_ENABLED', False):
+            decode_span.set_attribute('audio.decoder_pool', True)
+            audio = get_audio_decoder_pool().decode(data)
+        else:
+            audio = decode_audio_bytes(data, sample_rate)
+        decode_span.set_attribute('audio.seconds', round(len(audio) / sample_rate, 2))
+        return audio
+
+def decode_audio_bytes(data, sample_rate=SAMPLE_RATE):
+    """
+    현재 프로세스에서 오디오 바이트를 디코딩합니다. (디코더 워커 내부에서도 사용)
+
+    Args:
+        data (bytes): 인코딩된 오디오 데이터
+        sample_rate (int): 출력 샘플링 레이트
+
+    Returns:
+        numpy.ndarray: mono float32 오디오
+    """
+    # 1. 무손실/단순 포맷은 soundfile로 프로세스 내 디코딩
+    audio = _decode_with_soundfile(data, sample_rate)
+    if audio is not None:
+        return audio
+
+    # 2. 그 외(webm/opus, mp3 등)는 ffmpeg 파이프로 디코딩
+    return _decode_with_ffmpeg(data, sample_rate)
+
+def load_upload_audio(file_storage, sample_rate=SAMPLE_RATE):
+    """
+    Flask 업로드 파일(FileStorage)을 임시 파일 없이 디코딩합니다.
+
+    Args:
+        file_storage (werkzeug.datastructures.FileStorage): request.files의 업로드 파일
+        sample_rate (int): 출력 샘플링 레이트
+
+    Returns:
+        numpy.ndarray: mono float32 오디오
+    """
+    return decode_audio(file_storage.stream, sample_rate=sample_rate)
+
+def load_audio_file(path, sample_rate=SAMPLE_RATE):
+    """
+    오디오 파일을 읽어 디코딩합니다. whisper.load_audio 대신 사용하며 디코더 풀을 거칩니다.
+
+    Args:
+        path (str): 오디오 파일 경로
+        sample_rate (int): 출력 샘플링 레이트
+
+    Returns:
+        numpy.ndarray: mono float32 오디오
+    """
+    with open(path, 'rb') as f:
+        return decode_audio(f.read(), sample_rate=sample_rate)
+
+def _read_bytes(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, 'seek'):
+        try:
+            source.seek(0)
+        except (OSError, ValueError):
+            pass
+    return source.read()
+
+def _decode_with_soundfile(data, sample_rate):
+    if soundfile is None:
+        return None
+    try:
+        audio, sr = soundfile.read(io.BytesIO(data), dtype='float32', always_2d=True)
+    except Exception:
+        # soundfile이 지원하지 않는 포맷(webm 등)은 ffmpeg로 넘김
+        return None
+
+    # 리샘플링은 ffmpeg에 맡김
+    if sr != sample_rate:
+        return None
+
+    return np.ascontiguousarray(audio.mean(axis=1), dtype=np.float32)
+
+def _decode_with_ffmpeg(data, sample_rate):
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "pipe:1"
+    ]
+    try:
+        out = subprocess.run(cmd, input=data, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        logger.error(f"ffmpeg 디코딩 실패: {e.stderr.decode(errors='ignore')[-500:]}")
+        raise RuntimeError(f"오디오 디코딩 실패: {e.stderr.decode(errors='ignore')[-200:]}") from e
+
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
@@ -0,0 +1,210 @@
+import logging
+import time
+from app.services.stt_service import transcribe_audio
+from app.services.audio_service import load_upload_audio
+from app.services.tts_service import text_to_speech
+from app.services.gpt_client_registry import get_gpt_service
+from app.services.language_detection import detect_language
+from app.services.metrics import CHAT_STAGE_SECONDS
+from app.services import tracing
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class ChatTurn:
+    """
+    채팅 파이프라인 한 번 실행의 상태. 각 단계는 이 객체의 필드를 읽고 채웁니다.
+    """
+
+    def __init__(self, mode, language, text=None, upload=None, history=None):
+        self.mode = mode
+        self.language = language  # None이면 음성에서 감지 (/auto 엔드포인트)
+        self.detected_language = None
+        self.text = text          # 텍스트 입력 (음성 입력이면 인식 결과로 채워짐)
+        self.upload = upload      # 업로드 오디오 파일 (FileStorage)
+        self.history = history or []
+        self.audio = None
+        self.gpt = None
+        self.response = None      # GPT 응답 {'answer', 'model', 'usage'}
+        self.deltas = None        # 스트리밍 모드의 텍스트 조각 이터레이터
+        self.formatted = None     # 섹션별로 나눈 응답
+        self.audio_file = None
+        self.timings = {}         # 단계별 소요 시간(ms)
+
+    def to_dict(self):
+        """
+        JSON 응답 본문을 만듭니다. (기존 엔드포인트와 같은 필드 구성)
+        """
+        result = {}
+        if self.mode.input == 'audio':
+            result['input_text'] = self.text
+        if self.detected_language is not None:
+            result['language'] = self.detected_language
+        result['conversation'] = self.formatted["conversation"]
+        result['vocabulary'] = self.formatted["vocabulary"]
+        if self.mode.extended:
+            result['example_responses'] = self.formatted["example_responses"]
+        result['full_response'] = self.response["answer"]
+        result['model'] = self.response["model"]
+        result['usage'] = self.response["usage"]
+        if self.audio_file is not None:
+            result['audio_file'] = self.audio_file  # 클라이언트에서 이 파일을 요청할 수 있도록
+        return result
+
+
+# 파이프라인 단계: 각 단계는 ChatTurn을 받아 필드를 채움
+
+def ingest(turn):
+    """
+    업로드 스트림을 메모리에서 바로 디코딩합니다. (임시 파일 미사용)
+    """
+    turn.audio = load_upload_audio(turn.upload)
+
+
+def detect(turn):
+    """
+    언어가 지정되지 않았으면 전체 인식 전에 언어만 감지하여 인식/프롬프트 언어로 사용합니다.
+    """
+    if turn.language is not None:
+        return
+    result = detect_language(turn.audio, candidates=SUPPORTED_LANGUAGES)
+    turn.language = turn.detected_language = result["language"] if result["languages"] else SUPPORTED_LANGUAGES[0]
+
+
+def transcribe(turn):
+    """
+    음성을 인식하여 입력 텍스트로 사용합니다.
+    """
+    result = transcribe_audio(turn.audio, language=turn.language)
+    turn.text = result["text"]
+
+
+def prompt(turn):
+    """
+    모드에 맞는 GPT 요청을 보냅니다. 스트리밍 모드는 텍스트 조각 이터레이터만 만듭니다.
+    """
+    turn.gpt = get_gpt_service()
+    if turn.mode.prompt == 'conversation':
+        args = (turn.text, turn.history)
+    else:
+        args = (turn.text,)
+
+    if turn.mode.stream:
+        turn.deltas = getattr(turn.gpt, STREAM_PROMPTS[turn.mode.prompt])(*args, language=turn.language)
+    else:
+        turn.response = getattr(turn.gpt, PROMPTS[turn.mode.prompt])(*args, language=turn.language)
+
+
+def parse(turn):
+    """
+    응답을 대화 / 어휘 학습 (/ 예시 응답) 섹션으로 나눕니다.
+    """
+    if turn.mode.extended:
+        turn.formatted = turn.gpt.format_extended_response(turn.response["answer"], language=turn.language)
+    else:
+        turn.formatted = turn.gpt.format_learning_response(turn.response["answer"], language=turn.language)
+
+
+def synthesize(turn):
+    """
+    대화 부분만 음성으로 변환합니다.
+    """
+    turn.audio_file = text_to_speech(turn.formatted["conversation"], language=turn.language)
+
+
+# 프롬프트 종류 → GPTService 메서드
+PROMPTS = {
+    'chat': 'get_chat_response',
+    'extended': 'get_chat_response_extended',
+    'conversation': 'get_chat_conversation'
+}
+
+STREAM_PROMPTS = {
+    'chat': 'stream_chat_response',
+    'extended': 'stream_chat_response_extended',
+    'conversation': 'stream_chat_conversation'
+}
+
+
+class ChatMode:
+    """
+    채팅 엔드포인트 한 종류의 정의 (입력 형식, 프롬프트 종류, 실행할 단계, 오류 메시지).
+    """
+
+    def __init__(self, name, input_type, prompt_type, extended, tts=False, stream=False,
+                 log_label="Chat Error", error_message="대화 처리 실패"):
+        self.name = name
+        self.input = input_type      # 'text' 또는 'audio'
+        self.prompt = prompt_type    # PROMPTS 키
+        self.extended = extended     # 예시 응답 섹션 포함 여부
+        self.stream = stream         # SSE 스트리밍 응답 여부 (parse는 스트림 종료 후 실행)
+        self.log_label = log_label
+        self.error_message = error_message
+
+        stages = []
+        if input_type == 'audio':
+            stages += [ingest, detect, transcribe]
+        stages.append(prompt)
+        if not stream:
+            stages.append(parse)
+            if tts:
+                stages.append(synthesize)
+        self.stages = tuple(stages)
+
+
+# URL 경로 이름 → 모드 정의 (/talk/<mode>/<english|japanese>)
+CHAT_MODES = {mode.name: mode for mode in (
+    ChatMode('chat', 'text', 'chat', extended=False),
+    ChatMode('chat-extended', 'text', 'extended', extended=True,
+             log_label="확장 Chat Error", error_message="확장 대화 처리 실패"),
+    ChatMode('stt-chat', 'audio', 'chat', extended=False,
+             log_label="STT-Chat Error", error_message="음성 대화 처리 실패"),
+    ChatMode('stt-chat-extended', 'audio', 'extended', extended=True,
+             log_label="확장 STT-Chat Error", error_message="확장 음성 대화 처리 실패"),
+    ChatMode('chat-tts', 'text', 'chat', extended=False, tts=True,
+             log_label="Chat-TTS Error", error_message="대화-음성 변환 실패"),
+    ChatMode('chat-conversation', 'text', 'conversation', extended=True,
+             log_label="대화 기록 Chat Error", error_message="대화 기록 처리 실패"),
+    ChatMode('stt-chat-conversation', 'audio', 'conversation', extended=True,
+             log_label="대화 기록 STT-Chat Error", error_message="대화 기록 음성 처리 실패"),
+    ChatMode('chat-stream', 'text', 'chat', extended=False, stream=True,
+             log_label="Chat Stream Error"),
+    ChatMode('chat-extended-stream', 'text', 'extended', extended=True, stream=True,
+             log_label="Chat Stream Error"),
+    ChatMode('chat-conversation-stream', 'text', 'conversation', extended=True, stream=True,
+             log_label="Chat Stream Error")
+)}
+
+# URL 경로의 언어 이름 → 언어 코드 (auto는 음성 입력 모드에서만 사용, 음성에서 감지)
+CHAT_LANGUAGES = {
+    'english': 'en',
+    'japanese': 'ja',
+    'auto': None
+}
+
+# 프롬프트가 준비된 언어 (자동 감지 결과는 이 중 하나로 제한)
+SUPPORTED_LANGUAGES = ['en', 'ja']
+
+
+def run_chat_pipeline(turn):
+    """
+    모드에 정의된 단계를 순서대로 실행합니다. 단계별 소요 시간은 turn.timings에 기록됩니다.
+
+    Args:
+        turn (ChatTurn): 입력이 채워진 실행 상태
+
+    Returns:
+        ChatTurn: 결과가 채워진 실행 상태
+    """
+    tracing.current_span().set_attributes({'chat.mode': turn.mode.name, 'chat.language': turn.language})
+    for stage in turn.mode.stages:
+        started = time.perf_counter()
+        with tracing.span(f"chat.{stage.__name__}"):
+            stage(turn)
+        elapsed = time.perf_counter() - started
+        turn.timings[stage.__name__] = round(elapsed * 1000, 1)
+        CHAT_STAGE_SECONDS.observe(elapsed, mode=turn.mode.name, stage=stage.__name__)
+
+    logger.debug(f"채팅 파이프라인 완료: mode={turn.mode.name}, language={turn.language}, timings={turn.timings}")
+    return turn
@@ -0,0 +1,95 @@
+import atexit
+import logging
+import os
+import threading
+from config.settings import get_setting
+from app.services.gpt_service import GPTService
+from app.services.async_gpt_service import AsyncGPTBridge
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 프로세스 전역 GPT 클라이언트
+_gpt_service = None
+_gpt_service_pid = None
+_lock = threading.Lock()
+_hooks_installed = False
+
+
+def get_gpt_service():
+    """
+    프로세스 전역 GPT 서비스를 반환합니다. 번역, 채팅 등 모든 GPT 호출이 같은 연결 풀을 공유합니다.
+    GPT_ASYNC_ENABLED가 켜져 있으면 비동기 클라이언트 브리지를 반환합니다.
+    """
+    global _gpt_service, _gpt_service_pid
+
+    # fork 후 부모 프로세스의 클라이언트(소켓, 이벤트 루프 스레드)는 사용할 수 없음
+    if _gpt_service is not None and _gpt_service_pid != os.getpid():
+        _reset_after_fork()
+
+    if _gpt_service is None:
+        with _lock:
+            if _gpt_service is None:
+                logger.info("GPT 서비스 초기화 중...")
+                if get_setting('GPT_ASYNC_ENABLED', False):
+                    _gpt_service = AsyncGPTBridge(timeout=get_setting('GPT_REQUEST_TIMEOUT', 120.0))
+                else:
+                    _gpt_service = GPTService()
+                _gpt_service_pid = os.getpid()
+                logger.info("GPT 서비스 초기화 완료.")
+    return _gpt_service
+
+
+def close_gpt_service():
+    """
+    GPT 클라이언트의 연결 풀을 닫고 레지스트리를 비웁니다.
+    """
+    global _gpt_service, _gpt_service_pid
+    with _lock:
+        service, _gpt_service = _gpt_service, None
+        pid, _gpt_service_pid = _gpt_service_pid, None
+
+    # 다른 프로세스에서 만든 클라이언트는 닫지 않음 (부모의 TLS 연결을 건드리지 않도록)
+    if service is None or pid != os.getpid():
+        return
+    try:
+        service.close()
+        logger.info("GPT 서비스 종료 완료.")
+    except Exception as e:
+        logger.warning(f"GPT 서비스 종료 중 오류: {str(e)}")
+
+
+def _reset_after_fork():
+    """
+    fork된 자식 프로세스에서 부모의 클라이언트 참조를 버립니다. 다음 호출 시 새로 생성됩니다.
+    """
+    global _gpt_service, _gpt_service_pid, _lock
+    _gpt_service = None
+    _gpt_service_pid = None
+    _lock = threading.Lock()
+
+
+def init_app(app):
+    """
+    GPT 클라이언트 수명 주기 훅을 앱에 연결합니다.
+    - 시작: GPT_CLIENT_EAGER_INIT이면 클라이언트를 미리 생성
+    - 종료: 프로세스 종료 시 연결 풀 정리
+    - fork: 자식 프로세스에서 클라이언트 재생성
+    """
+    global _hooks_installed
+
+    if not _hooks_installed:
+        atexit.register(close_gpt_service)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_reset_after_fork)
+        _hooks_installed = True
+
+    app.extensions['gpt_client_registry'] = get_gpt_service
+
+    if app.config.get('GPT_CLIENT_EAGER_INIT'):
+        with app.app_context():
+            try:
+                get_gpt_service()
+            except Exception as e:
+                # API 키 누락 등은 첫 요청에서 다시 시도하고 그때 오류를 반환
+                logger.error(f"GPT 서비스 사전 초기화 실패: {str(e)}")
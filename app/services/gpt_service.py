@@ -1,8 +1,13 @@
 import os
+import json
+import hashlib
 import logging
 import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
+from config.settings import get_setting
+from app.services.metrics import GPT_TOKENS, record_gpt_usage, track_stage
+from app.services import tracing
 
 # 환경 변수에서 프록시 제거
 os.environ.pop('HTTP_PROXY', None)
@@ -15,6 +20,314 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# 언어 코드 → 언어 이름
+LANGUAGE_NAMES = {
+    "ko": "Korean",
+    "en": "English",
+    "ja": "Japanese"
+}
+
+def build_chat_messages(user_message, language="en"):
+    """
+    기본 채팅(단어 학습 포함)용 메시지 배열을 구성합니다.
+    
+    Args:
+        user_message (str): 사용자 메시지
+        language (str): 언어 코드 (en: 영어, ja: 일본어)
+        
+    Returns:
+        list: chat.completions 메시지 배열
+    """
+    # 시스템 메시지 설정 (언어에 따라 다르게)
+    if language == "en":
+        system_message = (
+            "You are a helpful English conversation partner. "
+            "After responding to the user's message, identify 3 key words or phrases from your response. "
+            "For each word, provide the Korean meaning and 2 example sentences using that word. "
+            "Format your response as: "
+            "[Your normal response] "
+            "VOCABULARY_SECTION: "
+            "1. [word]: [Korean meaning] "
+            "- Example 1: [example] "
+            "- Example 2: [example] "
+            "2. [word]: [Korean meaning] - [examples...] "
+            "3. [word]: [Korean meaning] - [examples...]"
+        )
+    elif language == "ja":
+        system_message = (
+            "あなたは役立つ日本語の会話パートナーです。"
+            "ユーザーのメッセージに応答した後、あなたの応答から3つのキーワードまたはフレーズを特定します。"
+            "各単語について、韓国語の意味とその単語を使用した2つの例文を提供してください。"
+            "次の形式で応答してください: "
+            "[通常の応答] "
+            "語彙セクション: "
+            "1. [単語]: [韓国語の意味] - 例文1: [例文] - 例文2: [例文] "
+            "2. [単語]: [韓国語の意味] - [例文...] "
+            "3. [単語]: [韓国語の意味] - [例文...]"
+        )
+    else:
+        system_message = (
+            "You are a helpful conversation partner. "
+            "Please respond naturally to the user's message."
+        )
+    
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": user_message}
+    ]
+
+def build_extended_chat_messages(user_message, language="en"):
+    """
+    확장 채팅(단어 학습 + 예시 응답)용 메시지 배열을 구성합니다.
+    
+    Args:
+        user_message (str): 사용자 메시지
+        language (str): 언어 코드 (en: 영어, ja: 일본어)
+        
+    Returns:
+        list: chat.completions 메시지 배열
+    """
+    # 시스템 메시지 설정 (언어에 따라 다르게)
+    if language == "en":
+        system_message = (
+            "You are a helpful English conversation partner. "
+            "After responding to the user's message, do the following:\n"
+            "1. Identify 3 key words or phrases from your response and provide the Korean meaning and 2 example sentences for each.\n"
+            "2. Provide 3 alternative example responses that would also be appropriate in this conversation.\n"
+            "Format your response as: \n"
+            "[Your normal response] \n"
+            "VOCABULARY_SECTION: \n"
+            "1. [word]: [Korean meaning] \n"
+            "- Example 1: [example] \n"
+            "- Example 2: [example] \n"
+            "2. [word]: [Korean meaning] - [examples...] \n"
+            "3. [word]: [Korean meaning] - [examples...]\n"
+            "EXAMPLE_RESPONSES: \n"
+            "1. [alternative response 1] \n"
+            "2. [alternative response 2] \n"
+            "3. [alternative response 3]"
+        )
+    elif language == "ja":
+        system_message = (
+            "あなたは役立つ日本語の会話パートナーです。"
+            "ユーザーのメッセージに応答した後、以下を行ってください：\n"
+            "1. あなたの応答から3つのキーワードを特定し、それぞれに韓国語の意味と2つの例文を提供する。\n"
+            "2. この会話で適切な代替応答例を3つ提供する。\n"
+            "次の形式で応答してください: \n"
+            "[通常の応答] \n"
+            "語彙セクション: \n"
+            "1. [単語]: [韓国語の意味] \n"
+            "- 例文1: [例文] \n"
+            "- 例文2: [例文] \n"
+            "2. [単語]: [韓国語の意味] - [例文...] \n"
+            "3. [単語]: [韓国語の意味] - [例文...]\n"
+            "応答例: \n"
+            "1. [代替応答1] \n"
+            "2. [代替応答2] \n"
+            "3. [代替応答3]"
+        )
+    else:
+        system_message = (
+            "You are a helpful conversation partner. "
+            "Please respond naturally to the user's message."
+        )
+    
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": user_message}
+    ]
+
+def build_conversation_messages(user_message, chat_history=None, language="en"):
+    """
+    이전 대화 기록을 포함한 메시지 배열을 구성합니다.
+    
+    Args:
+        user_message (str): 사용자 메시지
+        chat_history (list): 이전 대화 기록 (역할과 내용 포함)
+        language (str): 언어 코드
+        
+    Returns:
+        list: chat.completions 메시지 배열
+    """
+    # 시스템 메시지 설정 (언어에 따라 다르게)
+    if language == "en":
+        system_message = (
+            "You are a helpful English conversation partner. "
+            "After responding to the user's message, do the following:\n"
+            "1. Identify 3 key words or phrases from YOUR response and provide the Korean meaning and 2 example sentences for each.\n"
+            "2. Provide 3 example responses that the USER could give to continue the conversation with you.\n"
+            "Format your response as: \n"
+            "[Your normal response] \n"
+            "VOCABULARY_SECTION: \n"
+            "1. [word from your response]: [Korean meaning] \n"
+            "- Example 1: [example] \n"
+            "- Example 2: [example] \n"
+            "2. [word from your response]: [Korean meaning] - [examples...] \n"
+            "3. [word from your response]: [Korean meaning] - [examples...]\n"
+            "EXAMPLE_RESPONSES: \n"
+            "1. [example of how the user might respond to you] \n"
+            "2. [another example of user's possible response] \n"
+            "3. [another example of user's possible response]"
+        )
+    elif language == "ja":
+        system_message = (
+            "あなたは役立つ日本語の会話パートナーです。"
+            "ユーザーのメッセージに応答した後、以下を行ってください：\n"
+            "1. あなたの応答から3つのキーワードを特定し、それぞれに韓国語の意味と2つの例文を提供する。\n"
+            "2. ユーザーがあなたの応答に対して返すことが考えられる3つの応答例を提供する。\n"
+            "次の形式で応答してください: \n"
+            "[通常の応答] \n"
+            "語彙セクション: \n"
+            "1. [あなたの応答からの単語]: [韓国語の意味] \n"
+            "- 例文1: [例文] \n"
+            "- 例文2: [例文] \n"
+            "2. [あなたの応答からの単語]: [韓国語の意味] - [例文...] \n"
+            "3. [あなたの応答からの単語]: [韓国語の意味] - [例文...]\n"
+            "応答例: \n"
+            "1. [ユーザーがあなたに返答する例] \n"
+            "2. [ユーザーの別の返答例] \n"
+            "3. [ユーザーの別の返答例]"
+        )
+    else:
+        system_message = (
+            "You are a helpful conversation partner. "
+            "Please respond naturally to the user's message."
+        )
+    
+    # 메시지 배열 구성
+    messages = [
+        {"role": "system", "content": system_message}
+    ]
+    
+    # 대화 기록이 있는 경우 추가
+    if chat_history and isinstance(chat_history, list):
+        # 토큰 제한을 위해 최대 10개 이전 메시지만 포함
+        recent_history = chat_history[-10:] if len(chat_history) > 10 else chat_history
+        messages.extend(recent_history)
+    
+    # 사용자의 현재 메시지 추가
+    messages.append({"role": "user", "content": user_message})
+    
+    return messages
+
+def build_translation_messages(text, source_language, target_language):
+    """
+    번역용 메시지 배열을 구성합니다.
+    
+    Args:
+        text (str): 번역할 텍스트
+        source_language (str): 소스 언어 코드 (ko, en, ja)
+        target_language (str): 대상 언어 코드 (ko, en, ja)
+        
+    Returns:
+        list: chat.completions 메시지 배열
+    """
+    # 언어 코드를 언어 이름으로 변환
+    source_language_name = LANGUAGE_NAMES.get(source_language, "Unknown")
+    target_language_name = LANGUAGE_NAMES.get(target_language, "Unknown")
+
+    # 시스템 메시지 설정 (번역 작업에 최적화)
+    system_message = (
+        f"You are a professional translator specialized in {source_language_name} to {target_language_name} translation. "
+        "Translate the text provided by the user accurately and naturally, preserving the original meaning, tone, and style. "
+        "Respond with only the translated text, without any additional explanations, notes, or quotation marks."
+    )
+
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": text}
+    ]
+
+def get_translation_prompt_version():
+    """
+    번역 프롬프트 템플릿의 버전(해시)을 반환합니다. 템플릿이 바뀌면 값도 바뀝니다.
+    """
+    template = build_translation_messages("{text}", "{source_language}", "{target_language}")
+    digest = hashlib.sha256(json.dumps(template, ensure_ascii=False).encode('utf-8')).hexdigest()
+    return digest[:16]
+
+# 응답 섹션 구분자 (format_learning_response / format_extended_response와 동일)
+SECTION_MARKERS = {
+    "en": {"vocabulary": "VOCABULARY_SECTION:", "example_responses": "EXAMPLE_RESPONSES:"},
+    "ja": {"vocabulary": "語彙セクション:", "example_responses": "応答例:"}
+}
+
+class StreamingResponseParser:
+    """
+    스트리밍으로 도착하는 GPT 응답을 증분 파싱하여 섹션(conversation, vocabulary, example_responses)별로 나눕니다.
+    구분자가 토큰 경계에서 잘려 도착할 수 있으므로 구분자 길이만큼의 꼬리는 다음 토큰이 올 때까지 보류합니다.
+    """
+
+    def __init__(self, language="en", extended=True):
+        """
+        Args:
+            language (str): 언어 코드
+            extended (bool): True면 예시 응답 섹션까지 분리 (format_extended_response와 동일),
+                False면 어휘 섹션까지만 분리 (format_learning_response와 동일)
+        """
+        markers = SECTION_MARKERS.get(language, {})
+        self._transitions = []
+        if "vocabulary" in markers:
+            self._transitions.append(("vocabulary", markers["vocabulary"]))
+            if extended:
+                self._transitions.append(("example_responses", markers["example_responses"]))
+        self._holdback = max((len(marker) for _, marker in self._transitions), default=1) - 1
+        self.section = "conversation"
+        self._pending = ""
+        self._section_started = False
+        self.text = ""
+
+    def feed(self, delta):
+        """
+        새로 도착한 텍스트 조각을 처리합니다.
+
+        Returns:
+            list: (섹션 이름, 텍스트) 이벤트 목록
+        """
+        self.text += delta
+        self._pending += delta
+        events = []
+
+        while self._transitions:
+            next_section, marker = self._transitions[0]
+            index = self._pending.find(marker)
+            if index < 0:
+                break
+            self._emit(events, self._pending[:index])
+            self._pending = self._pending[index + len(marker):]
+            self._transitions.pop(0)
+            self.section = next_section
+            self._section_started = False
+
+        # 다음 구분자의 앞부분일 수 있는 꼬리는 보류
+        if self._transitions:
+            cut = max(0, len(self._pending) - self._holdback)
+        else:
+            cut = len(self._pending)
+        self._emit(events, self._pending[:cut])
+        self._pending = self._pending[cut:]
+        return events
+
+    def flush(self):
+        """
+        보류 중인 나머지 텍스트를 내보냅니다. 스트림이 끝난 뒤 호출합니다.
+        """
+        events = []
+        self._emit(events, self._pending)
+        self._pending = ""
+        return events
+
+    def _emit(self, events, text):
+        # 섹션 시작 부분의 공백은 제거 (format_* 함수의 strip과 동일한 결과)
+        if not self._section_started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._section_started = True
+        if text:
+            events.append((self.section, text))
+
+
 class GPTService:
     def __init__(self):
         # OpenAI API 키 설정
@@ -28,17 +341,28 @@ class GPTService:
         try:
             logger.debug("OpenAI 클라이언트 초기화 시도")
             
-            # httpx 클라이언트 명시적 설정 (프록시 없음)
-            http_client = httpx.Client(
+            # httpx 클라이언트 명시적 설정 (프록시 없음, keep-alive 연결 풀 재사용)
+            self.http_client = httpx.Client(
                 transport=httpx.HTTPTransport(
                     retries=2, 
+                    limits=httpx.Limits(
+                        max_connections=get_setting('GPT_HTTP_MAX_CONNECTIONS', 20),
+                        max_keepalive_connections=get_setting('GPT_HTTP_MAX_KEEPALIVE', 10),
+                        keepalive_expiry=get_setting('GPT_HTTP_KEEPALIVE_EXPIRY', 60.0)
+                    )
+                ),
+                timeout=httpx.Timeout(
+                    connect=get_setting('GPT_CONNECT_TIMEOUT', 5.0),
+                    read=get_setting('GPT_READ_TIMEOUT', 60.0),
+                    write=get_setting('GPT_WRITE_TIMEOUT', 10.0),
+                    pool=get_setting('GPT_POOL_TIMEOUT', 5.0)
                 )
             )
             
             # 클라이언트 초기화
             self.client = OpenAI(
                 api_key=self.api_key,
-                http_client=http_client
+                http_client=self.http_client
             )
             
             logger.debug("OpenAI 클라이언트 초기화 성공")
@@ -54,6 +378,12 @@ class GPTService:
 
         logger.info(f"GPTService 초기화 완료: 모델={self.model}")
 
+    def close(self):
+        """
+        HTTP 연결 풀을 닫습니다.
+        """
+        self.http_client.close()
+
     def get_chat_response(self, user_message, language="en"):
         """
         GPT 모델을 사용하여 채팅 응답을 가져옵니다.
@@ -68,53 +398,19 @@ class GPTService:
         try:
             logger.info(f"GPT API 호출 시작: 언어={language}, 메시지={user_message[:50] if len(user_message) > 50 else user_message}...")
 
-            # 시스템 메시지 설정 (언어에 따라 다르게)
-            if language == "en":
-                system_message = (
-                    "You are a helpful English conversation partner. "
-                    "After responding to the user's message, identify 3 key words or phrases from your response. "
-                    "For each word, provide the Korean meaning and 2 example sentences using that word. "
-                    "Format your response as: "
-                    "[Your normal response] "
-                    "VOCABULARY_SECTION: "
-                    "1. [word]: [Korean meaning] "
-                    "- Example 1: [example] "
-                    "- Example 2: [example] "
-                    "2. [word]: [Korean meaning] - [examples...] "
-                    "3. [word]: [Korean meaning] - [examples...]"
-                )
-            elif language == "ja":
-                system_message = (
-                    "あなたは役立つ日本語の会話パートナーです。"
-                    "ユーザーのメッセージに応答した後、あなたの応答から3つのキーワードまたはフレーズを特定します。"
-                    "各単語について、韓国語の意味とその単語を使用した2つの例文を提供してください。"
-                    "次の形式で応答してください: "
-                    "[通常の応答] "
-                    "語彙セクション: "
-                    "1. [単語]: [韓国語の意味] - 例文1: [例文] - 例文2: [例文] "
-                    "2. [単語]: [韓国語の意味] - [例文...] "
-                    "3. [単語]: [韓国語の意味] - [例文...]"
-                )
-            else:
-                system_message = (
-                    "You are a helpful conversation partner. "
-                    "Please respond naturally to the user's message."
-                )
-            
             # GPT API 호출 (최신 버전 문법)
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
+            with track_stage('gpt_request'), tracing.span('gpt.get_chat_response', {'gpt.model': self.model}) as gpt_span:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=build_chat_messages(user_message, language),
+                    temperature=0.7,
+                    max_tokens=1000
+                )
             
             # 응답 추출
             response_text = response.choices[0].message.content
             usage = response.usage.total_tokens if hasattr(response, 'usage') else None
+            record_gpt_usage(getattr(response, 'usage', None), gpt_span)
             
             logger.info(f"GPT API 응답 성공: 토큰 사용량={usage}")
 
@@ -134,6 +430,66 @@ class GPTService:
             logger.error(traceback.format_exc())
             raise e
     
+    def _stream_completion(self, messages, temperature, max_tokens, label):
+        """
+        stream=True로 GPT API를 호출하고 도착하는 텍스트 조각을 순서대로 반환합니다.
+        """
+        try:
+            # 스트리밍 응답은 마지막 조각이 도착할 때까지를 gpt_request 단계로 기록
+            with track_stage('gpt_request'), tracing.span('gpt.stream_completion', {
+                'gpt.model': self.model,
+                'gpt.max_tokens': max_tokens
+            }) as gpt_span:
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True
+                )
+                
+                chunks = 0
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        GPT_TOKENS.inc(kind='stream_chunks')
+                        if chunks == 0:
+                            gpt_span.set_attribute('gpt.first_chunk_ms', round(gpt_span.duration_ms, 1))
+                        chunks += 1
+                        gpt_span.set_attribute('gpt.stream_chunks', chunks)
+                        yield delta
+            
+            logger.info(f"{label} 스트리밍 응답 완료")
+            
+        except Exception as e:
+            logger.error(f"{label} 스트리밍 호출 중 오류 발생: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise e
+
+    def stream_chat_response(self, user_message, language="en"):
+        """
+        get_chat_response의 스트리밍 버전. 응답 텍스트 조각을 도착하는 대로 반환합니다.
+        """
+        logger.info(f"GPT 스트리밍 호출 시작: 언어={language}")
+        return self._stream_completion(build_chat_messages(user_message, language), 0.7, 1000, "GPT API")
+
+    def stream_chat_response_extended(self, user_message, language="en"):
+        """
+        get_chat_response_extended의 스트리밍 버전.
+        """
+        logger.info(f"확장 GPT 스트리밍 호출 시작: 언어={language}")
+        return self._stream_completion(build_extended_chat_messages(user_message, language), 0.7, 1500, "확장 GPT API")
+
+    def stream_chat_conversation(self, user_message, chat_history=None, language="en"):
+        """
+        get_chat_conversation의 스트리밍 버전.
+        """
+        logger.info(f"대화 기록 GPT 스트리밍 호출 시작: 언어={language}")
+        return self._stream_completion(build_conversation_messages(user_message, chat_history, language), 0.7, 1500, "대화 기록 GPT API")
+
     def format_learning_response(self, response_text, language="en"):
         """
         GPT 응답에서 일반 대화와 학습 콘텐츠(단어, 의미, 예문 등)를 분리합니다.
@@ -200,65 +556,19 @@ class GPTService:
         try:
             logger.info(f"확장 GPT API 호출 시작: 언어={language}, 메시지={user_message[:50] if len(user_message) > 50 else user_message}...")
 
-            # 시스템 메시지 설정 (언어에 따라 다르게)
-            if language == "en":
-                system_message = (
-                    "You are a helpful English conversation partner. "
-                    "After responding to the user's message, do the following:\n"
-                    "1. Identify 3 key words or phrases from your response and provide the Korean meaning and 2 example sentences for each.\n"
-                    "2. Provide 3 alternative example responses that would also be appropriate in this conversation.\n"
-                    "Format your response as: \n"
-                    "[Your normal response] \n"
-                    "VOCABULARY_SECTION: \n"
-                    "1. [word]: [Korean meaning] \n"
-                    "- Example 1: [example] \n"
-                    "- Example 2: [example] \n"
-                    "2. [word]: [Korean meaning] - [examples...] \n"
-                    "3. [word]: [Korean meaning] - [examples...]\n"
-                    "EXAMPLE_RESPONSES: \n"
-                    "1. [alternative response 1] \n"
-                    "2. [alternative response 2] \n"
-                    "3. [alternative response 3]"
-                )
-            elif language == "ja":
-                system_message = (
-                    "あなたは役立つ日本語の会話パートナーです。"
-                    "ユーザーのメッセージに応答した後、以下を行ってください：\n"
-                    "1. あなたの応答から3つのキーワードを特定し、それぞれに韓国語の意味と2つの例文を提供する。\n"
-                    "2. この会話で適切な代替応答例を3つ提供する。\n"
-                    "次の形式で応答してください: \n"
-                    "[通常の応答] \n"
-                    "語彙セクション: \n"
-                    "1. [単語]: [韓国語の意味] \n"
-                    "- 例文1: [例文] \n"
-                    "- 例文2: [例文] \n"
-                    "2. [単語]: [韓国語の意味] - [例文...] \n"
-                    "3. [単語]: [韓国語の意味] - [例文...]\n"
-                    "応答例: \n"
-                    "1. [代替応答1] \n"
-                    "2. [代替応答2] \n"
-                    "3. [代替応答3]"
-                )
-            else:
-                system_message = (
-                    "You are a helpful conversation partner. "
-                    "Please respond naturally to the user's message."
-                )
-            
             # GPT API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
+            with track_stage('gpt_request'), tracing.span('gpt.get_chat_response_extended', {'gpt.model': self.model}) as gpt_span:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=build_extended_chat_messages(user_message, language),
+                    temperature=0.7,
+                    max_tokens=1500
+                )
             
             # 응답 추출
             response_text = response.choices[0].message.content
             usage = response.usage.total_tokens if hasattr(response, 'usage') else None
+            record_gpt_usage(getattr(response, 'usage', None), gpt_span)
             
             logger.info(f"확장 GPT API 응답 성공: 토큰 사용량={usage}")
 
@@ -362,114 +672,19 @@ class GPTService:
         try:
             logger.info(f"대화 기록 GPT API 호출 시작: 언어={language}, 메시지={user_message[:50] if len(user_message) > 50 else user_message}...")
 
-            # 시스템 메시지 설정 (언어에 따라 다르게)
-            # if language == "en":
-            #     system_message = (
-            #         "You are a helpful English conversation partner. "
-            #         "After responding to the user's message, do the following:\n"
-            #         "1. Identify 3 key words or phrases from your response and provide the Korean meaning and 2 example sentences for each.\n"
-            #         "2. Provide 3 alternative example responses that would also be appropriate in this conversation.\n"
-            #         "Format your response as: \n"
-            #         "[Your normal response] \n"
-            #         "VOCABULARY_SECTION: \n"
-            #         "1. [word]: [Korean meaning] \n"
-            #         "- Example 1: [example] \n"
-            #         "- Example 2: [example] \n"
-            #         "2. [word]: [Korean meaning] - [examples...] \n"
-            #         "3. [word]: [Korean meaning] - [examples...]\n"
-            #         "EXAMPLE_RESPONSES: \n"
-            #         "1. [alternative response 1] \n"
-            #         "2. [alternative response 2] \n"
-            #         "3. [alternative response 3]"
-            #     )
-            # elif language == "ja":
-            #     system_message = (
-            #         "あなたは役立つ日本語の会話パートナーです。"
-            #         "ユーザーのメッセージに応答した後、以下を行ってください：\n"
-            #         "1. あなたの応答から3つのキーワードを特定し、それぞれに韓国語の意味と2つの例文を提供する。\n"
-            #         "2. この会話で適切な代替応答例を3つ提供する。\n"
-            #         "次の形式で応答してください: \n"
-            #         "[通常の応答] \n"
-            #         "語彙セクション: \n"
-            #         "1. [単語]: [韓国語の意味] \n"
-            #         "- 例文1: [例文] \n"
-            #         "- 例文2: [例文] \n"
-            #         "2. [単語]: [韓国語の意味] - [例文...] \n"
-            #         "3. [単語]: [韓国語の意味] - [例文...]\n"
-            #         "応答例: \n"
-            #         "1. [代替応答1] \n"
-            #         "2. [代替応答2] \n"
-            #         "3. [代替応答3]"
-            #     )
-            if language == "en":
-                system_message = (
-                    "You are a helpful English conversation partner. "
-                    "After responding to the user's message, do the following:\n"
-                    "1. Identify 3 key words or phrases from YOUR response and provide the Korean meaning and 2 example sentences for each.\n"
-                    "2. Provide 3 example responses that the USER could give to continue the conversation with you.\n"
-                    "Format your response as: \n"
-                    "[Your normal response] \n"
-                    "VOCABULARY_SECTION: \n"
-                    "1. [word from your response]: [Korean meaning] \n"
-                    "- Example 1: [example] \n"
-                    "- Example 2: [example] \n"
-                    "2. [word from your response]: [Korean meaning] - [examples...] \n"
-                    "3. [word from your response]: [Korean meaning] - [examples...]\n"
-                    "EXAMPLE_RESPONSES: \n"
-                    "1. [example of how the user might respond to you] \n"
-                    "2. [another example of user's possible response] \n"
-                    "3. [another example of user's possible response]"
-                )
-            elif language == "ja":
-                system_message = (
-                    "あなたは役立つ日本語の会話パートナーです。"
-                    "ユーザーのメッセージに応答した後、以下を行ってください：\n"
-                    "1. あなたの応答から3つのキーワードを特定し、それぞれに韓国語の意味と2つの例文を提供する。\n"
-                    "2. ユーザーがあなたの応答に対して返すことが考えられる3つの応答例を提供する。\n"
-                    "次の形式で応答してください: \n"
-                    "[通常の応答] \n"
-                    "語彙セクション: \n"
-                    "1. [あなたの応答からの単語]: [韓国語の意味] \n"
-                    "- 例文1: [例文] \n"
-                    "- 例文2: [例文] \n"
-                    "2. [あなたの応答からの単語]: [韓国語の意味] - [例文...] \n"
-                    "3. [あなたの応答からの単語]: [韓国語の意味] - [例文...]\n"
-                    "応答例: \n"
-                    "1. [ユーザーがあなたに返答する例] \n"
-                    "2. [ユーザーの別の返答例] \n"
-                    "3. [ユーザーの別の返答例]"
-                )
-            else:
-                system_message = (
-                    "You are a helpful conversation partner. "
-                    "Please respond naturally to the user's message."
-                )
-                
-            # 메시지 배열 구성
-            messages = [
-                {"role": "system", "content": system_message}
-            ]
-            
-            # 대화 기록이 있는 경우 추가
-            if chat_history and isinstance(chat_history, list):
-                # 토큰 제한을 위해 최대 10개 이전 메시지만 포함
-                recent_history = chat_history[-10:] if len(chat_history) > 10 else chat_history
-                messages.extend(recent_history)
-            
-            # 사용자의 현재 메시지 추가
-            messages.append({"role": "user", "content": user_message})
-            
             # GPT API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1500
-            )
+            with track_stage('gpt_request'), tracing.span('gpt.get_chat_conversation', {'gpt.model': self.model}) as gpt_span:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=build_conversation_messages(user_message, chat_history, language),
+                    temperature=0.7,
+                    max_tokens=1500
+                )
             
             # 응답 추출
             response_text = response.choices[0].message.content
             usage = response.usage.total_tokens if hasattr(response, 'usage') else None
+            record_gpt_usage(getattr(response, 'usage', None), gpt_span)
             
             logger.info(f"대화 기록 GPT API 응답 성공: 토큰 사용량={usage}")
 
@@ -504,38 +719,23 @@ class GPTService:
         """
         try:
             # 언어 코드를 언어 이름으로 변환
-            language_names = {
-                "ko": "Korean",
-                "en": "English",
-                "ja": "Japanese"
-            }
-
-            source_language_name = language_names.get(source_language, "Unknown")
-            target_language_name = language_names.get(target_language, "Unknown")
+            source_language_name = LANGUAGE_NAMES.get(source_language, "Unknown")
+            target_language_name = LANGUAGE_NAMES.get(target_language, "Unknown")
 
             logger.info(f"번역 API 호출 시작: {source_language_name} -> {target_language_name}")
 
-            # 시스템 메시지 설정 (번역 작업에 최적화)
-            system_message = (
-                f"You are a professional translator specialized in {source_language_name} to {target_language_name} translation. "
-                "Translate the text provided by the user accurately and naturally, preserving the original meaning, tone, and style. "
-                "Respond with only the translated text, without any additional explanations, notes, or quotation marks."
-            )
-
             # GPT API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": text}
-                ],
-                temperature=0.3,  # 번역은 창의성보다 정확성이 중요하므로 낮은 온도값 사용
-                max_tokens=1500
-            )
-
+            with track_stage('gpt_request'), tracing.span('gpt.get_translation', {'gpt.model': self.model}) as gpt_span:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=build_translation_messages(text, source_language, target_language),
+                    temperature=0.3,  # 번역은 창의성보다 정확성이 중요하므로 낮은 온도값 사용
+                    max_tokens=1500
+                )
             # 응답 추출
             translated_text = response.choices[0].message.content
             usage = response.usage.total_tokens if hasattr(response, 'usage') else None
+            record_gpt_usage(getattr(response, 'usage', None), gpt_span)
 
             logger.info(f"번역 API 응답 성공: 토큰 사용량={usage}")
 
@@ -0,0 +1,144 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+import numpy as np
+from config.settings import get_setting
+from app.services.audio_service import load_audio_file
+from app.services.stt_service import get_stt_backend
+from app.services.vad_service import SAMPLE_RATE, get_vad
+from app.services import tracing
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# Whisper 언어 감지 윈도우 길이(초)
+DETECTION_WINDOW_SECONDS = 30
+
+# 응답에 포함할 상위 후보 수
+TOP_LANGUAGES = 5
+
+# 프로세스 전역 캐시
+_language_cache = None
+_language_cache_lock = threading.Lock()
+
+
+class LanguageDetectionCache:
+    """
+    오디오 해시 → 언어 감지 결과의 프로세스 내 LRU 캐시.
+    같은 녹음이 다시 들어오는 경우(재시도, 감지 후 같은 파일로 인식 요청 등) 인코더 실행을 생략합니다.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max(0, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(audio, model_name):
+        """
+        감지 윈도우의 PCM 바이트와 모델 이름으로 캐시 키를 생성합니다.
+        """
+        digest = hashlib.sha256(np.ascontiguousarray(audio, dtype=np.float32).tobytes())
+        digest.update(model_name.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def get_language_cache():
+    """
+    언어 감지 캐시를 반환합니다. 캐시는 한 번만 생성됩니다.
+    """
+    global _language_cache
+    if _language_cache is None:
+        with _language_cache_lock:
+            if _language_cache is None:
+                _language_cache = LanguageDetectionCache(get_setting('LANGUAGE_DETECTION_CACHE_SIZE', 256))
+    return _language_cache
+
+
+def _detection_window(audio):
+    """
+    첫 음성 구간부터 감지 윈도우 길이만큼의 오디오를 반환합니다. 음성이 없으면 None.
+    """
+    speech = get_vad(required=True).detect(audio)
+    if not speech:
+        return None
+    start = speech[0][0]
+    return audio[start:start + DETECTION_WINDOW_SECONDS * SAMPLE_RATE]
+
+
+def detect_language(audio, candidates=None):
+    """
+    오디오의 언어를 감지합니다. 전체 디코딩 없이 첫 윈도우의 인코더 + 디코더 한 스텝만 실행합니다.
+
+    Args:
+        audio (str | numpy.ndarray): 오디오 파일 경로 또는 16kHz mono float32 배열
+        candidates (list, optional): 결과를 제한할 언어 코드 목록 (예: ['en', 'ja']).
+            지정하면 후보 중 확률이 가장 높은 언어를 반환
+
+    Returns:
+        dict: {'language', 'probability', 'languages': [{'language', 'probability'}], 'cached'}
+    """
+    try:
+        if isinstance(audio, str):
+            audio = load_audio_file(audio)
+
+        window = _detection_window(audio)
+        if window is None:
+            return {'language': 'unknown', 'probability': 0.0, 'languages': [], 'cached': False}
+
+        backend = get_stt_backend()
+        cache = get_language_cache()
+        with tracing.span('stt.detect_language', {'audio.seconds': round(len(window) / SAMPLE_RATE, 2)}) as detect_span:
+            key = cache.make_key(window, f"{backend.name}:{backend.model_size}")
+            result = cache.get(key)
+            cached = result is not None
+            if result is None:
+                result = backend.detect_language(window)
+                cache.put(key, result)
+            detect_span.set_attribute('cache_hit', cached)
+
+        probabilities = result['probabilities']
+        if candidates:
+            probabilities = {code: probabilities.get(code, 0.0) for code in candidates}
+        ranked = sorted(probabilities.items(), key=lambda item: item[1], reverse=True)
+
+        return {
+            'language': ranked[0][0],
+            'probability': round(ranked[0][1], 4),
+            'languages': [
+                {'language': code, 'probability': round(probability, 4)}
+                for code, probability in ranked[:TOP_LANGUAGES]
+            ],
+            'cached': cached
+        }
+    except Exception as e:
+        logger.error(f"Language Detection Error: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise
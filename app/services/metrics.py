@@ -0,0 +1,276 @@
+import bisect
+import contextlib
+import logging
+import threading
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 기본 버킷(초): 디코딩/파싱(ms 단위)부터 긴 오디오 인식/합성(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """
+    라벨 값 조합별로 값을 보관하는 메트릭 기본 클래스. 갱신은 메트릭별 잠금 하나로 처리되어 요청 경로 비용이 작습니다.
+    """
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key):
+        return list(zip(self.labelnames, key))
+
+    def samples(self):
+        """
+        Returns:
+            list: (샘플 이름, [(라벨, 값)], 값) 목록
+        """
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in self._values.items()]
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def inc(self, amount=1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount=1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수(+Inf 포함), 합계, 개수]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        with self._lock:
+            snapshot = [(key, list(state[0]), state[1], state[2]) for key, state in self._values.items()]
+
+        samples = []
+        for key, counts, total, count in snapshot:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                samples.append((self.name + '_bucket', labels + [('le', _format_value(bound))], cumulative))
+            samples.append((self.name + '_sum', labels, total))
+            samples.append((self.name + '_count', labels, count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    메트릭 목록을 보관하고 Prometheus 텍스트 형식(0.0.4)으로 출력합니다.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+# 프로세스 전역 레지스트리와 메트릭 (prefork 모드에서는 워커 프로세스별 값)
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'talk_stage_duration_seconds',
+    "Duration of processing stages (decode, transcribe, gpt_request, synthesize, file_send)",
+    ('stage',)
+))
+STAGE_IN_FLIGHT = REGISTRY.register(Gauge(
+    'talk_stage_in_flight',
+    "Number of processing stages currently running",
+    ('stage',)
+))
+CHAT_STAGE_SECONDS = REGISTRY.register(Histogram(
+    'talk_chat_stage_duration_seconds',
+    "Duration of chat pipeline stages per mode",
+    ('mode', 'stage')
+))
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'talk_http_request_duration_seconds',
+    "HTTP request duration until the response is returned (time to first byte for streaming responses)",
+    ('endpoint', 'method', 'status')
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    'talk_http_requests_in_flight',
+    "Number of HTTP requests currently being handled"
+))
+GPT_TOKENS = REGISTRY.register(Counter(
+    'talk_gpt_tokens_total',
+    "OpenAI tokens used (prompt, completion) and streamed completion chunks (stream_chunks)",
+    ('kind',)
+))
+AUDIO_SECONDS = REGISTRY.register(Counter(
+    'talk_audio_seconds_total',
+    "Seconds of audio processed (stt_input: recognized, tts_output: synthesized)",
+    ('direction',)
+))
+MODEL_LOAD_SECONDS = REGISTRY.register(Gauge(
+    'talk_model_load_seconds',
+    "Time taken by the most recent model load",
+    ('model',)
+))
+
+
+@contextlib.contextmanager
+def track_stage(stage):
+    """
+    처리 단계의 소요 시간을 기록하고, 실행 중인 동안 in-flight 게이지를 올립니다.
+    """
+    STAGE_IN_FLIGHT.inc(stage=stage)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage)
+        STAGE_IN_FLIGHT.dec(stage=stage)
+
+
+@contextlib.contextmanager
+def track_model_load(model):
+    """
+    모델 로드 시간을 기록합니다. (로드에 성공한 경우만)
+    """
+    started = time.perf_counter()
+    yield
+    MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=model)
+
+
+def record_gpt_usage(usage, span=None):
+    """
+    OpenAI 응답의 usage 객체에서 토큰 수를 기록합니다. span이 주어지면 span 속성으로도 기록합니다.
+    """
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+    completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+    GPT_TOKENS.inc(prompt_tokens, kind='prompt')
+    GPT_TOKENS.inc(completion_tokens, kind='completion')
+    if span is not None:
+        span.set_attributes({'gpt.prompt_tokens': prompt_tokens, 'gpt.completion_tokens': completion_tokens})
+
+
+def observe_file_send(response):
+    """
+    send_file 응답의 전송 완료(연결 종료)까지 걸린 시간을 file_send 단계로 기록합니다.
+    """
+    started = time.perf_counter()
+
+    @response.call_on_close
+    def on_close():
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage='file_send')
+
+    return response
+
+
+def render_metrics():
+    return REGISTRY.render()
+
+
+def init_app(app):
+    """
+    METRICS_ENABLED가 켜져 있으면 요청별 지연 시간 / in-flight 수를 기록하는 훅을 등록합니다.
+    """
+    if not app.config.get('METRICS_ENABLED'):
+        return
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_request_timer():
+        g._metrics_started = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+
+    @app.after_request
+    def _observe_request(response):
+        started = g.get('_metrics_started')
+        if started is not None:
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                endpoint=request.endpoint or 'unmatched',
+                method=request.method,
+                status=response.status_code
+            )
+        return response
+
+    @app.teardown_request
+    def _finish_request(exc):
+        if g.pop('_metrics_started', None) is not None:
+            HTTP_IN_FLIGHT.dec()
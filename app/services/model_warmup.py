@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 모델 상태
+PENDING = 'pending'
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+
+
+def _warm_whisper(inference):
+    from app.services.stt_service import _recognize, get_stt_backend
+    from app.services.audio_service import SAMPLE_RATE
+
+    backend = get_stt_backend()
+    backend.load()
+    if inference:
+        # 1초 무음으로 실제 요청과 같은 인식 경로(배치 스케줄러 포함)를 한 번 실행
+        # (transcribe_audio는 VAD가 무음을 걸러내어 모델을 호출하지 않으므로 VAD 이후 단계를 직접 호출)
+        audio = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        _recognize(backend, audio, [(0, len(audio))], "en")
+
+
+def _warm_tts_en(inference):
+    from app.services.tts_service import get_tts_en_model
+    from app.services.torch_optimizer import inference_mode
+
+    model = get_tts_en_model()
+    if inference:
+        with inference_mode():
+            model.tts(text="Hello.")
+
+
+def _warm_tts_ja(inference):
+    from app.services.tts_service import get_tts_ja_model
+    from app.services.torch_optimizer import inference_mode
+
+    model = get_tts_ja_model()
+    if inference:
+        with inference_mode():
+            model.tts(text="こんにちは。")
+
+
+def _warm_gpt(inference):
+    # GPT는 원격 API이므로 클라이언트(연결 풀)만 미리 생성
+    from app.services.gpt_client_registry import get_gpt_service
+
+    get_gpt_service()
+
+
+# 워밍업 대상 이름 → 워밍업 함수
+WARMUP_TASKS = {
+    'whisper': _warm_whisper,
+    'tts_en': _warm_tts_en,
+    'tts_ja': _warm_tts_ja,
+    'gpt': _warm_gpt
+}
+
+
+class ModelWarmup:
+    """
+    시작 시 모델을 병렬로 로드하고 더미 추론을 한 번 실행하여 첫 요청 지연을 없앱니다.
+    모델별 준비 상태를 기록하며, 모든 모델이 준비되어야 ready 상태가 됩니다.
+    """
+
+    def __init__(self, models, inference=True):
+        """
+        Args:
+            models (list): 워밍업할 모델 이름 목록 (WARMUP_TASKS의 키)
+            inference (bool): 로드 후 더미 추론 실행 여부
+        """
+        unknown = [name for name in models if name not in WARMUP_TASKS]
+        if unknown:
+            logger.warning(f"알 수 없는 워밍업 대상 무시: {unknown}")
+        self.models = [name for name in models if name in WARMUP_TASKS]
+        self.inference = inference
+        self._status = {name: {'status': PENDING} for name in self.models}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._done = threading.Event()
+
+    def start(self):
+        """
+        백그라운드 스레드에서 워밍업을 시작합니다.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self.run, name='model-warmup', daemon=True)
+        self._thread.start()
+
+    def run(self):
+        """
+        모든 모델을 병렬로 워밍업하고 끝날 때까지 기다립니다.
+        """
+        started = time.perf_counter()
+        logger.info(f"모델 워밍업 시작: {self.models}")
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, len(self.models)), thread_name_prefix='warmup') as executor:
+                for name in self.models:
+                    executor.submit(self._warm, name)
+        finally:
+            self._done.set()
+        logger.info(f"모델 워밍업 종료: {time.perf_counter() - started:.1f}초, ready={self.is_ready()}")
+
+    def wait(self, timeout=None):
+        """
+        워밍업이 끝날 때까지 기다립니다.
+
+        Returns:
+            bool: 모든 모델이 준비되었으면 True
+        """
+        self._done.wait(timeout)
+        return self.is_ready()
+
+    def is_ready(self):
+        with self._lock:
+            return all(state['status'] == READY for state in self._status.values())
+
+    def status(self):
+        """
+        모델별 준비 상태를 반환합니다.
+        """
+        with self._lock:
+            return {name: dict(state) for name, state in self._status.items()}
+
+    def _set(self, name, **state):
+        with self._lock:
+            self._status[name] = state
+
+    def _warm(self, name):
+        started = time.perf_counter()
+        self._set(name, status=LOADING)
+        try:
+            WARMUP_TASKS[name](self.inference)
+            self._set(name, status=READY, seconds=round(time.perf_counter() - started, 2))
+            logger.info(f"{name} 워밍업 완료 ({time.perf_counter() - started:.1f}초)")
+        except Exception as e:
+            self._set(name, status=FAILED, error=str(e))
+            logger.error(f"{name} 워밍업 실패: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+
+
+# 프로세스 전역 워밍업 상태
+_model_warmup = None
+
+
+def get_model_warmup():
+    """
+    현재 워밍업 객체를 반환합니다. 워밍업이 꺼져 있으면 None.
+    """
+    return _model_warmup
+
+
+def init_app(app):
+    """
+    MODEL_WARMUP_ENABLED가 켜져 있으면 백그라운드 워밍업을 시작합니다.
+    """
+    global _model_warmup
+
+    if not app.config.get('MODEL_WARMUP_ENABLED'):
+        return None
+
+    if _model_warmup is None:
+        models = [name.strip() for name in app.config.get('MODEL_WARMUP_MODELS', '').split(',') if name.strip()]
+        _model_warmup = ModelWarmup(models, inference=app.config.get('MODEL_WARMUP_INFERENCE', True))
+        _model_warmup.start()
+    app.extensions['model_warmup'] = _model_warmup
+    return _model_warmup
@@ -0,0 +1,249 @@
+import logging
+import threading
+from app.services.torch_optimizer import inference_mode, optimize_whisper_model
+from app.services.metrics import track_model_load
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class STTBackend:
+    """
+    음성 인식 백엔드 인터페이스. transcribe_audio는 이 인터페이스만 사용합니다.
+    """
+
+    # 설정 값(STT_BACKEND)에 사용하는 이름
+    name = None
+
+    # WhisperBatchScheduler로 요청을 묶어 처리할 수 있는지 여부
+    supports_batching = False
+
+    # 여러 스레드에서 동시에 transcribe를 호출해도 되는지 여부 (장시간 인식의 덩어리 병렬 처리에 사용)
+    supports_concurrent_inference = False
+
+    def __init__(self, model_size="medium", compute_type="int8", cpu_threads=0, num_workers=1, beam_size=None):
+        """
+        Args:
+            model_size (str): 모델 크기 (tiny, base, small, medium, large-v2 등)
+            compute_type (str): 연산 정밀도 (int8, int8_float32, float32 등, 지원하는 백엔드만 사용)
+            cpu_threads (int): 추론 스레드 수 (0이면 라이브러리 기본값)
+            num_workers (int): 동시에 추론을 실행할 수 있는 요청 수
+            beam_size (int, optional): 빔 서치 크기 (None이면 greedy)
+        """
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = int(cpu_threads or 0)
+        self.num_workers = max(1, int(num_workers or 1))
+        self.beam_size = beam_size
+
+    def load(self):
+        """
+        모델을 로드하고 반환합니다. 여러 번 호출해도 한 번만 로드됩니다.
+        """
+        raise NotImplementedError
+
+    def transcribe(self, audio, language=None):
+        """
+        16kHz mono float32 오디오를 인식합니다.
+
+        Args:
+            audio (numpy.ndarray): 16kHz mono float32 배열
+            language (str, optional): 언어 코드. 없으면 자동 감지
+
+        Returns:
+            dict: {'text', 'language', 'avg_logprob', 'segments'}
+                segments는 오디오 시작 기준 초 단위 {'start', 'end', 'text'} 목록
+        """
+        raise NotImplementedError
+
+    def detect_language(self, audio):
+        """
+        첫 30초 윈도우에 대해 인코더와 디코더 한 스텝만 실행하여 언어를 감지합니다. (전체 디코딩 없음)
+
+        Args:
+            audio (numpy.ndarray): 16kHz mono float32 배열
+
+        Returns:
+            dict: {'language', 'probability', 'probabilities': {언어 코드: 확률}}
+        """
+        raise NotImplementedError
+
+    def describe(self):
+        return {
+            'backend': self.name,
+            'model_size': self.model_size,
+            'compute_type': self.compute_type
+        }
+
+
+class WhisperBackend(STTBackend):
+    """
+    openai-whisper (PyTorch float32) 백엔드. 마이크로 배치 스케줄러와 함께 사용할 수 있습니다.
+
+    openai-whisper는 디코딩할 때마다 공유 디코더 모듈에 kv-cache 훅을 설치하므로 같은 모델로 동시에 디코딩하면
+    서로의 캐시가 섞입니다. 모델을 사용하는 모든 경로(직접 인식, 언어 감지, 배치 스케줄러)는 inference_lock으로 직렬화합니다.
+    """
+
+    name = 'whisper'
+    supports_batching = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model = None
+        self._lock = threading.Lock()
+        # 모델 실행 잠금 (WhisperBatchScheduler도 같은 잠금을 사용)
+        self.inference_lock = threading.Lock()
+
+    def load(self):
+        if self._model is None:
+            # 동시에 들어온 첫 요청들이 모델을 중복 로드하지 않도록 잠금
+            with self._lock:
+                if self._model is None:
+                    import whisper
+
+                    logger.info(f"Loading Whisper model ({self.model_size})...")
+                    with track_model_load(f"whisper-{self.model_size}"):
+                        self._model = optimize_whisper_model(whisper.load_model(self.model_size))
+                    logger.info("Whisper model loaded.")
+        return self._model
+
+    def transcribe(self, audio, language=None):
+        model = self.load()
+        options = {}
+        if self.beam_size:
+            options['beam_size'] = self.beam_size
+
+        # 언어가 지정된 경우 해당 언어로 인식, 아니면 자동 감지
+        with self.inference_lock, inference_mode():
+            if language:
+                result = model.transcribe(audio, language=language, **options)
+            else:
+                result = model.transcribe(audio, **options)
+
+        segments = result.get("segments") or []
+        return {
+            'text': result["text"],
+            'language': language or result.get("language", "unknown"),
+            'avg_logprob': (sum(s["avg_logprob"] for s in segments) / len(segments)) if segments else None,
+            'segments': [{'start': s["start"], 'end': s["end"], 'text': s["text"]} for s in segments]
+        }
+
+    def detect_language(self, audio):
+        import whisper
+
+        model = self.load()
+        if not model.is_multilingual:
+            return {'language': 'en', 'probability': 1.0, 'probabilities': {'en': 1.0}}
+
+        audio = whisper.pad_or_trim(audio)
+        n_mels = getattr(model.dims, 'n_mels', 80)
+        if n_mels != 80:
+            mel = whisper.log_mel_spectrogram(audio, n_mels=n_mels)
+        else:
+            mel = whisper.log_mel_spectrogram(audio)
+
+        # 언어 감지도 디코더를 한 스텝 실행하므로 인식과 같은 잠금으로 직렬화
+        with self.inference_lock, inference_mode():
+            _, probabilities = model.detect_language(mel.to(model.device))
+
+        language = max(probabilities, key=probabilities.get)
+        return {
+            'language': language,
+            'probability': float(probabilities[language]),
+            'probabilities': {code: float(probability) for code, probability in probabilities.items()}
+        }
+
+    def describe(self):
+        return dict(super().describe(), compute_type='float32')
+
+
+class FasterWhisperBackend(STTBackend):
+    """
+    faster-whisper (CTranslate2) 백엔드. int8 양자화 가중치로 CPU 추론 시간과 메모리를 줄입니다.
+    CTranslate2 모델은 num_workers만큼 동시 요청을 자체적으로 병렬 처리합니다.
+    """
+
+    name = 'faster-whisper'
+    supports_concurrent_inference = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    # 선택 의존성이므로 이 백엔드를 사용할 때만 import
+                    from faster_whisper import WhisperModel
+
+                    logger.info(f"Loading faster-whisper model: size={self.model_size}, compute_type={self.compute_type}")
+                    with track_model_load(f"faster-whisper-{self.model_size}-{self.compute_type}"):
+                        self._model = WhisperModel(
+                            self.model_size,
+                            device="cpu",
+                            compute_type=self.compute_type,
+                            cpu_threads=self.cpu_threads,
+                            num_workers=self.num_workers
+                        )
+                    logger.info("faster-whisper model loaded.")
+        return self._model
+
+    def transcribe(self, audio, language=None):
+        model = self.load()
+        segments, info = model.transcribe(
+            audio,
+            language=language,
+            beam_size=self.beam_size or 1
+        )
+
+        # segments는 지연 평가되는 제너레이터이므로 여기서 디코딩이 실행됨
+        segments = list(segments)
+        return {
+            'text': "".join(segment.text for segment in segments),
+            'language': language or info.language or "unknown",
+            'avg_logprob': (sum(s.avg_logprob for s in segments) / len(segments)) if segments else None,
+            'segments': [{'start': s.start, 'end': s.end, 'text': s.text} for s in segments]
+        }
+
+    def detect_language(self, audio):
+        model = self.load()
+        if not model.model.is_multilingual:
+            return {'language': 'en', 'probability': 1.0, 'probabilities': {'en': 1.0}}
+
+        # faster-whisper의 transcribe 내부 언어 감지와 같은 방식 (첫 윈도우 인코딩 + 언어 토큰 한 스텝)
+        features = model.feature_extractor(audio)[:, :model.feature_extractor.nb_max_frames]
+        encoder_output = model.encode(features)
+        results = model.model.detect_language(encoder_output)[0]
+        probabilities = {token[2:-2]: float(probability) for token, probability in results}
+
+        language = max(probabilities, key=probabilities.get)
+        return {
+            'language': language,
+            'probability': probabilities[language],
+            'probabilities': probabilities
+        }
+
+
+# 설정 이름 → 백엔드 클래스
+STT_BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend
+}
+
+
+def create_stt_backend(name, **options):
+    """
+    이름에 맞는 STT 백엔드를 생성합니다.
+
+    Args:
+        name (str): 백엔드 이름 (whisper, faster-whisper)
+        **options: STTBackend 생성자 인자
+
+    Returns:
+        STTBackend: 생성된 백엔드
+    """
+    if name not in STT_BACKENDS:
+        raise ValueError(f"지원하지 않는 STT 백엔드입니다: {name} (지원: {', '.join(STT_BACKENDS)})")
+    return STT_BACKENDS[name](**options)
@@ -0,0 +1,199 @@
+import contextlib
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import torch
+import whisper
+from app.services.audio_service import load_audio_file
+from app.services.torch_optimizer import inference_mode
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class _BatchItem:
+    """
+    배치 큐에 들어가는 단일 인식 요청
+    """
+    __slots__ = ('audio', 'language', 'future')
+
+    def __init__(self, audio, language):
+        self.audio = audio
+        self.language = language
+        self.future = Future()
+
+
+class WhisperBatchScheduler:
+    """
+    Whisper 모델 앞단에서 동작하는 마이크로 배치 스케줄러.
+
+    여러 요청 스레드에서 들어온 인식 요청을 최대 max_wait_ms 동안 모은 뒤,
+    30초 길이로 패딩된 log-mel 윈도우를 하나의 배치로 묶어 인코더/디코더를 한 번에 실행합니다.
+    배치 요청끼리는 스케줄러 스레드 하나에서 실행되고, 같은 모델을 쓰는 다른 경로(장시간 인식, 언어 감지 등)와는
+    inference_lock으로 직렬화됩니다.
+    """
+
+    def __init__(self, model_loader, max_batch_size=8, max_wait_ms=15, inference_lock=None):
+        """
+        Args:
+            model_loader (callable): Whisper 모델을 반환하는 함수
+            max_batch_size (int): 한 번에 처리할 최대 요청 수
+            max_wait_ms (float): 배치를 채우기 위해 기다리는 최대 시간(ms)
+            inference_lock (threading.Lock, optional): 모델을 공유하는 다른 경로와 함께 사용하는 모델 실행 잠금
+        """
+        self._model_loader = model_loader
+        self._inference_lock = inference_lock
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def start(self):
+        """
+        배치 처리 스레드를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name='whisper-batcher', daemon=True)
+            self._thread.start()
+            logger.info(f"Whisper 배치 스케줄러 시작: max_batch_size={self.max_batch_size}, max_wait={self.max_wait * 1000:.0f}ms")
+
+    def submit(self, audio, language=None):
+        """
+        인식 요청을 큐에 넣고 Future를 반환합니다.
+
+        Args:
+            audio (str | numpy.ndarray): 오디오 파일 경로 또는 16kHz mono float32 배열
+            language (str, optional): 언어 코드. 없으면 자동 감지
+
+        Returns:
+            concurrent.futures.Future: {'text', 'language', ...} 결과를 담는 Future
+        """
+        # 파일 디코딩(ffmpeg)은 요청 스레드에서 병렬로 처리하고, 스케줄러 스레드는 모델 실행만 담당
+        if isinstance(audio, str):
+            audio = load_audio_file(audio)
+
+        item = _BatchItem(audio, language)
+        self.start()
+        self._queue.put(item)
+        return item.future
+
+    def transcribe(self, audio, language=None, timeout=None):
+        """
+        인식 요청을 제출하고 결과가 나올 때까지 기다립니다.
+        """
+        return self.submit(audio, language).result(timeout=timeout)
+
+    def shutdown(self):
+        """
+        배치 처리 스레드를 중지합니다. 대기 중인 요청은 마저 처리됩니다.
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            self._stopped = True
+            self._queue.put(None)
+            thread = self._thread
+            self._thread = None
+        thread.join(timeout=5)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                if self._stopped:
+                    return
+                continue
+
+            # 첫 요청 도착 후 max_wait 동안 배치를 채움
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    next_item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if next_item is None:
+                    # 종료 신호는 현재 배치 처리 후 다시 처리
+                    self._queue.put(None)
+                    break
+                batch.append(next_item)
+
+            self._process(batch)
+
+    def _process(self, batch):
+        try:
+            model = self._model_loader()
+        except Exception as e:
+            for item in batch:
+                item.future.set_exception(e)
+            return
+
+        # 같은 언어 옵션끼리 묶어서 디코딩 (DecodingOptions는 배치 단위로 하나의 언어만 지정 가능)
+        groups = {}
+        for item in batch:
+            groups.setdefault(item.language, []).append(item)
+
+        for language, items in groups.items():
+            try:
+                with self._inference_lock or contextlib.nullcontext(), inference_mode():
+                    self._decode_group(model, items, language)
+            except Exception as e:
+                logger.error(f"Whisper 배치 디코딩 중 오류 발생: {str(e)}")
+                import traceback
+                logger.error(traceback.format_exc())
+                for item in items:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+
+    def _decode_group(self, model, items, language):
+        batch_items = []
+        mels = []
+        for item in items:
+            # 30초를 넘는 오디오는 윈도우 단위 순차 디코딩이 필요하므로 기존 transcribe 경로 사용
+            if len(item.audio) > whisper.audio.N_SAMPLES:
+                try:
+                    result = model.transcribe(item.audio, language=language) if language else model.transcribe(item.audio)
+                    item.future.set_result({
+                        'text': result["text"],
+                        'language': language or result.get("language", "unknown")
+                    })
+                except Exception as e:
+                    item.future.set_exception(e)
+                continue
+
+            audio = whisper.pad_or_trim(item.audio)
+            n_mels = getattr(model.dims, 'n_mels', 80)
+            if n_mels != 80:
+                mel = whisper.log_mel_spectrogram(audio, n_mels=n_mels)
+            else:
+                mel = whisper.log_mel_spectrogram(audio)
+            mels.append(mel)
+            batch_items.append(item)
+
+        if not batch_items:
+            return
+
+        mel_batch = torch.stack(mels).to(model.device)
+        options = whisper.DecodingOptions(language=language, fp16=model.device.type == 'cuda')
+        results = whisper.decode(model, mel_batch, options)
+
+        logger.debug(f"Whisper 배치 디코딩 완료: batch_size={len(batch_items)}, language={language}")
+
+        for item, result in zip(batch_items, results):
+            item.future.set_result({
+                'text': result.text,
+                'language': language or result.language or "unknown",
+                'avg_logprob': result.avg_logprob,
+                'no_speech_prob': result.no_speech_prob
+            })
@@ -0,0 +1,184 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import get_setting
+from app.services.audio_service import load_audio_file
+from app.services.stt_service import get_stt_backend, join_transcripts
+from app.services.vad_service import SAMPLE_RATE, get_vad
+from app.services import tracing
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 장시간 오디오 덩어리 인식용 워커 풀
+_long_executor = None
+_long_executor_lock = threading.Lock()
+
+
+class AudioChunk:
+    """
+    독립적으로 인식할 오디오 덩어리.
+
+    start/end는 디코딩할 범위, keep_start/keep_end는 이 덩어리가 결과를 책임지는 범위(샘플 단위)입니다.
+    쉬지 않는 긴 음성을 자른 경우에만 두 범위가 달라지며, 겹치는 부분의 세그먼트는 타임스탬프 기준으로 한쪽만 남깁니다.
+    """
+
+    def __init__(self, start, end, keep_start=None, keep_end=None):
+        self.start = start
+        self.end = end
+        self.keep_start = start if keep_start is None else keep_start
+        self.keep_end = end if keep_end is None else keep_end
+
+    def keeps(self, position):
+        """
+        절대 위치(샘플)의 세그먼트를 이 덩어리의 결과로 채택할지 판단합니다.
+        """
+        if self.start < self.keep_start and position < self.keep_start:
+            return False
+        if self.keep_end < self.end and position >= self.keep_end:
+            return False
+        return True
+
+
+def plan_chunks(speech_segments, max_chunk_seconds=30.0, overlap_seconds=1.0, sample_rate=SAMPLE_RATE):
+    """
+    VAD 음성 구간을 최대 길이 이하의 인식 덩어리로 묶습니다.
+
+    Args:
+        speech_segments (list): VAD가 반환한 (시작 샘플, 끝 샘플) 목록
+        max_chunk_seconds (float): 덩어리 최대 길이(초). Whisper 윈도우(30초) 이하
+        overlap_seconds (float): 긴 음성을 강제로 자를 때 앞뒤로 겹쳐서 디코딩할 길이(초)
+        sample_rate (int): 샘플링 레이트
+
+    Returns:
+        list: AudioChunk 목록
+    """
+    max_length = int(max_chunk_seconds * sample_rate)
+    overlap = min(int(overlap_seconds * sample_rate), max_length // 4)
+    step = max_length - 2 * overlap
+
+    chunks = []
+    for start, end in speech_segments:
+        if end - start > max_length:
+            # 쉬지 않고 최대 길이를 넘는 음성은 단어가 잘리지 않도록 겹치게 나눔
+            position = start
+            while position < end:
+                keep_end = min(position + step, end)
+                chunks.append(AudioChunk(max(start, position - overlap), min(end, keep_end + overlap), position, keep_end))
+                position = keep_end
+            continue
+
+        last = chunks[-1] if chunks else None
+        if last is not None and last.end == last.keep_end and end - last.start <= max_length:
+            # 무음으로 나뉜 짧은 구간들은 Whisper 윈도우를 채우도록 합침
+            last.end = last.keep_end = end
+        else:
+            chunks.append(AudioChunk(start, end))
+    return chunks
+
+
+def get_long_executor():
+    """
+    장시간 오디오 인식용 스레드 풀을 반환합니다. 풀은 한 번만 생성되고 캐싱됩니다.
+    """
+    global _long_executor
+    if _long_executor is None:
+        with _long_executor_lock:
+            if _long_executor is None:
+                _long_executor = ThreadPoolExecutor(
+                    max_workers=max(1, int(get_setting('STT_LONG_WORKERS', 2))),
+                    thread_name_prefix='stt-long'
+                )
+    return _long_executor
+
+
+def _chunk_segments(chunk, result, sample_rate):
+    """
+    덩어리 인식 결과의 세그먼트를 오디오 전체 기준 타임스탬프로 변환하고, 겹침 구간에서 채택할 것만 남깁니다.
+    """
+    offset = chunk.start / sample_rate
+    chunk_end = chunk.end / sample_rate
+    segments = result.get("segments")
+    if not segments:
+        # 세그먼트 정보가 없는 백엔드는 덩어리 전체를 하나의 세그먼트로 취급
+        segments = [{'start': 0.0, 'end': chunk_end - offset, 'text': result["text"]}] if result["text"].strip() else []
+
+    stitched = []
+    for segment in segments:
+        start = offset + float(segment['start'])
+        end = min(offset + float(segment['end']), chunk_end)
+        middle = (start + end) / 2
+        if not chunk.keeps(int(middle * sample_rate)):
+            continue
+        text = segment['text'].strip()
+        if text:
+            stitched.append({'start': round(start, 2), 'end': round(end, 2), 'text': text})
+    return stitched
+
+
+def transcribe_long_audio(audio, language=None):
+    """
+    긴 오디오를 VAD 경계에서 나누어 여러 덩어리를 동시에 인식하고, 타임스탬프가 포함된 세그먼트로 이어 붙입니다.
+
+    Args:
+        audio (str | numpy.ndarray): 오디오 파일 경로 또는 16kHz mono float32 배열
+        language (str, optional): 언어 코드. 없으면 첫 덩어리에서 감지한 언어를 전체에 사용
+
+    Returns:
+        dict: {'text', 'language', 'duration', 'segments': [{'start', 'end', 'text'}]}
+    """
+    try:
+        if isinstance(audio, str):
+            audio = load_audio_file(audio)
+
+        duration = len(audio) / SAMPLE_RATE
+        chunks = plan_chunks(
+            get_vad(required=True).detect(audio),
+            max_chunk_seconds=get_setting('STT_LONG_MAX_CHUNK_SECONDS', 30.0),
+            overlap_seconds=get_setting('STT_LONG_OVERLAP_SECONDS', 1.0)
+        )
+        logger.info(f"장시간 인식: {duration:.1f}초, 덩어리 {len(chunks)}개")
+        if not chunks:
+            return {'text': '', 'language': language or 'unknown', 'duration': round(duration, 2), 'segments': []}
+
+        backend = get_stt_backend()
+        results = [None] * len(chunks)
+        pending = range(len(chunks))
+        with tracing.span('stt.transcribe_long', {'audio.seconds': round(duration, 2), 'stt.chunks': len(chunks)}):
+            if language is None:
+                # 덩어리마다 언어 감지 결과가 달라지지 않도록 첫 덩어리의 감지 결과를 나머지에 적용
+                first = chunks[0]
+                with tracing.span('stt.detect_first_chunk'):
+                    results[0] = backend.transcribe(audio[first.start:first.end])
+                language = results[0]["language"]
+                pending = range(1, len(chunks))
+
+            if backend.supports_concurrent_inference:
+                # 덩어리는 서로 독립적이므로(이전 텍스트 조건 없음) 워커 풀에서 동시에 인식
+                executor = get_long_executor()
+                futures = {
+                    index: executor.submit(backend.transcribe, audio[chunks[index].start:chunks[index].end], language)
+                    for index in pending
+                }
+                for index, future in futures.items():
+                    results[index] = future.result()
+            else:
+                # openai-whisper는 모델 하나를 동시에 실행할 수 없으므로 순서대로 인식
+                for index in pending:
+                    results[index] = backend.transcribe(audio[chunks[index].start:chunks[index].end], language)
+
+        segments = []
+        for chunk, result in zip(chunks, results):
+            segments.extend(_chunk_segments(chunk, result, SAMPLE_RATE))
+
+        return {
+            'text': join_transcripts([segment['text'] for segment in segments], language),
+            'language': language,
+            'duration': round(duration, 2),
+            'segments': segments
+        }
+    except Exception as e:
+        logger.error(f"Long STT Error: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise
@@ -0,0 +1,192 @@
+import gc
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 모델 크기별 CPU 메모리 사용량 추정치(MB, float32 가중치 + 추론 버퍼)
+WHISPER_MODEL_MEMORY_MB = {
+    'tiny': 150,
+    'base': 300,
+    'small': 950,
+    'medium': 2600,
+    'large': 5200,
+    'large-v1': 5200,
+    'large-v2': 5200,
+    'large-v3': 5200
+}
+
+# 요청에서 지정할 수 있는 인식 품질
+QUALITY_LEVELS = ('fast', 'balanced', 'best')
+
+
+def estimate_model_memory_mb(model_size, backend_name='whisper', compute_type=None):
+    """
+    모델 크기와 백엔드로 상주 메모리 사용량을 추정합니다.
+    """
+    memory = WHISPER_MODEL_MEMORY_MB.get(model_size.replace('.en', ''), WHISPER_MODEL_MEMORY_MB['medium'])
+    if backend_name == 'faster-whisper' and (compute_type or '').startswith('int8'):
+        # int8 가중치는 float32의 약 1/3
+        memory = memory * 0.35
+    return memory
+
+
+def parse_routing_rules(rules):
+    """
+    'base:3,small:10' 형식의 길이별 라우팅 규칙을 [(최대 길이(초), 모델 크기)] 목록으로 변환합니다.
+    """
+    parsed = []
+    for rule in (rules or '').split(','):
+        if not rule.strip():
+            continue
+        size, max_seconds = rule.split(':')
+        parsed.append((float(max_seconds), size.strip()))
+    return sorted(parsed)
+
+
+def parse_quality_sizes(mapping):
+    """
+    'fast:base,balanced:small' 형식의 품질별 모델 크기를 dict로 변환합니다.
+    """
+    parsed = {}
+    for item in (mapping or '').split(','):
+        if not item.strip():
+            continue
+        quality, size = item.split(':')
+        parsed[quality.strip()] = size.strip()
+    return parsed
+
+
+class WhisperModelManager:
+    """
+    여러 크기의 Whisper 모델을 메모리 예산 안에서 상주시키고, 요청을 알맞은 크기로 라우팅합니다.
+
+    기본 크기(STT_MODEL_SIZE) 백엔드는 항상 상주하며, 그 외 크기는 예산을 넘으면 가장 오래 사용하지 않은 것부터 해제합니다(LRU).
+    인식 중인 모델은 해제하지 않습니다. 같은 모델로의 동시 인식은 각 백엔드의 모델 실행 잠금으로 직렬화됩니다.
+    짧은 발화는 작은 모델로 인식하고, 결과의 평균 log-prob이 낮으면 기본 모델로 다시 인식(escalation)합니다.
+    """
+
+    def __init__(self, default_backend, backend_factory, memory_budget_mb=4096, routing_rules=None,
+                 quality_sizes=None, escalation_logprob=None):
+        """
+        Args:
+            default_backend (STTBackend): 항상 상주하는 기본 백엔드 (get_stt_backend())
+            backend_factory (callable): 모델 크기를 받아 STTBackend를 생성하는 함수
+            memory_budget_mb (float): 전체 모델 메모리 예산(MB)
+            routing_rules (list): [(최대 길이(초), 모델 크기)] 목록. 어느 규칙에도 맞지 않으면 기본 크기
+            quality_sizes (dict): 품질('fast', 'balanced') → 모델 크기. 'best'는 항상 기본 크기
+            escalation_logprob (float, optional): 작은 모델 결과의 평균 log-prob이 이보다 낮으면 기본 모델로 재인식
+        """
+        self.default_backend = default_backend
+        self.default_size = default_backend.model_size
+        self.backend_factory = backend_factory
+        self.memory_budget_mb = float(memory_budget_mb)
+        self.routing_rules = routing_rules or []
+        self.quality_sizes = dict(quality_sizes or {}, best=self.default_size)
+        self.escalation_logprob = escalation_logprob
+
+        self._backends = OrderedDict()  # 모델 크기 → 백엔드 (오래 사용하지 않은 순)
+        self._in_use = {}  # 모델 크기 → 인식 중인 요청 수
+        self._lock = threading.Lock()
+
+    def _memory_of(self, backend):
+        return estimate_model_memory_mb(backend.model_size, backend.name, backend.compute_type)
+
+    def resident_memory_mb(self):
+        return self._memory_of(self.default_backend) + sum(self._memory_of(b) for b in self._backends.values())
+
+    def select_size(self, duration, quality=None):
+        """
+        요청에 사용할 모델 크기를 고릅니다.
+
+        Args:
+            duration (float): 인식할 음성 길이(초)
+            quality (str, optional): 'fast', 'balanced', 'best'. 지정하면 길이 규칙보다 우선
+
+        Returns:
+            str: 모델 크기
+        """
+        if quality:
+            if quality not in QUALITY_LEVELS:
+                raise ValueError(f"지원하지 않는 인식 품질입니다: {quality} (지원: {', '.join(QUALITY_LEVELS)})")
+            return self.quality_sizes.get(quality, self.default_size)
+
+        for max_seconds, size in self.routing_rules:
+            if duration <= max_seconds:
+                return size
+        return self.default_size
+
+    @contextmanager
+    def use(self, model_size):
+        """
+        해당 크기의 백엔드를 인식하는 동안 빌려줍니다. 상주하지 않으면 예산 안에 들어오도록 LRU로 해제한 뒤 로드하며,
+        with 블록 안에서는 이 모델이 해제되지 않습니다.
+
+        Args:
+            model_size (str): 모델 크기
+
+        Returns:
+            STTBackend: with 블록에서 사용할 백엔드
+        """
+        if model_size == self.default_size:
+            yield self.default_backend
+            return
+
+        with self._lock:
+            backend = self._backends.get(model_size)
+            if backend is not None:
+                self._backends.move_to_end(model_size)
+            else:
+                backend = self.backend_factory(model_size)
+                self._evict_for(self._memory_of(backend))
+                self._backends[model_size] = backend
+            self._in_use[model_size] = self._in_use.get(model_size, 0) + 1
+
+        try:
+            # 모델 로드는 백엔드 자체 잠금으로 한 번만 실행 (관리자 잠금을 오래 잡지 않음)
+            backend.load()
+            yield backend
+        finally:
+            with self._lock:
+                self._in_use[model_size] -= 1
+                if not self._in_use[model_size]:
+                    del self._in_use[model_size]
+
+    def _evict_for(self, required_mb):
+        evicted = False
+        while self.resident_memory_mb() + required_mb > self.memory_budget_mb:
+            # 인식 중인 모델은 건너뛰고 가장 오래 사용하지 않은 모델부터 해제
+            size = next((size for size in self._backends if size not in self._in_use), None)
+            if size is None:
+                break
+            del self._backends[size]
+            logger.info(f"Whisper 모델 해제 (LRU): {size}")
+            evicted = True
+        if evicted:
+            # 해제한 모델은 사용 중인 요청이 없으므로 바로 회수
+            gc.collect()
+        if self.resident_memory_mb() + required_mb > self.memory_budget_mb:
+            logger.warning(f"Whisper 모델 메모리 예산 초과: 예산 {self.memory_budget_mb:.0f}MB, "
+                           f"필요 {self.resident_memory_mb() + required_mb:.0f}MB")
+
+    def should_escalate(self, model_size, result):
+        """
+        작은 모델의 인식 결과가 신뢰도가 낮아 기본 모델로 다시 인식해야 하는지 판단합니다.
+        """
+        if self.escalation_logprob is None or model_size == self.default_size:
+            return False
+        avg_logprob = result.get('avg_logprob')
+        return avg_logprob is not None and avg_logprob < self.escalation_logprob
+
+    def status(self):
+        with self._lock:
+            return {
+                'default': self.default_size,
+                'resident': [self.default_size] + list(self._backends),
+                'in_use': dict(self._in_use),
+                'resident_memory_mb': round(self.resident_memory_mb()),
+                'memory_budget_mb': self.memory_budget_mb
+            }
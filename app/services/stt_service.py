@@ -6,7 +6,17 @@ import torch.serialization
 from TTS.utils.radam import RAdam
 from collections import defaultdict, OrderedDict
 import builtins
+import threading
 from flask import current_app
+from config.settings import get_setting
+from app.services.stt_batch_service import WhisperBatchScheduler
+from app.services.stt_backends import WhisperBackend, create_stt_backend
+from app.services.audio_service import load_audio_file
+from app.services.torch_optimizer import optimize_whisper_model
+from app.services.metrics import AUDIO_SECONDS, track_model_load, track_stage
+from app.services import tracing
+from app.services.vad_service import SAMPLE_RATE, speech_chunks
+from app.services.stt_model_manager import WhisperModelManager, parse_quality_sizes, parse_routing_rules
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -34,42 +44,205 @@ except Exception as e:
 
 # 전역 변수로 모델 캐싱
 _whisper_model = None
+_whisper_model_lock = threading.Lock()
+
+# 설정으로 선택된 STT 백엔드
+_stt_backend = None
+_stt_backend_lock = threading.Lock()
+
+# 배치 스케줄러 (모델 앞단의 요청 큐)
+_stt_batcher = None
+_stt_batcher_lock = threading.Lock()
+
+# 여러 크기 모델 관리자 (STT_ROUTING_ENABLED일 때만 사용)
+_model_manager = None
+_model_manager_lock = threading.Lock()
 
 def get_whisper_model():
     """
-    Whisper 음성 인식 모델을 로드하고 반환합니다.
-    모델은 한 번만 로드되고 캐싱됩니다.
+    Whisper 음성 인식 모델(openai-whisper)을 로드하고 반환합니다.
+    모델은 한 번만 로드되고 캐싱됩니다. STT_BACKEND가 whisper이면 백엔드와 같은 모델을 공유합니다.
     """
     global _whisper_model
+    backend = get_stt_backend()
+    if isinstance(backend, WhisperBackend):
+        return backend.load()
+
     if _whisper_model is None:
-        logger.info("Loading Whisper model...")
-        _whisper_model = whisper.load_model("medium")
-        logger.info("Whisper model loaded.")
+        # 동시에 들어온 첫 요청들이 모델을 중복 로드하지 않도록 잠금
+        with _whisper_model_lock:
+            if _whisper_model is None:
+                model_size = get_setting('STT_MODEL_SIZE', 'medium')
+                logger.info(f"Loading Whisper model ({model_size})...")
+                with track_model_load(f"whisper-{model_size}"):
+                    _whisper_model = optimize_whisper_model(whisper.load_model(model_size))
+                logger.info("Whisper model loaded.")
     return _whisper_model
 
-def transcribe_audio(audio_file_path, language=None):
+def get_stt_backend():
+    """
+    설정(STT_BACKEND)으로 선택된 음성 인식 백엔드를 반환합니다.
+    백엔드는 한 번만 생성되고 캐싱됩니다.
+    """
+    global _stt_backend
+    if _stt_backend is None:
+        with _stt_backend_lock:
+            if _stt_backend is None:
+                _stt_backend = create_stt_backend(
+                    get_setting('STT_BACKEND', 'whisper'),
+                    model_size=get_setting('STT_MODEL_SIZE', 'medium'),
+                    compute_type=get_setting('STT_COMPUTE_TYPE', 'int8'),
+                    cpu_threads=get_setting('STT_CPU_THREADS', 0),
+                    num_workers=get_setting('STT_NUM_WORKERS', 1),
+                    beam_size=get_setting('STT_BEAM_SIZE', 0) or None
+                )
+                logger.info(f"STT 백엔드: {_stt_backend.describe()}")
+    return _stt_backend
+
+def get_stt_batcher():
+    """
+    Whisper 마이크로 배치 스케줄러를 반환합니다.
+    스케줄러는 한 번만 생성되고 캐싱됩니다.
+    """
+    global _stt_batcher
+    if _stt_batcher is None:
+        with _stt_batcher_lock:
+            if _stt_batcher is None:
+                # 백엔드와 모델을 공유하면 백엔드의 직접 인식과 같은 잠금으로 모델 실행을 직렬화
+                backend = get_stt_backend()
+                _stt_batcher = WhisperBatchScheduler(
+                    get_whisper_model,
+                    max_batch_size=get_setting('STT_BATCH_MAX_SIZE', 8),
+                    max_wait_ms=get_setting('STT_BATCH_MAX_WAIT_MS', 15),
+                    inference_lock=backend.inference_lock if isinstance(backend, WhisperBackend) else None
+                )
+    return _stt_batcher
+
+def get_model_manager():
+    """
+    크기별 모델 라우팅 관리자를 반환합니다. STT_ROUTING_ENABLED가 꺼져 있으면 None을 반환합니다.
+    """
+    global _model_manager
+    if not get_setting('STT_ROUTING_ENABLED', False):
+        return None
+    if _model_manager is None:
+        with _model_manager_lock:
+            if _model_manager is None:
+                default_backend = get_stt_backend()
+                escalation_logprob = None
+                if get_setting('STT_ESCALATION_ENABLED', True):
+                    escalation_logprob = get_setting('STT_ESCALATION_LOGPROB', -0.8)
+
+                def create_backend(model_size):
+                    return create_stt_backend(
+                        default_backend.name,
+                        model_size=model_size,
+                        compute_type=default_backend.compute_type,
+                        cpu_threads=default_backend.cpu_threads,
+                        num_workers=default_backend.num_workers,
+                        beam_size=default_backend.beam_size
+                    )
+
+                _model_manager = WhisperModelManager(
+                    default_backend,
+                    create_backend,
+                    memory_budget_mb=get_setting('STT_MODEL_MEMORY_BUDGET_MB', 4096),
+                    routing_rules=parse_routing_rules(get_setting('STT_ROUTING_RULES', 'base:3,small:10')),
+                    quality_sizes=parse_quality_sizes(get_setting('STT_QUALITY_SIZES', 'fast:base,balanced:small')),
+                    escalation_logprob=escalation_logprob
+                )
+    return _model_manager
+
+def _recognize(backend, audio, chunks, language):
     """
-    오디오 파일을 텍스트로 변환합니다.
+    음성 덩어리들을 인식하고 텍스트를 이어 붙입니다.
+    기본 백엔드는 배치 스케줄러가 켜져 있으면 덩어리들을 한 번에 제출하여 같은 배치로 처리합니다.
+    """
+    # 배치 스케줄러는 기본 크기 openai-whisper 모델만 사용 (라우팅된 다른 크기는 직접 인식)
+    use_batcher = (backend is get_stt_backend() and backend.supports_batching
+                   and get_setting('STT_BATCH_ENABLED', False))
+    with tracing.span('stt.recognize', {
+        'stt.backend': backend.name,
+        'stt.model_size': backend.model_size,
+        'stt.chunks': len(chunks),
+        'stt.batched': bool(use_batcher)
+    }) as recognize_span:
+        if use_batcher:
+            batcher = get_stt_batcher()
+            futures = [batcher.submit(audio[start:end], language=language) for start, end in chunks]
+            results = [future.result() for future in futures]
+        else:
+            results = [backend.transcribe(audio[start:end], language=language) for start, end in chunks]
+
+        detected = results[0]["language"]
+        logprobs = [result["avg_logprob"] for result in results if result.get("avg_logprob") is not None]
+        avg_logprob = (sum(logprobs) / len(logprobs)) if logprobs else None
+        recognize_span.set_attributes({'stt.language': detected, 'stt.avg_logprob': avg_logprob})
+    return {
+        'text': join_transcripts([result["text"] for result in results], detected),
+        'language': detected,
+        'avg_logprob': avg_logprob
+    }
+
+def join_transcripts(texts, language):
+    """
+    나누어 인식한 텍스트들을 이어 붙입니다. 일본어/중국어는 공백 없이 이어 붙입니다.
+    """
+    separator = "" if language in ('ja', 'zh') else " "
+    return separator.join(text.strip() for text in texts if text.strip())
+
+def transcribe_audio(audio, language=None, quality=None):
+    """
+    오디오를 텍스트로 변환합니다.
     
     Args:
-        audio_file_path (str): 오디오 파일 경로
+        audio (str | numpy.ndarray): 오디오 파일 경로 또는 16kHz mono float32 배열
         language (str, optional): 언어 코드. 예: "en", "ja"
+        quality (str, optional): 인식 품질 ('fast', 'balanced', 'best'). STT_ROUTING_ENABLED일 때만 사용
         
     Returns:
         dict: 변환 결과
     """
     try:
-        model = get_whisper_model()
-        
-        # 언어가 지정된 경우 해당 언어로 인식, 아니면 자동 감지
-        if language:
-            result = model.transcribe(audio_file_path, language=language)
-        else:
-            result = model.transcribe(audio_file_path)
-            
+        with tracing.span('stt.transcribe', {'stt.requested_language': language, 'stt.quality': quality}) as stt_span:
+            # 파일 경로는 공용 디코더(디코더 풀)로 읽어서 배열로 전달
+            if isinstance(audio, str):
+                audio = load_audio_file(audio)
+            stt_span.set_attribute('audio.seconds', round(len(audio) / SAMPLE_RATE, 2))
+
+            # VAD로 앞뒤/중간의 긴 무음을 잘라내고 음성 구간만 인식 (무음 구간의 환각 텍스트 방지)
+            with tracing.span('stt.vad'):
+                chunks = speech_chunks(audio)
+            if chunks is None:
+                chunks = [(0, len(audio))]
+            elif not chunks:
+                logger.info("VAD: 음성 구간 없음, 인식을 건너뜁니다.")
+                return {'text': '', 'language': language or 'unknown'}
+
+            duration = sum(end - start for start, end in chunks) / SAMPLE_RATE
+            AUDIO_SECONDS.inc(duration, direction='stt_input')
+            stt_span.set_attributes({'stt.speech_seconds': round(duration, 2), 'stt.chunks': len(chunks)})
+
+            manager = get_model_manager()
+            with track_stage('transcribe'):
+                if manager is None:
+                    result = _recognize(get_stt_backend(), audio, chunks, language)
+                else:
+                    # 음성 길이/요청 품질로 모델 크기를 고르고, 작은 모델 결과의 신뢰도가 낮으면 기본 모델로 재인식
+                    # (인식하는 동안에는 해당 모델이 LRU로 해제되지 않음)
+                    model_size = manager.select_size(duration, quality)
+                    with manager.use(model_size) as backend:
+                        result = _recognize(backend, audio, chunks, language)
+                    if manager.should_escalate(model_size, result):
+                        logger.info(f"STT escalation: {model_size} → {manager.default_size} (avg_logprob={result['avg_logprob']:.2f})")
+                        stt_span.set_attribute('stt.escalated_from', model_size)
+                        with manager.use(manager.default_size) as backend:
+                            result = _recognize(backend, audio, chunks, language)
+            stt_span.set_attribute('stt.language', result["language"])
+
         return {
             'text': result["text"],
-            'language': language or result.get("language", "unknown")
+            'language': result["language"]
         }
     except Exception as e:
         logger.error(f"STT Error: {str(e)}")
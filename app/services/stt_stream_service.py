@@ -0,0 +1,318 @@
+import functools
+import json
+import logging
+import socket
+import threading
+import numpy as np
+from config.settings import get_setting
+from app.services.vad_service import SAMPLE_RATE, get_vad
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# WebSocket 경로의 마지막 부분 → 언어 코드
+STREAM_LANGUAGES = {
+    'english': 'en',
+    'japanese': 'ja'
+}
+
+# 클라이언트가 보낼 수 있는 PCM 형식 → numpy dtype, 정규화 스케일
+PCM_FORMATS = {
+    'f32le': (np.dtype('<f4'), 1.0),
+    's16le': (np.dtype('<i2'), 32768.0)
+}
+
+# 프로세스 전역 스트리밍 서버
+_stream_server = None
+_stream_server_lock = threading.Lock()
+
+
+def decode_pcm(data, pcm_format='s16le', sample_rate=SAMPLE_RATE):
+    """
+    클라이언트가 보낸 raw PCM 프레임을 16kHz mono float32로 변환합니다.
+
+    Args:
+        data (bytes): PCM 바이트
+        pcm_format (str): 'f32le' 또는 's16le'
+        sample_rate (int): 입력 샘플링 레이트
+
+    Returns:
+        numpy.ndarray: 16kHz mono float32 배열
+    """
+    dtype, scale = PCM_FORMATS[pcm_format]
+    usable = len(data) - len(data) % dtype.itemsize
+    samples = np.frombuffer(data[:usable], dtype=dtype).astype(np.float32)
+    if scale != 1.0:
+        samples /= scale
+    if sample_rate != SAMPLE_RATE and len(samples):
+        # 브라우저 기본 레이트(44.1/48kHz)를 선형 보간으로 16kHz에 맞춤
+        target_length = int(round(len(samples) * SAMPLE_RATE / sample_rate))
+        positions = np.arange(target_length) * (sample_rate / SAMPLE_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+    return samples
+
+
+class StreamingTranscriber:
+    """
+    실시간으로 들어오는 오디오를 받아 부분(partial) / 확정(final) 인식 결과를 만드는 세션.
+
+    최근 오디오를 롤링 버퍼에 유지하고, 아직 확정되지 않은 구간을 일정 간격으로 다시 디코딩하여 partial을 보냅니다.
+    VAD로 발화 끝(일정 길이 이상의 무음)을 감지하면 해당 구간을 final로 확정하므로,
+    사용자가 말을 멈췄을 때는 마지막 발화 구간만 디코딩하면 됩니다.
+    """
+
+    def __init__(self, transcribe, language=None, vad=None, partial_interval_ms=1000, endpoint_silence_ms=600,
+                 max_segment_seconds=25.0, sample_rate=SAMPLE_RATE):
+        """
+        Args:
+            transcribe (callable): (audio, language) -> {'text', 'language'} 인식 함수
+            language (str, optional): 언어 코드. 없으면 첫 확정 결과의 언어를 이후 구간에 사용
+            vad (EnergyVAD, optional): 음성 구간 검출기
+            partial_interval_ms (float): partial 재디코딩 간격 (새로 들어온 오디오 길이 기준)
+            endpoint_silence_ms (float): 발화 끝으로 판단할 무음 길이
+            max_segment_seconds (float): 확정되지 않은 구간의 최대 길이. 넘으면 강제로 확정
+            sample_rate (int): 샘플링 레이트
+        """
+        self.transcribe = transcribe
+        self.language = language
+        self.vad = vad or get_vad(required=True)
+        self.sample_rate = sample_rate
+        self.partial_interval = int(partial_interval_ms * sample_rate / 1000)
+        self.endpoint_silence = int(endpoint_silence_ms * sample_rate / 1000)
+        self.max_segment = int(max_segment_seconds * sample_rate)
+        # VAD 잡음 수준 추정을 위해 확정된 구간 이전의 오디오도 일부 유지
+        self.history = self.max_segment + 5 * sample_rate
+        # 무음으로 버릴 때 남겨둘 길이 (VAD 최소 발화 길이를 아직 채우지 못한 발화 시작 부분)
+        self.onset_margin = sample_rate // 2
+
+        self.finals = []
+        self.partial = ''
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._offset = 0      # 롤링 버퍼 첫 샘플의 절대 위치
+        self._committed = 0   # 여기까지는 확정(또는 무음으로 버림)된 절대 위치
+        self._last_decode = 0  # 마지막 partial 디코딩 시점의 절대 위치
+
+    @property
+    def total(self):
+        return self._offset + len(self._audio)
+
+    @property
+    def transcript(self):
+        return self._join(self.finals)
+
+    def _join(self, texts):
+        separator = "" if self.language in ('ja', 'zh') else " "
+        return separator.join(text for text in texts if text)
+
+    def _slice(self, start, end):
+        return self._audio[start - self._offset:end - self._offset]
+
+    def _decode(self, start, end):
+        result = self.transcribe(self._slice(start, end), self.language)
+        return result["text"].strip(), result.get("language")
+
+    def _finalize(self, end):
+        start = self._committed
+        text, detected = self._decode(start, end)
+        if self.language is None and detected and detected != 'unknown':
+            self.language = detected
+        self._committed = self._last_decode = end
+        self.partial = ''
+        if not text:
+            return []
+        self.finals.append(text)
+        return [{
+            'type': 'final',
+            'text': text,
+            'start': round(start / self.sample_rate, 2),
+            'end': round(end / self.sample_rate, 2),
+            'transcript': self.transcript
+        }]
+
+    def feed(self, samples):
+        """
+        오디오 프레임을 추가하고, 새로 생긴 인식 이벤트 목록을 반환합니다.
+
+        Returns:
+            list: {'type': 'partial' | 'final', ...} 이벤트 목록
+        """
+        if len(samples) == 0:
+            return []
+        self._audio = np.concatenate((self._audio, np.asarray(samples, dtype=np.float32)))
+        if len(self._audio) > self.history:
+            trim = len(self._audio) - self.history
+            self._audio = self._audio[trim:]
+            self._offset += trim
+
+        # 확정되지 않은 구간과 겹치는 음성 구간 (절대 위치)
+        speech = [
+            (start + self._offset, end + self._offset)
+            for start, end in self.vad.detect(self._audio)
+            if end + self._offset > self._committed
+        ]
+        if not speech:
+            # 음성이 없는 구간은 디코딩하지 않고 버림 (아직 최소 길이에 못 미친 발화 시작 부분은 남겨둠)
+            self._committed = self._last_decode = max(self._committed, self.total - self.onset_margin)
+            return []
+
+        # 발화 시작 전의 무음은 버림
+        self._committed = max(self._committed, speech[0][0])
+        last_end = speech[-1][1]
+
+        if self.total - last_end >= self.endpoint_silence:
+            # 발화가 끝남: 마지막 음성 끝까지 확정
+            return self._finalize(last_end)
+
+        if self.total - self._committed >= self.max_segment:
+            # 발화가 너무 길면 중간의 쉼에서(없으면 현재 위치에서) 강제로 확정
+            cut = speech[-2][1] if len(speech) > 1 else self.total
+            return self._finalize(cut)
+
+        if self.total - self._last_decode >= self.partial_interval:
+            self._last_decode = self.total
+            text, _ = self._decode(self._committed, self.total)
+            if text and text != self.partial:
+                self.partial = text
+                return [{
+                    'type': 'partial',
+                    'text': text,
+                    'transcript': self._join(self.finals + [text])
+                }]
+        return []
+
+    def finish(self):
+        """
+        스트림 종료 시 남은 음성을 확정하고 최종 결과 이벤트를 반환합니다.
+
+        Returns:
+            list: 남은 final 이벤트와 마지막 {'type': 'done'} 이벤트
+        """
+        events = []
+        if self.total > self._committed and self.vad.detect(self._slice(self._committed, self.total)):
+            events = self._finalize(self.total)
+        events.append({
+            'type': 'done',
+            'transcript': self.transcript,
+            'language': self.language or 'unknown',
+            'duration': round(self.total / self.sample_rate, 2)
+        })
+        return events
+
+
+def _send(websocket, event):
+    websocket.send(json.dumps(event, ensure_ascii=False))
+
+
+def _handle_connection(app, websocket):
+    """
+    WebSocket 연결 하나를 처리합니다.
+
+    클라이언트는 raw PCM(mono) 바이너리 프레임을 보내고, 텍스트 프레임으로 제어 메시지를 보냅니다:
+        {"type": "config", "sample_rate": 48000, "format": "f32le" | "s16le"}  (선택, 첫 오디오 전에)
+        {"type": "stop"}  발화 종료. 남은 구간을 확정하고 done 이벤트 후 연결을 닫음
+    """
+    from websockets.exceptions import ConnectionClosed
+    from app.services.stt_service import transcribe_audio
+
+    name = websocket.request.path.split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+    if name not in STREAM_LANGUAGES:
+        websocket.close(1008, f"지원하지 않는 언어입니다: {name}")
+        return
+
+    with app.app_context():
+        session = StreamingTranscriber(
+            lambda audio, language: transcribe_audio(audio, language=language),
+            language=STREAM_LANGUAGES[name],
+            partial_interval_ms=get_setting('STT_STREAM_PARTIAL_INTERVAL_MS', 1000),
+            endpoint_silence_ms=get_setting('STT_STREAM_ENDPOINT_SILENCE_MS', 600),
+            max_segment_seconds=get_setting('STT_STREAM_MAX_SEGMENT_SECONDS', 25.0)
+        )
+        pcm_format = 's16le'
+        sample_rate = SAMPLE_RATE
+
+        try:
+            for message in websocket:
+                if isinstance(message, bytes):
+                    events = session.feed(decode_pcm(message, pcm_format, sample_rate))
+                else:
+                    control = json.loads(message)
+                    if control.get('type') == 'config':
+                        pcm_format = control.get('format', pcm_format)
+                        sample_rate = int(control.get('sample_rate', sample_rate))
+                        if pcm_format not in PCM_FORMATS:
+                            raise ValueError(f"지원하지 않는 PCM 형식입니다: {pcm_format}")
+                        continue
+                    if control.get('type') == 'stop':
+                        for event in session.finish():
+                            _send(websocket, event)
+                        break
+                    continue
+
+                for event in events:
+                    _send(websocket, event)
+        except ConnectionClosed:
+            logger.info("스트리밍 STT 연결이 클라이언트에 의해 종료되었습니다.")
+        except Exception as e:
+            logger.error(f"스트리밍 STT 오류: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            try:
+                _send(websocket, {'type': 'error', 'error': str(e)})
+            except ConnectionClosed:
+                pass
+
+
+def _create_stream_socket(host, port, reuse_port=False):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port and hasattr(socket, 'SO_REUSEPORT'):
+            # prefork 워커들이 각자 같은 포트에서 연결을 받을 수 있도록 함 (커널이 연결을 분산)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(128)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def init_app(app):
+    """
+    STT_STREAM_ENABLED가 켜져 있으면 WebSocket 스트리밍 STT 서버를 백그라운드 스레드에서 시작합니다.
+    Waitress(WSGI)는 WebSocket을 지원하지 않으므로 별도 포트(STT_STREAM_PORT)에서 websockets 서버로 실행합니다.
+    """
+    global _stream_server
+
+    if not app.config.get('STT_STREAM_ENABLED'):
+        return None
+
+    if _stream_server is None:
+        with _stream_server_lock:
+            if _stream_server is None:
+                try:
+                    # 선택 의존성이므로 스트리밍을 사용할 때만 import
+                    from websockets.sync.server import serve
+                except ImportError:
+                    logger.warning("websockets 패키지가 없어 스트리밍 STT 서버를 시작하지 않습니다.")
+                    return None
+
+                host = app.config.get('STT_STREAM_HOST', '0.0.0.0')
+                port = int(app.config.get('STT_STREAM_PORT', 5001))
+                # 포트 공유(SO_REUSEPORT)는 prefork 워커끼리만 사용 (별개의 인스턴스가 조용히 포트를 나눠 쓰지 않도록)
+                reuse_port = int(app.config.get('SERVER_WORKERS', 1)) > 1
+                try:
+                    sock = _create_stream_socket(host, port, reuse_port)
+                except OSError as e:
+                    # 포트가 사용 중이어도 앱 생성은 계속하고 스트리밍 인식만 비활성화
+                    logger.warning(f"스트리밍 STT 서버 포트를 열 수 없어 시작하지 않습니다 ({host}:{port}): {str(e)}")
+                    return None
+                _stream_server = serve(
+                    functools.partial(_handle_connection, app),
+                    sock=sock,
+                    max_size=2 ** 20
+                )
+                threading.Thread(target=_stream_server.serve_forever, name='stt-stream-server', daemon=True).start()
+                logger.info(f"스트리밍 STT 서버 시작: ws://{host}:{port}/talk/stt/stream/<english|japanese>")
+    app.extensions['stt_stream_server'] = _stream_server
+    return _stream_server
\ No newline at end of file
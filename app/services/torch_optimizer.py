@@ -0,0 +1,126 @@
+import contextlib
+import logging
+import os
+import threading
+import torch
+from torch import nn
+from config.settings import get_setting
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 동적 int8 양자화 대상 레이어
+QUANTIZABLE_LAYERS = {nn.Linear, nn.LSTM, nn.LSTMCell}
+
+# 프로세스별 스레드 설정 여부 (interop 스레드 수는 프로세스당 한 번만 설정 가능)
+_threads_configured = False
+_threads_lock = threading.Lock()
+
+
+def configure_torch_threads(num_threads=None, interop_threads=None):
+    """
+    torch 연산 스레드 수를 설정합니다. 프로세스마다 처음 한 번만 적용됩니다.
+
+    Args:
+        num_threads (int, optional): intra-op 스레드 수. 없으면 TORCH_NUM_THREADS,
+            그것도 0이면 CPU 코어 수를 서빙 워커 수(SERVER_WORKERS)로 나눈 값
+        interop_threads (int, optional): inter-op 스레드 수. 없으면 TORCH_INTEROP_THREADS (0이면 변경 안 함)
+    """
+    global _threads_configured
+    if _threads_configured:
+        return
+    with _threads_lock:
+        if _threads_configured:
+            return
+
+        if num_threads is None:
+            num_threads = get_setting('TORCH_NUM_THREADS', 0)
+        if not num_threads:
+            workers = max(1, int(get_setting('SERVER_WORKERS', 1)))
+            num_threads = max(1, (os.cpu_count() or 1) // workers)
+        if interop_threads is None:
+            interop_threads = get_setting('TORCH_INTEROP_THREADS', 0)
+
+        torch.set_num_threads(int(num_threads))
+        if interop_threads:
+            try:
+                torch.set_num_interop_threads(int(interop_threads))
+            except RuntimeError as e:
+                # 이미 병렬 작업이 실행된 뒤에는 변경할 수 없음
+                logger.warning(f"torch interop 스레드 설정 실패: {str(e)}")
+
+        _threads_configured = True
+        logger.info(f"torch 스레드 설정: intra-op={torch.get_num_threads()}, inter-op={torch.get_num_interop_threads()}")
+
+
+def _reset_after_fork():
+    """
+    fork된 자식 프로세스에서 스레드 설정을 다시 적용할 수 있도록 상태를 초기화합니다.
+    """
+    global _threads_configured, _threads_lock
+    _threads_configured = False
+    _threads_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _as_plain_linear(module):
+    """
+    nn.Linear를 상속한 커스텀 레이어(예: Whisper의 Linear)를 nn.Linear로 바꿉니다.
+    quantize_dynamic은 정확한 타입만 매칭하므로 하위 클래스는 양자화되지 않습니다.
+    """
+    for child in module.modules():
+        if isinstance(child, nn.Linear) and type(child) is not nn.Linear:
+            # float32 추론에서는 Whisper Linear.forward와 nn.Linear.forward의 결과가 같음
+            child.__class__ = nn.Linear
+    return module
+
+
+def quantize_model(module, layers=None):
+    """
+    Linear/LSTM 레이어에 동적 int8 양자화를 적용합니다. (CPU 추론 전용)
+
+    Args:
+        module (torch.nn.Module): 양자화할 모델
+        layers (set, optional): 양자화 대상 레이어 타입
+
+    Returns:
+        torch.nn.Module: 양자화된 모델
+    """
+    module = _as_plain_linear(module.cpu().eval())
+    # 복사본을 만들지 않도록 제자리 변환 (로드 시 메모리 최대치 절감)
+    return torch.quantization.quantize_dynamic(module, layers or QUANTIZABLE_LAYERS, dtype=torch.qint8, inplace=True)
+
+
+def inference_mode():
+    """
+    TORCH_INFERENCE_MODE가 켜져 있으면 torch.inference_mode 컨텍스트를 반환합니다.
+    """
+    if get_setting('TORCH_INFERENCE_MODE', True):
+        return torch.inference_mode()
+    return contextlib.nullcontext()
+
+
+def optimize_whisper_model(model):
+    """
+    Whisper 모델 로드 직후 최적화를 적용합니다.
+    """
+    configure_torch_threads()
+    if get_setting('TORCH_QUANTIZE_STT', False) and next(model.parameters()).device.type == 'cpu':
+        logger.info("Whisper 모델 동적 int8 양자화 적용")
+        model = quantize_model(model)
+    return model
+
+
+def optimize_tts_model(tts):
+    """
+    Coqui TTS 모델 로드 직후 최적화를 적용합니다. (Tacotron2 본체만 양자화, 보코더는 Conv 위주라 제외)
+    """
+    configure_torch_threads()
+    if get_setting('TORCH_QUANTIZE_TTS', False):
+        synthesizer = tts.synthesizer
+        logger.info("TTS 모델 동적 int8 양자화 적용")
+        synthesizer.tts_model = quantize_model(synthesizer.tts_model)
+    return tts
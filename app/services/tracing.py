@@ -0,0 +1,377 @@
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# OTLP span kind / status code
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# W3C traceparent 헤더: version-trace_id-parent_id-flags
+TRACEPARENT_PATTERN = re.compile(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$')
+
+# 추적하지 않는 엔드포인트 (수집/헬스 체크용)
+UNTRACED_ENDPOINTS = {'static', 'utility.metrics', 'utility.ready', 'utility.list_traces', 'utility.get_trace'}
+
+# 현재 실행 중인 span (요청 스레드 / asyncio 태스크별)
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+# 프로세스 전역 tracer
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class Span:
+    """
+    추적 구간 하나. 시작/종료 시각과 속성(오디오 길이, 토큰 수, 캐시 적중 등)을 기록합니다.
+    """
+
+    def __init__(self, trace, name, parent_id=None, kind=SPAN_KIND_INTERNAL, attributes=None):
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = {}
+        self.status_code = STATUS_UNSET
+        self.status_message = None
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.set_attributes(attributes or {})
+
+    def set_attribute(self, key, value):
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_error(self, error):
+        self.status_code = STATUS_ERROR
+        self.status_message = str(error)
+        self.attributes['exception.type'] = type(error).__name__
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.trace.add(self)
+
+    @property
+    def duration_ms(self):
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self):
+        span = {
+            'traceId': self.trace.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns),
+            'attributes': [{'key': key, 'value': _otlp_value(value)} for key, value in self.attributes.items()],
+            'status': {'code': self.status_code}
+        }
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+        if self.status_message:
+            span['status']['message'] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    """
+    추적 중이 아닐 때(백그라운드 스레드, 비활성화) 사용하는 빈 span.
+    """
+
+    span_id = None
+    attributes = {}
+    duration_ms = 0.0
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, attributes):
+        pass
+
+    def record_error(self, error):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """
+    요청 하나의 span 모음. 루트 span이 끝나면 exporter로 내보냅니다.
+    """
+
+    def __init__(self, trace_id=None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_otlp(self, service_name):
+        """
+        OTLP/JSON ExportTraceServiceRequest 형식으로 변환합니다.
+        """
+        with self._lock:
+            spans = [span.to_otlp() for span in self.spans]
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': service_name}}]},
+                'scopeSpans': [{'scope': {'name': __name__}, 'spans': spans}]
+            }]
+        }
+
+
+class InMemoryExporter:
+    """
+    최근 trace를 메모리에 보관합니다. (/talk/traces로 조회)
+    """
+
+    def __init__(self, max_traces=200):
+        self._traces = deque(maxlen=max(1, int(max_traces)))
+        self._lock = threading.Lock()
+
+    def export(self, root, payload):
+        with self._lock:
+            self._traces.append({
+                'trace_id': root.trace.trace_id,
+                'name': root.name,
+                'start_time': root.start_ns / 1e9,
+                'duration_ms': round(root.duration_ms, 1),
+                'status': root.attributes.get('http.status_code'),
+                'payload': payload
+            })
+
+    def recent(self, limit=50, min_duration_ms=0):
+        with self._lock:
+            traces = list(self._traces)
+        traces = [trace for trace in reversed(traces) if trace['duration_ms'] >= min_duration_ms]
+        return [{key: value for key, value in trace.items() if key != 'payload'} for trace in traces[:limit]]
+
+    def get(self, trace_id):
+        with self._lock:
+            for trace in self._traces:
+                if trace['trace_id'] == trace_id:
+                    return trace['payload']
+        return None
+
+
+class OTLPFileExporter:
+    """
+    trace를 한 줄에 하나씩 OTLP/JSON으로 파일에 추가합니다. (otel-collector의 otlpjsonfile receiver 등으로 재생 가능)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, root, payload):
+        line = json.dumps(payload, ensure_ascii=False) + '\n'
+        with self._lock:
+            # 한 번의 write로 기록하여 prefork 워커들이 같은 파일에 추가해도 줄이 섞이지 않도록 함
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class Tracer:
+    """
+    요청 trace를 시작/종료하고, 일정 시간 이상 걸린 trace를 exporter로 내보냅니다.
+    """
+
+    def __init__(self, exporters, service_name='talk', min_duration_ms=0):
+        self.exporters = exporters
+        self.service_name = service_name
+        self.min_duration_ms = float(min_duration_ms)
+
+    def start_trace(self, name, trace_id=None, parent_id=None, attributes=None):
+        """
+        루트 span을 시작하고 현재 span으로 설정합니다.
+
+        Returns:
+            tuple: (루트 span, end_trace에 넘길 토큰)
+        """
+        root = Span(Trace(trace_id), name, parent_id, SPAN_KIND_SERVER, attributes)
+        return root, _current_span.set(root)
+
+    def end_trace(self, root, token, error=None):
+        if error is not None:
+            root.record_error(error)
+        root.end()
+        _reset(token, None)
+
+        if root.duration_ms < self.min_duration_ms:
+            return
+        try:
+            payload = root.trace.to_otlp(self.service_name)
+            for exporter in self.exporters:
+                exporter.export(root, payload)
+        except Exception as e:
+            # 추적 실패가 요청 처리에 영향을 주지 않도록 함
+            logger.error(f"Trace 내보내기 실패: {str(e)}")
+
+    def get_exporter(self, exporter_type):
+        for exporter in self.exporters:
+            if isinstance(exporter, exporter_type):
+                return exporter
+        return None
+
+
+def _reset(token, fallback):
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # 제너레이터가 다른 컨텍스트에서 닫힌 경우
+        _current_span.set(fallback)
+
+
+def get_tracer():
+    """
+    설정된 tracer를 반환합니다. TRACING_ENABLED가 꺼져 있으면 None.
+    """
+    return _tracer
+
+
+def current_span():
+    """
+    현재 span을 반환합니다. 추적 중이 아니면 아무것도 기록하지 않는 span.
+    """
+    return _current_span.get() or NOOP_SPAN
+
+
+def current_trace_id():
+    active = _current_span.get()
+    return active.trace.trace_id if active is not None else None
+
+
+@contextlib.contextmanager
+def span(name, attributes=None):
+    """
+    현재 span의 자식 span을 기록합니다. 요청 trace 밖(백그라운드 워밍업 등)에서는 아무것도 기록하지 않습니다.
+
+    Args:
+        name (str): span 이름 (예: 'stt.transcribe')
+        attributes (dict, optional): 시작 시 기록할 속성
+
+    Yields:
+        Span: 속성을 추가로 기록할 수 있는 span
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield NOOP_SPAN
+        return
+
+    child = Span(parent.trace, name, parent.span_id, attributes=attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            child.record_error(e)
+        raise
+    finally:
+        child.end()
+        _reset(token, parent)
+
+
+def _parse_traceparent(header):
+    match = TRACEPARENT_PATTERN.match((header or '').strip().lower())
+    if not match or match.group(1) == '0' * 32:
+        return None, None
+    return match.group(1), match.group(2)
+
+
+def init_app(app):
+    """
+    TRACING_ENABLED가 켜져 있으면 요청마다 trace를 시작하는 훅을 등록합니다.
+    trace ID는 traceparent 헤더를 이어받거나 새로 생성하며, 응답의 X-Trace-Id 헤더로 반환합니다.
+    """
+    global _tracer
+
+    if not app.config.get('TRACING_ENABLED'):
+        return None
+
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                exporters = []
+                for name in app.config.get('TRACING_EXPORTERS', 'memory').split(','):
+                    name = name.strip()
+                    if name == 'memory':
+                        exporters.append(InMemoryExporter(app.config.get('TRACING_MEMORY_MAX_TRACES', 200)))
+                    elif name == 'file':
+                        exporters.append(OTLPFileExporter(app.config.get('TRACING_FILE_PATH', 'traces/traces.jsonl')))
+                    elif name:
+                        logger.warning(f"알 수 없는 trace exporter입니다: {name}")
+                _tracer = Tracer(
+                    exporters,
+                    service_name=app.config.get('TRACING_SERVICE_NAME', 'talk'),
+                    min_duration_ms=app.config.get('TRACING_MIN_DURATION_MS', 0)
+                )
+    tracer = _tracer
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_request_trace():
+        if request.endpoint in UNTRACED_ENDPOINTS:
+            return
+        trace_id, parent_id = _parse_traceparent(request.headers.get('traceparent'))
+        route = request.url_rule.rule if request.url_rule is not None else request.path
+        g._trace = tracer.start_trace(f"{request.method} {route}", trace_id, parent_id, {
+            'http.method': request.method,
+            'http.route': route,
+            'http.target': request.full_path.rstrip('?')
+        })
+
+    @app.after_request
+    def _annotate_response(response):
+        started = g.get('_trace')
+        if started is not None:
+            started[0].set_attribute('http.status_code', response.status_code)
+            response.headers['X-Trace-Id'] = started[0].trace.trace_id
+            if response.is_streamed:
+                # SSE / 파일 응답은 teardown 이후에 본문을 생성하므로 전송이 끝날 때(연결 종료) trace를 종료
+                g.pop('_trace')
+                response.call_on_close(lambda: tracer.end_trace(*started))
+        return response
+
+    @app.teardown_request
+    def _end_request_trace(exc):
+        started = g.pop('_trace', None)
+        if started is not None:
+            tracer.end_trace(started[0], started[1], exc)
+
+    app.extensions['tracer'] = tracer
+    return tracer
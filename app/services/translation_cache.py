@@ -0,0 +1,197 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from app.services.tts_cache import normalize_text
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """
+    GPT 번역 결과의 정확 일치(exact-match) 캐시.
+
+    1단계: 프로세스 내 LRU (OrderedDict)
+    2단계: 재시작 후에도 유지되는 로컬 SQLite 저장소 (여러 워커 프로세스가 공유)
+
+    키에는 프롬프트 버전이 포함되며, 프롬프트 템플릿이 바뀌면 이전 버전 항목은 시작 시 삭제됩니다.
+    SQLite 파일을 열 수 없으면(읽기 전용 볼륨 등) 메모리 캐시로만 동작합니다.
+    """
+
+    def __init__(self, db_path, prompt_version, max_memory_entries=2048, ttl_seconds=7 * 24 * 3600):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로
+            prompt_version (str): 현재 번역 프롬프트 버전
+            max_memory_entries (int): 메모리 LRU 최대 항목 수
+            ttl_seconds (float): 항목 유효 기간(초). 0 이하이면 만료 없음
+        """
+        self.db_path = db_path
+        self.prompt_version = prompt_version
+        self.max_memory_entries = max(0, int(max_memory_entries))
+        self.ttl_seconds = float(ttl_seconds)
+
+        self._memory = OrderedDict()  # key -> (result, expires_at)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._conn = None
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "key TEXT PRIMARY KEY, prompt_version TEXT NOT NULL, result TEXT NOT NULL, expires_at REAL)"
+                )
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            # 디스크 저장소를 열 수 없어도 번역은 계속 진행 (메모리 캐시로만 동작)
+            logger.warning(f"번역 캐시 저장소를 열 수 없어 메모리 캐시로만 동작합니다: {self.db_path} ({str(e)})")
+            return
+        self._purge_stale()
+
+    @staticmethod
+    def make_key(text, source_language, target_language, model, prompt_version):
+        """
+        정규화된 (텍스트, 소스 언어, 대상 언어, 모델, 프롬프트 버전)으로 캐시 키를 생성합니다.
+        """
+        payload = json.dumps([
+            normalize_text(text),
+            source_language,
+            target_language,
+            model,
+            prompt_version
+        ], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def key_for(self, text, source_language, target_language, model):
+        return self.make_key(text, source_language, target_language, model, self.prompt_version)
+
+    def get(self, key):
+        """
+        캐시된 번역 결과(dict)를 반환합니다. 없거나 만료되었으면 None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return dict(result)
+                del self._memory[key]
+
+            if self._conn is None:
+                self.misses += 1
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT result, expires_at FROM translations WHERE key = ? AND prompt_version = ?",
+                    (key, self.prompt_version)
+                ).fetchone()
+            except sqlite3.Error as e:
+                # 디스크 조회 실패(잠금, 손상 등)는 캐시 미스로 처리하여 번역은 계속 진행
+                logger.warning(f"번역 캐시 조회 실패: {str(e)}")
+                self.misses += 1
+                return None
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return None
+
+            result = json.loads(row[0])
+            self._remember_locked(key, result, row[1])
+            self.disk_hits += 1
+            return dict(result)
+
+    def put(self, key, result):
+        """
+        번역 결과를 메모리와 디스크에 저장합니다.
+        """
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        with self._lock:
+            self._remember_locked(key, result, expires_at)
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO translations (key, prompt_version, result, expires_at) VALUES (?, ?, ?, ?)",
+                        (key, self.prompt_version, json.dumps(result, ensure_ascii=False), expires_at)
+                    )
+            except sqlite3.Error as e:
+                # 디스크 저장 실패는 메모리 캐시로만 동작
+                logger.warning(f"번역 캐시 저장 실패: {str(e)}")
+
+    def invalidate(self):
+        """
+        모든 캐시 항목을 삭제합니다.
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM translations")
+            except sqlite3.Error as e:
+                logger.warning(f"번역 캐시 삭제 실패: {str(e)}")
+
+    def stats(self):
+        """
+        캐시 적중률 등 통계를 반환합니다.
+        """
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            # 디스크 저장소가 없거나 조회에 실패하면 disk_entries는 None
+            disk_entries = None
+            if self._conn is not None:
+                try:
+                    disk_entries = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+                except sqlite3.Error as e:
+                    logger.warning(f"번역 캐시 통계 조회 실패: {str(e)}")
+            return {
+                'prompt_version': self.prompt_version,
+                'memory_entries': len(self._memory),
+                'disk_entries': disk_entries,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (hits / total) if total else 0.0
+            }
+
+    def _remember_locked(self, key, result, expires_at):
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[key] = (result, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _purge_stale(self):
+        try:
+            with self._lock, self._conn:
+                # 프롬프트 템플릿이 바뀐 이전 버전 항목과 만료된 항목 삭제
+                deleted = self._conn.execute(
+                    "DELETE FROM translations WHERE prompt_version != ? OR (expires_at IS NOT NULL AND expires_at <= ?)",
+                    (self.prompt_version, time.time())
+                ).rowcount
+        except sqlite3.Error as e:
+            # 다른 워커가 잠근 경우 등은 다음 시작 때 정리 (조회 시 prompt_version으로 걸러지므로 결과에는 영향 없음)
+            logger.warning(f"번역 캐시 정리 실패: {str(e)}")
+            return
+        if deleted:
+            logger.info(f"번역 캐시 정리: {deleted}개 항목 삭제 (prompt_version={self.prompt_version})")
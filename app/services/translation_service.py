@@ -1,9 +1,37 @@
 import logging
-from app.services.gpt_service import GPTService
+import threading
+from config.settings import get_setting
+from app.services.gpt_client_registry import get_gpt_service
+from app.services.gpt_service import get_translation_prompt_version
+from app.services.translation_cache import TranslationCache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 번역 결과 캐시
+_translation_cache = None
+_translation_cache_lock = threading.Lock()
+
+def get_translation_cache():
+    """
+    번역 캐시를 반환합니다. 캐시가 꺼져 있으면 None을 반환합니다.
+    """
+    global _translation_cache
+    if not get_setting('TRANSLATION_CACHE_ENABLED', False):
+        return None
+    if _translation_cache is None:
+        with _translation_cache_lock:
+            if _translation_cache is None:
+                # 프롬프트 템플릿 해시 + 수동 버전으로 무효화
+                prompt_version = f"{get_translation_prompt_version()}-{get_setting('TRANSLATION_CACHE_VERSION', '1')}"
+                _translation_cache = TranslationCache(
+                    get_setting('TRANSLATION_CACHE_PATH'),
+                    prompt_version,
+                    max_memory_entries=get_setting('TRANSLATION_CACHE_MEMORY_ENTRIES', 2048),
+                    ttl_seconds=get_setting('TRANSLATION_CACHE_TTL', 7 * 24 * 3600)
+                )
+    return _translation_cache
+
 def translate_text(text, source_language, target_language):
     """
     텍스트를 소스 언어에서 대상 언어로 번역합니다.
@@ -17,12 +45,28 @@ def translate_text(text, source_language, target_language):
         str: 번역된 텍스트
     """
     try:
-        # GPT 서비스 초기화
-        gpt_service = GPTService()
+        # 프로세스 전역 GPT 서비스 사용 (keep-alive 연결 재사용)
+        gpt_service = get_gpt_service()
+        
+        # 캐시에 같은 번역이 있으면 바로 반환
+        cache = get_translation_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key_for(text, source_language, target_language, gpt_service.model)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached["translated_text"]
         
         # 번역 요청
         response = gpt_service.get_translation(text, source_language, target_language)
         
+        # 번역 결과 캐시에 저장
+        if cache is not None:
+            cache.put(cache_key, {
+                "translated_text": response["translated_text"],
+                "model": response["model"]
+            })
+        
         # 번역 결과 반환
         return response["translated_text"]
         
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text):
+    """
+    캐시 키 생성을 위해 텍스트를 정규화합니다. (유니코드 NFKC, 공백 정리)
+    """
+    text = unicodedata.normalize('NFKC', text or "")
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class TTSAudioCache:
+    """
+    콘텐츠 주소 기반 TTS 오디오 디스크 캐시.
+
+    (정규화된 텍스트, 언어, 모델 이름, 보코더 설정)의 해시를 키로 WAV 파일을 저장하고,
+    전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    파일은 임시 파일에 먼저 쓴 뒤 os.replace로 교체하므로 여러 워커가 동시에 써도 항목이 깨지지 않습니다.
+    여러 워커 프로세스가 같은 디렉토리를 공유하므로, 저장할 때마다 디렉토리를 다시 읽어 전체 크기를 맞춘 뒤 삭제합니다.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        """
+        Args:
+            cache_dir (str): 캐시 디렉토리
+            max_bytes (int): 캐시 전체 크기 상한(바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_bytes)
+        self._index = OrderedDict()  # key -> 파일 크기 (앞쪽이 가장 오래 전에 사용됨)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(text, language, model_name, vocoder_name=None, **settings):
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            text (str): 합성할 텍스트 (전처리 후)
+            language (str): 언어 코드
+            model_name (str): TTS 모델 이름
+            vocoder_name (str, optional): 보코더 모델 이름
+            **settings: 출력에 영향을 주는 기타 합성 설정
+
+        Returns:
+            str: sha256 16진수 키
+        """
+        payload = json.dumps({
+            'text': normalize_text(text),
+            'language': language,
+            'model': model_name,
+            'vocoder': vocoder_name,
+            'settings': settings
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    def copy_to(self, key, dest_path):
+        """
+        캐시된 오디오 파일을 dest_path로 복사합니다.
+
+        Args:
+            key (str): 캐시 키
+            dest_path (str): 복사할 경로
+
+        Returns:
+            bool: 복사했으면 True, 캐시에 없거나 복사 중 다른 워커가 항목을 삭제했으면 False (캐시 미스)
+        """
+        path = self.path_for(key)
+        try:
+            shutil.copyfile(path, dest_path)
+        except OSError as e:
+            if os.path.exists(path):
+                logger.warning(f"TTS 캐시 파일 복사 실패: {str(e)}")
+            with self._lock:
+                # 다른 프로세스가 삭제한 항목은 인덱스에서도 제거
+                if key in self._index and not os.path.exists(path):
+                    self._total_bytes -= self._index.pop(key)
+                self.misses += 1
+            return False
+
+        # 복사가 끝난 뒤에만 적중으로 집계
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+            else:
+                # 다른 프로세스가 추가한 항목
+                size = os.path.getsize(dest_path)
+                self._index[key] = size
+                self._total_bytes += size
+            self.hits += 1
+
+        # 재시작 후나 다른 워커에서도 LRU 순서를 유지하도록 수정 시간 갱신
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return True
+
+    def put(self, key, source_path):
+        """
+        오디오 파일을 캐시에 원자적으로 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            source_path (str): 저장할 WAV 파일 경로
+
+        Returns:
+            str: 캐시된 파일 경로
+        """
+        path = self.path_for(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as dst, open(source_path, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            # 이 프로세스의 인덱스에는 다른 워커가 추가한 항목이 빠져 있으므로 디렉토리 기준으로 다시 맞춘 뒤 삭제
+            self._scan_locked()
+            self._evict_locked()
+        return path
+
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._index),
+                'size_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / total) if total else 0.0
+            }
+
+    def _load_index(self):
+        with self._lock:
+            self._scan_locked(clean_temp=True)
+            self._evict_locked()
+        logger.info(f"TTS 캐시 로드: entries={len(self._index)}, size={self._total_bytes} bytes")
+
+    def _scan_locked(self, clean_temp=False):
+        """
+        캐시 디렉토리를 다시 읽어 인덱스(수정 시간 순)와 전체 크기를 맞춥니다.
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.tmp'):
+                    # 중단된 쓰기 작업의 잔여 파일 정리 (다른 워커가 쓰는 중인 파일은 건드리지 않음)
+                    if clean_temp:
+                        try:
+                            if time.time() - entry.stat().st_mtime > 3600:
+                                os.unlink(entry.path)
+                        except OSError:
+                            pass
+                    continue
+                if not entry.name.endswith('.wav'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+
+        self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._total_bytes = sum(self._index.values())
+
+    def _evict_locked(self):
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.unlink(self.path_for(key))
+            except OSError:
+                pass
@@ -0,0 +1,139 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def _init_worker(threads_per_worker):
+    """
+    워커 프로세스 초기화. 워커끼리 코어를 나눠 쓰도록 torch 스레드 수를 제한합니다.
+    """
+    from app.services.torch_optimizer import configure_torch_threads
+    configure_torch_threads(max(1, int(threads_per_worker)), 1)
+
+
+def _synthesize_in_worker(sentence, language):
+    """
+    워커 프로세스에서 한 문장을 합성합니다. 모델은 워커마다 한 번만 로드됩니다.
+
+    Returns:
+        tuple: (float32 파형 numpy 배열, 샘플링 레이트)
+    """
+    from app.services.tts_service import get_tts_model, prepare_text
+    from app.services.torch_optimizer import inference_mode
+
+    model = get_tts_model(language)
+    with inference_mode():
+        wav = model.tts(text=prepare_text(sentence, language))
+    return np.asarray(wav, dtype=np.float32), model.synthesizer.output_sample_rate
+
+
+def concatenate_with_silence(wavs, sample_rate, silence_samples, fade_ms=10):
+    """
+    문장별 파형을 순서대로 이어 붙이고, 직렬 합성 / 스트리밍과 같이 문장 사이에 무음을 넣습니다.
+    무음과 맞닿는 문장 끝과 시작에만 짧은 선형 페이드를 적용해 경계에서 튀는 소리를 막습니다.
+
+    Args:
+        wavs (list): float32 파형 목록
+        sample_rate (int): 샘플링 레이트
+        silence_samples (int): 문장 사이 무음 길이 (샘플 수)
+        fade_ms (float): 문장 경계 페이드 길이(ms)
+
+    Returns:
+        numpy.ndarray: 합쳐진 float32 파형
+    """
+    wavs = [np.asarray(w, dtype=np.float32) for w in wavs if len(w)]
+    if not wavs:
+        return np.zeros(0, dtype=np.float32)
+
+    fade = int(sample_rate * fade_ms / 1000)
+    silence = np.zeros(int(silence_samples), dtype=np.float32)
+    parts = []
+    for index, wav in enumerate(wavs):
+        n = min(fade, len(wav) // 2)
+        if n > 0 and len(wavs) > 1:
+            ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+            wav = wav.copy()
+            if index > 0:
+                wav[:n] *= ramp
+            if index < len(wavs) - 1:
+                wav[-n:] *= ramp[::-1]
+        if index > 0:
+            parts.append(silence)
+        parts.append(wav)
+    return np.concatenate(parts)
+
+
+class TTSProcessPool:
+    """
+    문장 단위 병렬 TTS 합성 엔진.
+
+    각 워커 프로세스가 자체 TTS 모델을 들고 있으며, 긴 입력은 문장 경계에서 나뉘어
+    워커들에 분산된 뒤 원래 순서대로 문장 사이 무음을 넣어 이어 붙여집니다.
+    """
+
+    def __init__(self, num_workers=2, threads_per_worker=1, silence_samples=10000, fade_ms=10):
+        """
+        Args:
+            num_workers (int): 워커 프로세스 수
+            threads_per_worker (int): 워커별 torch 스레드 수
+            silence_samples (int): 문장 사이 무음 길이 (샘플 수)
+            fade_ms (float): 문장 경계 페이드 길이(ms)
+        """
+        self.num_workers = max(1, int(num_workers))
+        self.threads_per_worker = max(1, int(threads_per_worker))
+        self.silence_samples = int(silence_samples)
+        self.fade_ms = float(fade_ms)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        워커 프로세스 풀을 시작합니다.
+        """
+        with self._lock:
+            if self._executor is not None:
+                return
+            # torch가 로드된 부모 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.threads_per_worker,)
+            )
+        logger.info(f"TTS 프로세스 풀 시작: workers={self.num_workers}, threads_per_worker={self.threads_per_worker}")
+
+    def synthesize(self, sentences, language="en"):
+        """
+        문장 목록을 워커들에 나눠 합성하고 하나의 파형으로 합칩니다.
+
+        Args:
+            sentences (list): 합성할 문장 목록
+            language (str): 언어 코드
+
+        Returns:
+            tuple: (float32 파형 numpy 배열, 샘플링 레이트)
+        """
+        self.start()
+
+        futures = [self._executor.submit(_synthesize_in_worker, sentence, language) for sentence in sentences]
+        results = [future.result() for future in futures]
+
+        sample_rate = results[0][1] if results else 22050
+        wav = concatenate_with_silence([r[0] for r in results], sample_rate, self.silence_samples, self.fade_ms)
+        return wav, sample_rate
+
+    def shutdown(self):
+        """
+        워커 프로세스를 종료합니다.
+        """
+        with self._lock:
+            if self._executor is None:
+                return
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        logger.info("TTS 프로세스 풀 종료")
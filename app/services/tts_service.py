@@ -1,15 +1,55 @@
 from TTS.api import TTS
 import logging
 import os
+import re
+import struct
+import threading
+import wave
+import numpy as np
 from flask import current_app
 import tempfile
+from config.settings import get_setting
+from app.services.tts_cache import TTSAudioCache
+from app.services.tts_pool import TTSProcessPool
+from app.services.torch_optimizer import inference_mode, optimize_tts_model
+from app.services.metrics import AUDIO_SECONDS, track_model_load, track_stage
+from app.services import tracing
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 언어별 TTS 모델과 기본 보코더 (캐시 키에 사용)
+TTS_MODEL_NAMES = {
+    "en": "tts_models/en/ljspeech/tacotron2-DDC",
+    "ja": "tts_models/ja/kokoro/tacotron2-DDC"
+}
+TTS_VOCODER_NAMES = {
+    "en": "vocoder_models/en/ljspeech/hifigan_v2",
+    "ja": "vocoder_models/ja/kokoro/hifigan_v1"
+}
+
 # 전역 변수로 모델 캐싱
 _tts_en_model = None
 _tts_ja_model = None
+_tts_en_model_lock = threading.Lock()
+_tts_ja_model_lock = threading.Lock()
+
+# TTS 오디오 캐시
+_tts_cache = None
+_tts_cache_lock = threading.Lock()
+
+# 문장 단위 병렬 합성 프로세스 풀
+_tts_pool = None
+_tts_pool_lock = threading.Lock()
+
+# 문장 분리 기준 (영어/일본어 문장 종결 부호)
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?。！？])\s+|(?<=[。！？])|\n+')
+
+# 문장 끝으로 보지 않을 약어
+_ABBREVIATIONS = ('Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'St.', 'vs.', 'e.g.', 'i.e.', 'etc.')
+
+# Coqui Synthesizer와 동일한 문장 간 무음 길이 (샘플 수)
+SENTENCE_SILENCE_SAMPLES = 10000
 
 def get_tts_en_model():
     """
@@ -18,9 +58,12 @@ def get_tts_en_model():
     """
     global _tts_en_model
     if _tts_en_model is None:
-        logger.info("Loading English TTS model...")
-        _tts_en_model = TTS("tts_models/en/ljspeech/tacotron2-DDC")
-        logger.info("English TTS model loaded.")
+        with _tts_en_model_lock:
+            if _tts_en_model is None:
+                logger.info("Loading English TTS model...")
+                with track_model_load("tts-en"):
+                    _tts_en_model = optimize_tts_model(TTS(TTS_MODEL_NAMES["en"]))
+                logger.info("English TTS model loaded.")
     return _tts_en_model
 
 def get_tts_ja_model():
@@ -30,11 +73,199 @@ def get_tts_ja_model():
     """
     global _tts_ja_model
     if _tts_ja_model is None:
-        logger.info("Loading Japanese TTS model...")
-        _tts_ja_model = TTS("tts_models/ja/kokoro/tacotron2-DDC")
-        logger.info("Japanese TTS model loaded.")
+        with _tts_ja_model_lock:
+            if _tts_ja_model is None:
+                logger.info("Loading Japanese TTS model...")
+                with track_model_load("tts-ja"):
+                    _tts_ja_model = optimize_tts_model(TTS(TTS_MODEL_NAMES["ja"]))
+                logger.info("Japanese TTS model loaded.")
     return _tts_ja_model
 
+def get_tts_cache():
+    """
+    TTS 오디오 캐시를 반환합니다. 캐시가 꺼져 있으면 None을 반환합니다.
+    """
+    global _tts_cache
+    if not get_setting('TTS_CACHE_ENABLED', False):
+        return None
+    if _tts_cache is None:
+        with _tts_cache_lock:
+            if _tts_cache is None:
+                _tts_cache = TTSAudioCache(
+                    get_setting('TTS_CACHE_DIR'),
+                    max_bytes=int(get_setting('TTS_CACHE_MAX_MB', 512)) * 1024 * 1024
+                )
+    return _tts_cache
+
+def get_tts_cache_key(text, language="en"):
+    """
+    전처리된 텍스트와 언어, 모델/보코더 이름, 출력에 영향을 주는 설정(양자화 여부)으로 캐시 키를 생성합니다.
+    """
+    model_language = language if language in TTS_MODEL_NAMES else "en"
+    return TTSAudioCache.make_key(
+        text,
+        model_language,
+        TTS_MODEL_NAMES[model_language],
+        TTS_VOCODER_NAMES[model_language],
+        format="wav",
+        quantized=bool(get_setting('TORCH_QUANTIZE_TTS', False))
+    )
+
+def get_tts_pool():
+    """
+    문장 단위 병렬 합성 프로세스 풀을 반환합니다. 병렬 합성이 꺼져 있으면 None을 반환합니다.
+    """
+    global _tts_pool
+    if not get_setting('TTS_PARALLEL_ENABLED', False):
+        return None
+    if _tts_pool is None:
+        with _tts_pool_lock:
+            if _tts_pool is None:
+                _tts_pool = TTSProcessPool(
+                    num_workers=get_setting('TTS_PARALLEL_WORKERS', 2),
+                    threads_per_worker=get_setting('TTS_PARALLEL_THREADS_PER_WORKER', 1),
+                    silence_samples=SENTENCE_SILENCE_SAMPLES,
+                    fade_ms=get_setting('TTS_CROSSFADE_MS', 10)
+                )
+    return _tts_pool
+
+def get_tts_model(language="en"):
+    """
+    언어에 맞는 TTS 모델을 반환합니다. 지원하지 않는 언어는 영어 모델을 사용합니다.
+    """
+    if language == "ja":
+        return get_tts_ja_model()
+    return get_tts_en_model()
+
+def get_output_sample_rate(language="en"):
+    """
+    언어별 TTS 모델의 출력 샘플링 레이트를 반환합니다.
+    """
+    return get_tts_model(language).synthesizer.output_sample_rate
+
+def prepare_text(text, language="en"):
+    """
+    TTS 입력 텍스트를 전처리합니다. 짧은 텍스트에는 문장 종결 부호를 붙입니다.
+    """
+    if language == "en":
+        if len(text.split()) < 5 and not text.strip().endswith(('.', '!', '?')):
+            text = text + "."
+    elif language == "ja":
+        if len(text.split()) < 5 and not text.strip().endswith(('.', '!', '?', '。', '！', '？')):
+            text = text + "。"
+    return text
+
+def split_sentences(text, language="en"):
+    """
+    텍스트를 문장 단위로 분리합니다. 영어(. ! ?)와 일본어(。！？) 종결 부호를 모두 처리합니다.
+
+    Args:
+        text (str): 분리할 텍스트
+        language (str): 언어 코드
+
+    Returns:
+        list: 문장 목록 (빈 문장 제외)
+    """
+    sentences = [s.strip() for s in _SENTENCE_END_RE.split(text or "")]
+    sentences = [s for s in sentences if s]
+
+    # 종결 부호만 남은 조각과 약어 뒤에서 잘린 조각은 앞 문장에 붙임
+    merged = []
+    for sentence in sentences:
+        if merged and not re.search(r'\w', sentence):
+            merged[-1] += sentence
+        elif merged and merged[-1].endswith(_ABBREVIATIONS):
+            merged[-1] += " " + sentence
+        else:
+            merged.append(sentence)
+    return merged
+
+def to_pcm16(wav):
+    """
+    float 파형을 16bit PCM 바이트로 변환합니다.
+    """
+    samples = np.clip(np.asarray(wav, dtype=np.float32), -1.0, 1.0)
+    return (samples * 32767).astype('<i2').tobytes()
+
+def streaming_wav_header(sample_rate, channels=1, bits_per_sample=16):
+    """
+    길이를 알 수 없는 스트리밍용 WAV 헤더를 만듭니다. (RIFF/data 크기를 최대값으로 설정)
+    """
+    byte_rate = sample_rate * channels * bits_per_sample // 8
+    block_align = channels * bits_per_sample // 8
+    data_size = 0xFFFFFFFF - 36
+    return (
+        b'RIFF' + struct.pack('<I', 0xFFFFFFFF) + b'WAVE'
+        + b'fmt ' + struct.pack('<IHHIIHH', 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample)
+        + b'data' + struct.pack('<I', data_size)
+    )
+
+def synthesize_sentences(text, language="en"):
+    """
+    텍스트를 문장 단위로 합성하며 파형을 하나씩 반환하는 제너레이터입니다.
+    첫 문장의 합성이 끝나는 즉시 첫 오디오를 사용할 수 있습니다.
+
+    Args:
+        text (str): 변환할 텍스트
+        language (str): 언어 코드 (en: 영어, ja: 일본어)
+
+    Yields:
+        tuple: (문장, float32 파형 numpy 배열)
+    """
+    model = get_tts_model(language)
+    for sentence in split_sentences(text, language):
+        with inference_mode():
+            wav = model.tts(text=prepare_text(sentence, language))
+        yield sentence, np.asarray(wav, dtype=np.float32)
+
+def write_wav(path, wav, sample_rate):
+    """
+    float 파형을 16bit mono WAV 파일로 저장합니다. (tts_to_file과 같이 최대 진폭으로 정규화)
+    """
+    wav = np.asarray(wav, dtype=np.float32)
+    peak = max(0.01, float(np.max(np.abs(wav)))) if len(wav) else 1.0
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(to_pcm16(wav / peak))
+
+def text_to_speech_stream(text, language="en"):
+    """
+    텍스트를 문장 단위로 합성하여 하나의 WAV 스트림으로 반환하는 제너레이터입니다.
+
+    Args:
+        text (str): 변환할 텍스트
+        language (str): 언어 코드 (en: 영어, ja: 일본어)
+
+    Yields:
+        bytes: 스트리밍 WAV 헤더, 이후 문장별 16bit PCM 청크
+    """
+    try:
+        yield streaming_wav_header(get_output_sample_rate(language))
+
+        silence = to_pcm16(np.zeros(SENTENCE_SILENCE_SAMPLES, dtype=np.float32))
+        for index, (_, wav) in enumerate(synthesize_sentences(text, language)):
+            if index > 0:
+                yield silence
+            yield to_pcm16(wav)
+
+    except Exception as e:
+        logger.error(f"TTS Stream Error: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise
+
+def _wav_duration(path):
+    """
+    WAV 헤더로 오디오 길이(초)를 구합니다.
+    """
+    try:
+        with wave.open(path, 'rb') as f:
+            return f.getnframes() / float(f.getframerate())
+    except (wave.Error, EOFError, OSError):
+        return 0.0
+
 def text_to_speech(text, language="en", output_path=None):
     """
     텍스트를 음성으로 변환합니다.
@@ -48,33 +279,53 @@ def text_to_speech(text, language="en", output_path=None):
         str: 생성된 오디오 파일의 경로
     """
     try:
-        # 언어별 필요한 처리
-        if language == "en":
-            # 짧은 텍스트인 경우 문장 종결 표시 추가
-            if len(text.split()) < 5 and not text.strip().endswith(('.', '!', '?')):
-                text = text + "."
-            model = get_tts_en_model()
-        elif language == "ja":
-            # 짧은 텍스트인 경우 문장 종결 표시 추가
-            if len(text.split()) < 5 and not text.strip().endswith(('.', '!', '?', '。', '！', '？')):
-                text = text + "。"
-            model = get_tts_ja_model()
-        else:
-            # 기본은 영어로
-            model = get_tts_en_model()
+        # 언어별 필요한 처리 (짧은 텍스트인 경우 문장 종결 표시 추가)
+        text = prepare_text(text, language)
             
         # 출력 경로가 지정되지 않은 경우 임시 파일 생성
         temp_file = None
-        if not output_path:
-            temp_dir = current_app.config['TEMP_DIR']
-            temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-            output_path = temp_file.name
-            temp_file.close()
+        with tracing.span('tts.text_to_speech', {'tts.language': language, 'tts.text_length': len(text)}) as tts_span:
+            if not output_path:
+                temp_dir = current_app.config['TEMP_DIR']
+                temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
+                output_path = temp_file.name
+                temp_file.close()
+        
+            # 캐시에 같은 음성이 있으면 합성 없이 복사해서 반환
+            cache = get_tts_cache()
+            cache_key = None
+            if cache is not None:
+                cache_key = get_tts_cache_key(text, language)
+                # 복사 중 다른 요청 / 워커가 항목을 제거한 경우는 캐시 미스로 처리하고 합성
+                cache_hit = cache.copy_to(cache_key, output_path)
+                tts_span.set_attribute('tts.cache_hit', cache_hit)
+                if cache_hit:
+                    return output_path
+        
+            with track_stage('synthesize'):
+                # TTS 실행 (여러 문장이면 프로세스 풀에서 문장 단위로 병렬 합성)
+                pool = get_tts_pool()
+                sentences = split_sentences(text, language) if pool is not None else []
+                tts_span.set_attribute('tts.sentences', max(1, len(sentences)))
+                if len(sentences) > 1:
+                    wav, sample_rate = pool.synthesize(sentences, language)
+                    write_wav(output_path, wav, sample_rate)
+                else:
+                    model = get_tts_model(language)
+                    with inference_mode():
+                        model.tts_to_file(text=text, file_path=output_path)
+            audio_seconds = _wav_duration(output_path)
+            AUDIO_SECONDS.inc(audio_seconds, direction='tts_output')
+            tts_span.set_attribute('audio.seconds', round(audio_seconds, 2))
         
-        # TTS 실행
-        model.tts_to_file(text=text, file_path=output_path)
+            # 합성 결과 캐시에 저장 (캐시 저장 실패는 응답에 영향을 주지 않음)
+            if cache is not None:
+                try:
+                    cache.put(cache_key, output_path)
+                except Exception as e:
+                    logger.warning(f"TTS 캐시 저장 실패: {str(e)}")
         
-        return output_path
+            return output_path
         
     except Exception as e:
         logger.error(f"TTS Error: {str(e)}")
@@ -0,0 +1,181 @@
+import logging
+import threading
+import numpy as np
+from config.settings import get_setting
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+def _runs(mask):
+    """
+    불리언 배열에서 연속된 True 구간의 (시작, 끝) 인덱스 배열을 반환합니다. (끝은 포함하지 않음)
+    """
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _merge_close(starts, ends, min_gap):
+    """
+    간격이 min_gap 미만인 인접 구간을 하나로 합칩니다.
+    """
+    if len(starts) < 2:
+        return starts, ends
+    keep_gap = (starts[1:] - ends[:-1]) >= min_gap
+    return starts[np.concatenate(([True], keep_gap))], ends[np.concatenate((keep_gap, [True]))]
+
+
+class EnergyVAD:
+    """
+    NumPy로 벡터화된 에너지 기반 음성 구간 검출기.
+
+    프레임별 RMS(dBFS)를 계산하고, 녹음의 잡음 수준(하위 백분위)에 여유값을 더한 적응형 임계값으로
+    음성 프레임을 판정한 뒤, 짧은 무음은 메우고 짧은 잡음 구간은 버립니다.
+    """
+
+    def __init__(self, sample_rate=SAMPLE_RATE, frame_ms=30, energy_margin_db=12.0, min_energy_db=-50.0,
+                 min_speech_ms=200, min_silence_ms=400, padding_ms=200):
+        """
+        Args:
+            sample_rate (int): 샘플링 레이트
+            frame_ms (float): 분석 프레임 길이(ms)
+            energy_margin_db (float): 잡음 수준 대비 음성으로 판정할 에너지 여유값(dB)
+            min_energy_db (float): 이 값보다 작은 프레임은 항상 무음으로 판정 (dBFS)
+            min_speech_ms (float): 이보다 짧은 음성 구간은 잡음으로 간주
+            min_silence_ms (float): 이보다 짧은 무음은 음성 구간에 포함
+            padding_ms (float): 음성 구간 앞뒤로 남겨둘 여유 길이(ms)
+        """
+        self.sample_rate = int(sample_rate)
+        self.frame_length = max(1, int(self.sample_rate * frame_ms / 1000))
+        self.energy_margin_db = float(energy_margin_db)
+        self.min_energy_db = float(min_energy_db)
+        self.min_speech_frames = max(1, int(round(min_speech_ms / frame_ms)))
+        self.min_silence_frames = max(1, int(round(min_silence_ms / frame_ms)))
+        self.padding_frames = max(0, int(round(padding_ms / frame_ms)))
+
+    def frame_energy_db(self, audio):
+        """
+        프레임별 RMS 에너지(dBFS)를 계산합니다.
+        """
+        audio = np.asarray(audio, dtype=np.float32)
+        n_frames = -(-len(audio) // self.frame_length)
+        padded = np.zeros(n_frames * self.frame_length, dtype=np.float32)
+        padded[:len(audio)] = audio
+        frames = padded.reshape(n_frames, self.frame_length)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        return 20.0 * np.log10(rms + 1e-10)
+
+    def detect(self, audio):
+        """
+        음성 구간을 검출합니다.
+
+        Args:
+            audio (numpy.ndarray): mono float32 파형
+
+        Returns:
+            list: (시작 샘플, 끝 샘플) 튜플 목록
+        """
+        if len(audio) == 0:
+            return []
+
+        energy = self.frame_energy_db(audio)
+        noise_floor = float(np.percentile(energy, 10))
+        peak = float(np.max(energy))
+        # 무음 구간이 거의 없는 녹음(계속 말하는 경우)은 잡음 수준이 곧 음성 수준이므로 최대값 기준으로도 제한
+        threshold = max(self.min_energy_db, min(noise_floor + self.energy_margin_db, peak - self.energy_margin_db))
+        speech = energy > threshold
+
+        starts, ends = _runs(speech)
+        starts, ends = _merge_close(starts, ends, self.min_silence_frames)
+        long_enough = (ends - starts) >= self.min_speech_frames
+        starts, ends = starts[long_enough], ends[long_enough]
+        if len(starts) == 0:
+            return []
+
+        # 앞뒤 여유 구간 추가 후 겹치는 구간 병합
+        starts = np.maximum(starts - self.padding_frames, 0)
+        ends = np.minimum(ends + self.padding_frames, len(energy))
+        starts, ends = _merge_close(starts, ends, 1)
+
+        total = len(audio)
+        return [
+            (int(start) * self.frame_length, min(int(end) * self.frame_length, total))
+            for start, end in zip(starts, ends)
+        ]
+
+    def chunk(self, audio, max_chunk_seconds=30.0):
+        """
+        음성 구간을 최대 길이 이하의 덩어리로 묶습니다. 덩어리 사이의 긴 무음은 버려집니다.
+
+        Args:
+            audio (numpy.ndarray): mono float32 파형
+            max_chunk_seconds (float): 덩어리 최대 길이(초). Whisper 윈도우(30초)에 맞춤
+
+        Returns:
+            list: (시작 샘플, 끝 샘플) 튜플 목록
+        """
+        max_length = int(max_chunk_seconds * self.sample_rate)
+        chunks = []
+        for start, end in self.detect(audio):
+            # 쉬지 않고 최대 길이를 넘는 음성은 최대 길이 단위로 자름
+            while end - start > max_length:
+                chunks.append((start, start + max_length))
+                start += max_length
+
+            if chunks and end - chunks[-1][0] <= max_length:
+                chunks[-1] = (chunks[-1][0], end)
+            else:
+                chunks.append((start, end))
+        return chunks
+
+
+# 프로세스 전역 VAD
+_vad = None
+_vad_lock = threading.Lock()
+
+
+def get_vad(required=False):
+    """
+    설정 값으로 생성한 VAD를 반환합니다.
+
+    Args:
+        required (bool): True면 VAD_ENABLED와 관계없이 반환 (장시간 인식처럼 구간 분할이 필수인 경우)
+
+    Returns:
+        EnergyVAD | None: VAD가 꺼져 있고 required가 아니면 None
+    """
+    global _vad
+    if not required and not get_setting('VAD_ENABLED', False):
+        return None
+    if _vad is None:
+        with _vad_lock:
+            if _vad is None:
+                _vad = EnergyVAD(
+                    sample_rate=SAMPLE_RATE,
+                    frame_ms=get_setting('VAD_FRAME_MS', 30),
+                    energy_margin_db=get_setting('VAD_ENERGY_MARGIN_DB', 12.0),
+                    min_energy_db=get_setting('VAD_MIN_ENERGY_DB', -50.0),
+                    min_speech_ms=get_setting('VAD_MIN_SPEECH_MS', 200),
+                    min_silence_ms=get_setting('VAD_MIN_SILENCE_MS', 400),
+                    padding_ms=get_setting('VAD_PADDING_MS', 200)
+                )
+    return _vad
+
+
+def speech_chunks(audio, max_chunk_seconds=None):
+    """
+    오디오에서 무음을 제거하고 음성 덩어리 목록을 반환합니다.
+
+    Returns:
+        list | None: (시작 샘플, 끝 샘플) 목록. VAD가 꺼져 있으면 None
+    """
+    vad = get_vad()
+    if vad is None:
+        return None
+    if max_chunk_seconds is None:
+        max_chunk_seconds = get_setting('VAD_MAX_CHUNK_SECONDS', 30.0)
+    chunks = vad.chunk(audio, max_chunk_seconds)
+    logger.debug(f"VAD: {len(audio) / SAMPLE_RATE:.1f}초 중 음성 {sum(e - s for s, e in chunks) / SAMPLE_RATE:.1f}초, 덩어리 {len(chunks)}개")
+    return chunks
@@ -0,0 +1,197 @@
+import base64
+import io
+import logging
+import queue
+import threading
+import time
+import numpy as np
+from app.services.stt_service import transcribe_audio
+from app.services.tts_service import get_output_sample_rate, get_tts_model, prepare_text, split_sentences, write_wav
+from app.services.gpt_client_registry import get_gpt_service
+from app.services.gpt_service import StreamingResponseParser
+from app.services.torch_optimizer import inference_mode
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 스레드 종료 표시
+_END = object()
+
+
+class SentenceAccumulator:
+    """
+    스트리밍으로 도착하는 대화 텍스트를 모아 완성된 문장을 하나씩 내보냅니다.
+    마지막 조각은 다음 텍스트가 오거나 flush()가 호출될 때까지 미완성 문장으로 보류합니다.
+    """
+
+    def __init__(self, language="en"):
+        self.language = language
+        self._buffer = ""
+        self._emitted = 0
+
+    def feed(self, text):
+        """
+        Returns:
+            list: 새로 완성된 문장 목록
+        """
+        self._buffer += text
+        sentences = split_sentences(self._buffer, self.language)
+        complete = sentences[:-1]
+        new_sentences = complete[self._emitted:]
+        self._emitted = max(self._emitted, len(complete))
+        return new_sentences
+
+    def flush(self):
+        """
+        Returns:
+            list: 보류 중인 나머지 문장 목록
+        """
+        sentences = split_sentences(self._buffer, self.language)
+        new_sentences = sentences[self._emitted:]
+        self._emitted = len(sentences)
+        return new_sentences
+
+
+def encode_wav(wav, sample_rate):
+    """
+    float 파형을 WAV 바이트로 변환하여 base64 문자열로 반환합니다.
+    """
+    buffer = io.BytesIO()
+    write_wav(buffer, wav, sample_rate)
+    return base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def run_voice_turn(audio, language="en", chat_history=None):
+    """
+    음성 한 턴을 STT → GPT → TTS 순서로 처리하되, GPT 토큰이 도착하는 동안
+    완성된 문장부터 TTS 합성을 시작하여 단계들을 겹쳐 실행합니다.
+
+    Args:
+        audio: 오디오 파일 경로 또는 16kHz float32 파형
+        language (str): 언어 코드 (en: 영어, ja: 일본어)
+        chat_history (list, optional): 이전 대화 기록. 있으면 대화 기록 포함 프롬프트 사용
+
+    Yields:
+        tuple: (이벤트 이름, 데이터 dict)
+            transcript: 음성 인식 결과
+            delta: 섹션별 GPT 응답 조각
+            audio: 문장별 WAV 오디오 (base64)
+            done: 전체 응답과 단계별 소요 시간
+            error: 오류 메시지
+    """
+    started = time.perf_counter()
+    timings = {}
+
+    def elapsed_ms():
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    # 1. 음성 인식
+    result = transcribe_audio(audio, language=language)
+    recognized_text = result["text"].strip()
+    timings['stt_ms'] = elapsed_ms()
+    yield 'transcript', {'text': recognized_text, 'language': result.get("language", language)}
+
+    # 2. GPT 스트리밍 시작 (대화 기록이 있으면 확장 형식 응답)
+    gpt = get_gpt_service()
+    extended = chat_history is not None
+    if extended:
+        deltas = gpt.stream_chat_conversation(recognized_text, chat_history, language=language)
+    else:
+        deltas = gpt.stream_chat_response(recognized_text, language=language)
+
+    events = queue.Queue()
+    sentences = queue.Queue()
+    stop = threading.Event()
+    parser = StreamingResponseParser(language=language, extended=extended)
+
+    def gpt_worker():
+        accumulator = SentenceAccumulator(language)
+        try:
+            for delta in deltas:
+                if stop.is_set():
+                    break
+                if 'first_token_ms' not in timings:
+                    timings['first_token_ms'] = elapsed_ms()
+                for section, text in parser.feed(delta):
+                    events.put(('delta', {'section': section, 'text': text}))
+                    if section == "conversation":
+                        for sentence in accumulator.feed(text):
+                            sentences.put(sentence)
+            else:
+                for section, text in parser.flush():
+                    events.put(('delta', {'section': section, 'text': text}))
+                    if section == "conversation":
+                        accumulator.feed(text)
+            for sentence in accumulator.flush():
+                sentences.put(sentence)
+            timings['gpt_ms'] = elapsed_ms()
+        except Exception as e:
+            logger.error(f"Voice Turn GPT Error: {str(e)}")
+            events.put(('error', {'error': f'대화 처리 실패: {str(e)}'}))
+        finally:
+            if hasattr(deltas, 'close'):
+                deltas.close()
+            sentences.put(_END)
+
+    def tts_worker():
+        index = 0
+        try:
+            model = get_tts_model(language)
+            sample_rate = get_output_sample_rate(language)
+            while not stop.is_set():
+                sentence = sentences.get()
+                if sentence is _END:
+                    break
+                with inference_mode():
+                    wav = np.asarray(model.tts(text=prepare_text(sentence, language)), dtype=np.float32)
+                if 'first_audio_ms' not in timings:
+                    timings['first_audio_ms'] = elapsed_ms()
+                events.put(('audio', {
+                    'index': index,
+                    'sentence': sentence,
+                    'sample_rate': sample_rate,
+                    'audio': encode_wav(wav, sample_rate)
+                }))
+                index += 1
+        except Exception as e:
+            logger.error(f"Voice Turn TTS Error: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            events.put(('error', {'error': f'음성 변환 실패: {str(e)}'}))
+        finally:
+            timings['audio_chunks'] = index
+            events.put(('tts_done', None))
+
+    # GPT 토큰 수신과 TTS 합성을 별도 스레드에서 겹쳐 실행
+    threading.Thread(target=gpt_worker, name='voice-turn-gpt', daemon=True).start()
+    threading.Thread(target=tts_worker, name='voice-turn-tts', daemon=True).start()
+
+    try:
+        failed = False
+        while True:
+            event, data = events.get()
+            if event == 'tts_done':
+                break
+            if event == 'error':
+                failed = True
+            yield event, data
+
+        if failed:
+            return
+
+        if extended:
+            formatted_response = gpt.format_extended_response(parser.text, language=language)
+        else:
+            formatted_response = gpt.format_learning_response(parser.text, language=language)
+        timings['total_ms'] = elapsed_ms()
+        yield 'done', dict(
+            formatted_response,
+            input_text=recognized_text,
+            full_response=parser.text,
+            model=gpt.model,
+            timings=timings
+        )
+    finally:
+        # 클라이언트 연결이 끊기면 남은 작업 중단
+        stop.set()
+        sentences.put(_END)
@@ -1,532 +1,161 @@
-from flask import Blueprint, request, jsonify, current_app
-import os
-import tempfile
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
+import itertools
 import json
-from app.services.stt_service import transcribe_audio
-from app.services.tts_service import text_to_speech
-from app.services.gpt_service import GPTService
+from app.services.audio_service import load_upload_audio
+from app.services.chat_pipeline import CHAT_LANGUAGES, CHAT_MODES, ChatTurn, run_chat_pipeline
+from app.services.gpt_service import StreamingResponseParser
+from app.services.voice_pipeline import run_voice_turn
 
 # 블루프린트 생성
 chat_bp = Blueprint('chat', __name__)
 
-# GPT 서비스 인스턴스
-_gpt_service = None
+# 스트리밍(SSE) 응답 공통 처리
+def _sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
-def get_gpt_service():
+def _stream_chat(deltas, gpt, language, extended):
     """
-    GPT 서비스 인스턴스를 반환합니다. 싱글톤 패턴 적용.
+    GPT 토큰 스트림을 섹션별 SSE 이벤트로 변환합니다.
+    섹션 텍스트는 도착하는 대로 'delta' 이벤트로, 마지막에 JSON 엔드포인트와 같은 형식의 'done' 이벤트를 보냅니다.
     """
-    global _gpt_service
-    if _gpt_service is None:
-        current_app.logger.info("GPT 서비스 초기화 중...")
-        _gpt_service = GPTService()
-        current_app.logger.info("GPT 서비스 초기화 완료.")
-    return _gpt_service
-
-# 기본 채팅 엔드포인트 (영어)
-@chat_bp.route('/chat/english', methods=['POST'])
-def chat_english():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    
-    try:
-        # GPT 서비스를 통해 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response(text, language="en")
-        
-        # 응답 포맷팅 (대화 부분과 어휘 학습 부분 분리)
-        formatted_response = gpt.format_learning_response(response["answer"], language="en")
-        
-        return jsonify({
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
+    parser = StreamingResponseParser(language=language, extended=extended)
+    try:
+        for delta in deltas:
+            for section, text in parser.feed(delta):
+                yield _sse_event('delta', {'section': section, 'text': text})
+        for section, text in parser.flush():
+            yield _sse_event('delta', {'section': section, 'text': text})
+
+        if extended:
+            formatted_response = gpt.format_extended_response(parser.text, language=language)
+        else:
+            formatted_response = gpt.format_learning_response(parser.text, language=language)
+        yield _sse_event('done', dict(formatted_response, full_response=parser.text, model=gpt.model))
     except Exception as e:
-        current_app.logger.error(f"Chat Error: {str(e)}")
-        return jsonify({'error': f'대화 처리 실패: {str(e)}'}), 500
+        current_app.logger.error(f"Chat Stream Error: {str(e)}")
+        yield _sse_event('error', {'error': f'대화 처리 실패: {str(e)}'})
 
-# 기본 채팅 엔드포인트 (일본어)
-@chat_bp.route('/chat/japanese', methods=['POST'])
-def chat_japanese():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    
+def _chat_stream_response(turn):
+    """
+    스트리밍 모드: GPT 스트림을 연 뒤 SSE 응답으로 변환합니다. (parse 단계는 스트림 종료 후 실행)
+    """
     try:
-        # GPT 서비스를 통해 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response(text, language="ja")
-        
-        # 응답 포맷팅 (대화 부분과 어휘 학습 부분 분리)
-        formatted_response = gpt.format_learning_response(response["answer"], language="ja")
-        
-        return jsonify({
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
+        run_chat_pipeline(turn)
+        # 스트림 제너레이터는 첫 조각을 요청할 때 API를 호출하므로, 첫 조각까지 받아
+        # 연결 / 인증 오류 등은 SSE 대신 JSON 오류 응답으로 반환
+        deltas = iter(turn.deltas)
+        first_delta = next(deltas, None)
     except Exception as e:
-        current_app.logger.error(f"Chat Error: {str(e)}")
-        return jsonify({'error': f'대화 처리 실패: {str(e)}'}), 500
+        current_app.logger.error(f"{turn.mode.log_label}: {str(e)}")
+        return jsonify({'error': f'{turn.mode.error_message}: {str(e)}'}), 500
+
+    if first_delta is not None:
+        deltas = itertools.chain([first_delta], deltas)
+    return Response(
+        stream_with_context(_stream_chat(deltas, turn.gpt, turn.language, turn.mode.extended)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+# 요청 본문을 파이프라인 입력으로 변환
+def _build_turn(mode, language):
+    """
+    Returns:
+        tuple: (ChatTurn, None) 또는 입력이 잘못된 경우 (None, 오류 응답)
+    """
+    if mode.input == 'audio':
+        if 'file' not in request.files:
+            return None, (jsonify({'error': '파일이 없습니다'}), 400)
+
+        chat_history = None
+        if mode.prompt == 'conversation':
+            # 채팅 기록은 multipart 폼 필드에 JSON 배열 문자열로 전달
+            try:
+                chat_history = json.loads(request.form.get('history', '[]'))
+            except ValueError:
+                chat_history = []
+        return ChatTurn(mode, language, upload=request.files['file'], history=chat_history), None
 
-# 확장된 GPT 대화 API (영어 - 예시 응답 포함)
-@chat_bp.route('/chat-extended/english', methods=['POST'])
-def chat_extended_english():
     data = request.get_json()
     if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    
-    try:
-        # GPT 서비스를 통해 확장 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response_extended(text, language="en")
-        
-        # 응답 포맷팅 (대화 부분, 어휘 학습 부분, 예시 응답 부분 분리)
-        formatted_response = gpt.format_extended_response(response["answer"], language="en")
-        
-        return jsonify({
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"확장 Chat Error: {str(e)}")
-        return jsonify({'error': f'확장 대화 처리 실패: {str(e)}'}), 500
+        return None, (jsonify({'error': '텍스트가 없습니다'}), 400)
+    return ChatTurn(mode, language, text=data['text'], history=data.get('history', [])), None
 
-# 확장된 GPT 대화 API (일본어 - 예시 응답 포함)
-@chat_bp.route('/chat-extended/japanese', methods=['POST'])
-def chat_extended_japanese():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    
-    try:
-        # GPT 서비스를 통해 확장 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response_extended(text, language="ja")
-        
-        # 응답 포맷팅 (대화 부분, 어휘 학습 부분, 예시 응답 부분 분리)
-        formatted_response = gpt.format_extended_response(response["answer"], language="ja")
-        
-        return jsonify({
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"확장 Chat Error: {str(e)}")
-        return jsonify({'error': f'확장 대화 처리 실패: {str(e)}'}), 500
+def _handle_chat(mode, language):
+    turn, error_response = _build_turn(mode, language)
+    if error_response is not None:
+        return error_response
 
-# STT 결과를 GPT 대화에 바로 연결하는 통합 API (영어)
-@chat_bp.route('/stt-chat/english', methods=['POST'])
-def stt_chat_english():
-    if 'file' not in request.files:
-        return jsonify({'error': '파일이 없습니다'}), 400
-    
-    audio_file = request.files['file']
-    
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
-    
-    try:
-        # 1. 영어 음성 인식
-        result = transcribe_audio(temp_file.name, language="en")
-        recognized_text = result["text"]
-        
-        # 2. GPT 서비스를 통해 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response(recognized_text, language="en")
-        
-        # 3. 응답 포맷팅
-        formatted_response = gpt.format_learning_response(response["answer"], language="en")
-        
-        return jsonify({
-            'input_text': recognized_text,
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"STT-Chat Error: {str(e)}")
-        return jsonify({'error': f'음성 대화 처리 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
+    if mode.stream:
+        return _chat_stream_response(turn)
 
-# STT 결과를 GPT 대화에 바로 연결하는 통합 API (일본어)
-@chat_bp.route('/stt-chat/japanese', methods=['POST'])
-def stt_chat_japanese():
-    if 'file' not in request.files:
-        return jsonify({'error': '파일이 없습니다'}), 400
-    
-    audio_file = request.files['file']
-    
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
-    
     try:
-        # 1. 일본어 음성 인식
-        result = transcribe_audio(temp_file.name, language="ja")
-        recognized_text = result["text"]
-        
-        # 2. GPT 서비스를 통해 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response(recognized_text, language="ja")
-        
-        # 3. 응답 포맷팅
-        formatted_response = gpt.format_learning_response(response["answer"], language="ja")
-        
-        return jsonify({
-            'input_text': recognized_text,
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
+        run_chat_pipeline(turn)
+        return jsonify(turn.to_dict())
     except Exception as e:
-        current_app.logger.error(f"STT-Chat Error: {str(e)}")
-        return jsonify({'error': f'음성 대화 처리 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
-
-# 확장된 STT+GPT 통합 API (영어 - 예시 응답 포함)
-@chat_bp.route('/stt-chat-extended/english', methods=['POST'])
-def stt_chat_extended_english():
+        current_app.logger.error(f"{mode.log_label}: {str(e)}")
+        return jsonify({'error': f'{mode.error_message}: {str(e)}'}), 500
+
+def _chat_view(mode, language):
+    def view():
+        return _handle_chat(mode, language)
+    return view
+
+# 채팅 엔드포인트 등록: /<모드>/<english|japanese|auto> (엔드포인트 이름은 기존 함수 이름과 동일, 예: chat.stt_chat_english)
+for _mode in CHAT_MODES.values():
+    for _language_name, _language in CHAT_LANGUAGES.items():
+        if _language is None and _mode.input != 'audio':
+            # 언어 자동 감지(/auto)는 음성 입력 모드만 지원
+            continue
+        chat_bp.add_url_rule(
+            f'/{_mode.name}/{_language_name}',
+            endpoint=f"{_mode.name.replace('-', '_')}_{_language_name}",
+            view_func=_chat_view(_mode, _language),
+            methods=['POST']
+        )
+
+# 음성 대화 한 턴 파이프라인 공통 처리
+def _voice_turn_response(language):
     if 'file' not in request.files:
         return jsonify({'error': '파일이 없습니다'}), 400
-    
-    audio_file = request.files['file']
-    
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
-    
-    try:
-        # 1. 영어 음성 인식
-        result = transcribe_audio(temp_file.name, language="en")
-        recognized_text = result["text"]
-        
-        # 2. GPT 서비스를 통해 확장 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response_extended(recognized_text, language="en")
-        
-        # 3. 응답 포맷팅
-        formatted_response = gpt.format_extended_response(response["answer"], language="en")
-        
-        return jsonify({
-            'input_text': recognized_text,
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"확장 STT-Chat Error: {str(e)}")
-        return jsonify({'error': f'확장 음성 대화 처리 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
 
-# 확장된 STT+GPT 통합 API (일본어 - 예시 응답 포함)
-@chat_bp.route('/stt-chat-extended/japanese', methods=['POST'])
-def stt_chat_extended_japanese():
-    if 'file' not in request.files:
-        return jsonify({'error': '파일이 없습니다'}), 400
-    
     audio_file = request.files['file']
-    
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
-    
-    try:
-        # 1. 일본어 음성 인식
-        result = transcribe_audio(temp_file.name, language="ja")
-        recognized_text = result["text"]
-        
-        # 2. GPT 서비스를 통해 확장 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response_extended(recognized_text, language="ja")
-        
-        # 3. 응답 포맷팅
-        formatted_response = gpt.format_extended_response(response["answer"], language="ja")
-        
-        return jsonify({
-            'input_text': recognized_text,
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"확장 STT-Chat Error: {str(e)}")
-        return jsonify({'error': f'확장 음성 대화 처리 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
-
-# GPT 응답을 TTS로 변환하는 통합 API (영어)
-@chat_bp.route('/chat-tts/english', methods=['POST'])
-def chat_tts_english():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    
-    try:
-        # 1. GPT 서비스를 통해 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response(text, language="en")
-        
-        # 2. 응답 포맷팅
-        formatted_response = gpt.format_learning_response(response["answer"], language="en")
-        
-        # 3. 대화 부분만 TTS로 변환
-        conversation_text = formatted_response["conversation"]
-        
-        # 음성 파일 생성
-        audio_file = text_to_speech(conversation_text, language="en")
-        
-        # 응답 데이터 준비
-        response_data = {
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"],
-            'audio_file': audio_file  # 클라이언트에서 이 파일을 요청할 수 있도록
-        }
-        
-        return jsonify(response_data)
-    except Exception as e:
-        current_app.logger.error(f"Chat-TTS Error: {str(e)}")
-        return jsonify({'error': f'대화-음성 변환 실패: {str(e)}'}), 500
-
-# GPT 응답을 TTS로 변환하는 통합 API (일본어)
-@chat_bp.route('/chat-tts/japanese', methods=['POST'])
-def chat_tts_japanese():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    
-    try:
-        # 1. GPT 서비스를 통해 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_response(text, language="ja")
-        
-        # 2. 응답 포맷팅
-        formatted_response = gpt.format_learning_response(response["answer"], language="ja")
-        
-        # 3. 대화 부분만 TTS로 변환
-        conversation_text = formatted_response["conversation"]
-        
-        # 음성 파일 생성
-        audio_file = text_to_speech(conversation_text, language="ja")
-        
-        # 응답 데이터 준비
-        response_data = {
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"],
-            'audio_file': audio_file  # 클라이언트에서 이 파일을 요청할 수 있도록
-        }
-        
-        return jsonify(response_data)
-    except Exception as e:
-        current_app.logger.error(f"Chat-TTS Error: {str(e)}")
-        return jsonify({'error': f'대화-음성 변환 실패: {str(e)}'}), 500
-
-# 대화 기록이 포함된 텍스트 채팅 API (영어)
-@chat_bp.route('/chat-conversation/english', methods=['POST'])
-def chat_conversation_english():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    chat_history = data.get('history', [])
-    
-    try:
-        # GPT 서비스를 통해 대화 기록 포함 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_conversation(text, chat_history, language="en")
-        
-        # 응답 포맷팅
-        formatted_response = gpt.format_extended_response(response["answer"], language="en")
-        
-        return jsonify({
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"대화 기록 Chat Error: {str(e)}")
-        return jsonify({'error': f'대화 기록 처리 실패: {str(e)}'}), 500
 
-# 대화 기록이 포함된 텍스트 채팅 API (일본어)
-@chat_bp.route('/chat-conversation/japanese', methods=['POST'])
-def chat_conversation_japanese():
-    data = request.get_json()
-    if 'text' not in data:
-        return jsonify({'error': '텍스트가 없습니다'}), 400
-    
-    text = data['text']
-    chat_history = data.get('history', [])
-    
-    try:
-        # GPT 서비스를 통해 대화 기록 포함 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_conversation(text, chat_history, language="ja")
-        
-        # 응답 포맷팅
-        formatted_response = gpt.format_extended_response(response["answer"], language="ja")
-        
-        return jsonify({
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"대화 기록 Chat Error: {str(e)}")
-        return jsonify({'error': f'대화 기록 처리 실패: {str(e)}'}), 500
+    # 대화 기록은 multipart 폼 필드에 JSON 배열 문자열로 전달 (선택)
+    chat_history = None
+    if request.form.get('history'):
+        try:
+            chat_history = json.loads(request.form['history'])
+        except ValueError:
+            return jsonify({'error': '대화 기록 형식이 올바르지 않습니다'}), 400
 
-# 대화 기록이 포함된 음성 채팅 API (영어)
-@chat_bp.route('/stt-chat-conversation/english', methods=['POST'])
-def stt_chat_conversation_english():
-    if 'file' not in request.files:
-        return jsonify({'error': '파일이 없습니다'}), 400
-    
-    audio_file = request.files['file']
-    
-    # 채팅 기록 가져오기
-    chat_history_json = request.form.get('history', '[]')
     try:
-        chat_history = json.loads(chat_history_json)
-    except:
-        chat_history = []
-    
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
-    
-    try:
-        # 1. 영어 음성 인식
-        result = transcribe_audio(temp_file.name, language="en")
-        recognized_text = result["text"]
-        
-        # 2. GPT 서비스를 통해 대화 기록 포함 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_conversation(recognized_text, chat_history, language="en")
-        
-        # 3. 응답 포맷팅
-        formatted_response = gpt.format_extended_response(response["answer"], language="en")
-        
-        return jsonify({
-            'input_text': recognized_text,
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
+        # 업로드 스트림을 메모리에서 바로 디코딩 (임시 파일 미사용)
+        audio = load_upload_audio(audio_file)
     except Exception as e:
-        current_app.logger.error(f"대화 기록 STT-Chat Error: {str(e)}")
-        return jsonify({'error': f'대화 기록 음성 처리 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
+        current_app.logger.error(f"Voice Turn Error: {str(e)}")
+        return jsonify({'error': f'음성 대화 처리 실패: {str(e)}'}), 500
 
-# 대화 기록이 포함된 음성 채팅 API (일본어)
-@chat_bp.route('/stt-chat-conversation/japanese', methods=['POST'])
-def stt_chat_conversation_japanese():
-    if 'file' not in request.files:
-        return jsonify({'error': '파일이 없습니다'}), 400
-    
-    audio_file = request.files['file']
-    
-    # 채팅 기록 가져오기
-    chat_history_json = request.form.get('history', '[]')
-    try:
-        chat_history = json.loads(chat_history_json)
-    except:
-        chat_history = []
-    
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
-    
-    try:
-        # 1. 일본어 음성 인식
-        result = transcribe_audio(temp_file.name, language="ja")
-        recognized_text = result["text"]
-        
-        # 2. GPT 서비스를 통해 대화 기록 포함 응답 얻기
-        gpt = get_gpt_service()
-        response = gpt.get_chat_conversation(recognized_text, chat_history, language="ja")
-        
-        # 3. 응답 포맷팅
-        formatted_response = gpt.format_extended_response(response["answer"], language="ja")
-        
-        return jsonify({
-            'input_text': recognized_text,
-            'conversation': formatted_response["conversation"],
-            'vocabulary': formatted_response["vocabulary"],
-            'example_responses': formatted_response["example_responses"],
-            'full_response': response["answer"],
-            'model': response["model"],
-            'usage': response["usage"]
-        })
-    except Exception as e:
-        current_app.logger.error(f"대화 기록 STT-Chat Error: {str(e)}")
-        return jsonify({'error': f'대화 기록 음성 처리 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
\ No newline at end of file
+    def events():
+        try:
+            for event, data in run_voice_turn(audio, language=language, chat_history=chat_history):
+                yield _sse_event(event, data)
+        except Exception as e:
+            current_app.logger.error(f"Voice Turn Error: {str(e)}")
+            yield _sse_event('error', {'error': f'음성 대화 처리 실패: {str(e)}'})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+# STT → GPT → TTS 파이프라인 음성 대화 API (영어)
+@chat_bp.route('/voice-turn/english', methods=['POST'])
+def voice_turn_english():
+    return _voice_turn_response("en")
+
+# STT → GPT → TTS 파이프라인 음성 대화 API (일본어)
+@chat_bp.route('/voice-turn/japanese', methods=['POST'])
+def voice_turn_japanese():
+    return _voice_turn_response("ja")
\ No newline at end of file
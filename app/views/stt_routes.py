@@ -1,7 +1,9 @@
 from flask import Blueprint, request, jsonify, current_app
-import os
-import tempfile
 from app.services.stt_service import transcribe_audio
+from app.services.stt_long_service import transcribe_long_audio
+from app.services.stt_model_manager import QUALITY_LEVELS
+from app.services.language_detection import detect_language
+from app.services.audio_service import load_upload_audio
 
 # 블루프린트 생성
 stt_bp = Blueprint('stt', __name__, url_prefix='/stt')
@@ -16,15 +18,17 @@ def stt_english():
     
     audio_file = request.files['file']
     
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
+    # 인식 품질 (선택: fast, balanced, best)
+    quality = request.form.get('quality') or None
+    if quality is not None and quality not in QUALITY_LEVELS:
+        return jsonify({'error': f'지원하지 않는 인식 품질입니다: {quality}'}), 400
     
     try:
+        # 업로드 스트림을 메모리에서 바로 디코딩 (임시 파일 미사용)
+        audio = load_upload_audio(audio_file)
+        
         # 영어 음성 인식
-        result = transcribe_audio(temp_file.name, language="en")
+        result = transcribe_audio(audio, language="en", quality=quality)
         
         return jsonify({
             'text': result['text'], 
@@ -33,8 +37,6 @@ def stt_english():
     except Exception as e:
         current_app.logger.error(f"STT Error: {str(e)}")
         return jsonify({'error': f'음성 인식 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
 
 @stt_bp.route('/japanese', methods=['POST'])
 def stt_japanese():
@@ -46,15 +48,17 @@ def stt_japanese():
     
     audio_file = request.files['file']
     
-    # 임시 파일로 저장
-    temp_dir = current_app.config['TEMP_DIR']
-    temp_file = tempfile.NamedTemporaryFile(dir=temp_dir, delete=False, suffix='.wav')
-    audio_file.save(temp_file.name)
-    temp_file.close()
+    # 인식 품질 (선택: fast, balanced, best)
+    quality = request.form.get('quality') or None
+    if quality is not None and quality not in QUALITY_LEVELS:
+        return jsonify({'error': f'지원하지 않는 인식 품질입니다: {quality}'}), 400
     
     try:
+        # 업로드 스트림을 메모리에서 바로 디코딩 (임시 파일 미사용)
+        audio = load_upload_audio(audio_file)
+        
         # 일본어 음성 인식
-        result = transcribe_audio(temp_file.name, language="ja")
+        result = transcribe_audio(audio, language="ja", quality=quality)
         
         return jsonify({
             'text': result['text'], 
@@ -63,5 +67,63 @@ def stt_japanese():
     except Exception as e:
         current_app.logger.error(f"STT Error: {str(e)}")
         return jsonify({'error': f'음성 인식 실패: {str(e)}'}), 500
-    finally:
-        os.unlink(temp_file.name)  # 임시 파일 삭제
\ No newline at end of file
+
+def _long_transcription_response(language):
+    """
+    긴 오디오를 구간별로 나누어 인식하고 타임스탬프가 포함된 세그먼트를 반환합니다.
+    """
+    if 'file' not in request.files:
+        return jsonify({'error': '파일이 없습니다'}), 400
+
+    audio_file = request.files['file']
+
+    try:
+        audio = load_upload_audio(audio_file)
+        result = transcribe_long_audio(audio, language=language)
+
+        return jsonify({
+            'text': result['text'],
+            'language': language,
+            'duration': result['duration'],
+            'segments': result['segments']
+        })
+    except Exception as e:
+        current_app.logger.error(f"Long STT Error: {str(e)}")
+        return jsonify({'error': f'음성 인식 실패: {str(e)}'}), 500
+
+@stt_bp.route('/english/long', methods=['POST'])
+def stt_english_long():
+    """
+    긴 영어 음성(강의, 장시간 연습 녹음 등)을 타임스탬프와 함께 텍스트로 변환하는 API 엔드포인트
+    """
+    return _long_transcription_response("en")
+
+@stt_bp.route('/japanese/long', methods=['POST'])
+def stt_japanese_long():
+    """
+    긴 일본어 음성을 타임스탬프와 함께 텍스트로 변환하는 API 엔드포인트
+    """
+    return _long_transcription_response("ja")
+
+@stt_bp.route('/detect-language', methods=['POST'])
+def stt_detect_language():
+    """
+    전체 인식 없이 음성의 언어만 감지하는 API 엔드포인트
+    """
+    if 'file' not in request.files:
+        return jsonify({'error': '파일이 없습니다'}), 400
+
+    audio_file = request.files['file']
+
+    try:
+        audio = load_upload_audio(audio_file)
+        result = detect_language(audio)
+
+        return jsonify({
+            'language': result['language'],
+            'probability': result['probability'],
+            'languages': result['languages']
+        })
+    except Exception as e:
+        current_app.logger.error(f"Language Detection Error: {str(e)}")
+        return jsonify({'error': f'언어 감지 실패: {str(e)}'}), 500
\ No newline at end of file
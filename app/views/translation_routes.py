@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.services.translation_service import translate_text
+from app.services.translation_service import translate_text, get_translation_cache
 
 # 블루프린트 생성
 translation_bp = Blueprint('translation', __name__, url_prefix='/translation')
@@ -33,4 +33,17 @@ def translate():
         })
     except Exception as e:
         current_app.logger.error(f"Translation Error: {str(e)}")
-        return jsonify({'error': f'번역 실패: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'error': f'번역 실패: {str(e)}'}), 500
+
+@translation_bp.route('/cache/stats', methods=['GET'])
+def translation_cache_stats():
+    """
+    번역 캐시 적중률 통계를 반환하는 API 엔드포인트
+    """
+    cache = get_translation_cache()
+    if cache is None:
+        return jsonify({'enabled': False})
+    
+    stats = cache.stats()
+    stats['enabled'] = True
+    return jsonify(stats)
\ No newline at end of file
@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, request, jsonify, send_file, current_app, Response, stream_with_context
 import os
-from app.services.tts_service import text_to_speech
+from app.services.tts_service import text_to_speech, text_to_speech_stream, get_tts_cache
+from app.services.metrics import observe_file_send
 
 # 블루프린트 생성
 tts_bp = Blueprint('tts', __name__, url_prefix='/tts')
@@ -25,7 +26,7 @@ def tts_english():
         output_file = text_to_speech(text, language="en")
         
         # 파일 전송
-        response = send_file(output_file, as_attachment=True, download_name='output_en.wav')
+        response = observe_file_send(send_file(output_file, as_attachment=True, download_name='output_en.wav'))
         
         # 응답 후크 추가
         @response.call_on_close
@@ -63,7 +64,7 @@ def tts_japanese():
         output_file = text_to_speech(text, language="ja")
         
         # 파일 전송
-        response = send_file(output_file, as_attachment=True, download_name='output_ja.wav')
+        response = observe_file_send(send_file(output_file, as_attachment=True, download_name='output_ja.wav'))
         
         # 응답 후크 추가
         @response.call_on_close
@@ -79,4 +80,69 @@ def tts_japanese():
         return response
     except Exception as e:
         current_app.logger.error(f"TTS Error: {str(e)}")
-        return jsonify({'error': f'음성 변환 실패: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'error': f'음성 변환 실패: {str(e)}'}), 500
+
+@tts_bp.route('/english/stream', methods=['POST'])
+def tts_english_stream():
+    """
+    영어 텍스트를 문장 단위로 합성하여 WAV를 스트리밍하는 API 엔드포인트
+    """
+    data = request.get_json()
+    if 'text' not in data:
+        return jsonify({'error': '텍스트가 없습니다'}), 400
+    
+    text = data['text']
+    
+    # 텍스트가 None이거나 빈 문자열인 경우 확인
+    if not text:
+        return jsonify({'error': '유효한 텍스트가 아닙니다'}), 400
+    
+    # 첫 문장이 합성되는 즉시 전송 시작 (chunked 전송)
+    return Response(
+        stream_with_context(text_to_speech_stream(text, language="en")),
+        mimetype='audio/wav',
+        headers={
+            'Content-Disposition': 'inline; filename=output_en.wav',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@tts_bp.route('/japanese/stream', methods=['POST'])
+def tts_japanese_stream():
+    """
+    일본어 텍스트를 문장 단위로 합성하여 WAV를 스트리밍하는 API 엔드포인트
+    """
+    data = request.get_json()
+    if 'text' not in data:
+        return jsonify({'error': '텍스트가 없습니다'}), 400
+    
+    text = data['text']
+    
+    # 텍스트가 None이거나 빈 문자열인 경우 확인
+    if not text:
+        return jsonify({'error': '유효한 텍스트가 아닙니다'}), 400
+    
+    # 첫 문장이 합성되는 즉시 전송 시작 (chunked 전송)
+    return Response(
+        stream_with_context(text_to_speech_stream(text, language="ja")),
+        mimetype='audio/wav',
+        headers={
+            'Content-Disposition': 'inline; filename=output_ja.wav',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@tts_bp.route('/cache/stats', methods=['GET'])
+def tts_cache_stats():
+    """
+    TTS 오디오 캐시 적중/미스 통계를 반환하는 API 엔드포인트
+    """
+    cache = get_tts_cache()
+    if cache is None:
+        return jsonify({'enabled': False})
+    
+    stats = cache.stats()
+    stats['enabled'] = True
+    return jsonify(stats)
\ No newline at end of file
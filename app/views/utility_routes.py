@@ -1,6 +1,9 @@
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, request, jsonify, send_file, current_app, Response
 import os
 import time
+from app.services.model_warmup import get_model_warmup
+from app.services.metrics import observe_file_send, render_metrics
+from app.services.tracing import InMemoryExporter, get_tracer
 
 # 블루프린트 생성
 utility_bp = Blueprint('utility', __name__)
@@ -11,7 +14,7 @@ def get_audio(filename):
     temp_dir = current_app.config['TEMP_DIR']
     full_path = os.path.join(temp_dir, os.path.basename(filename))
     if os.path.exists(full_path):
-        return send_file(full_path, as_attachment=True)
+        return observe_file_send(send_file(full_path, as_attachment=True))
     else:
         return jsonify({'error': '파일을 찾을 수 없습니다'}), 404
 
@@ -46,4 +49,47 @@ def cleanup_temp():
                 except Exception as e:
                     current_app.logger.error(f"임시 파일 정리 실패: {str(e)}")
     
-    return jsonify({'success': True, 'deleted_files': count})
\ No newline at end of file
+    return jsonify({'success': True, 'deleted_files': count})
+
+# 로드 밸런서용 준비 상태 확인 (모델 워밍업이 끝나기 전에는 503)
+@utility_bp.route('/ready', methods=['GET'])
+def ready():
+    warmup = get_model_warmup()
+    if warmup is None:
+        # 워밍업을 사용하지 않으면 모델은 첫 요청에서 로드됨
+        return jsonify({'ready': True, 'models': {}})
+    
+    is_ready = warmup.is_ready()
+    return jsonify({'ready': is_ready, 'models': warmup.status()}), (200 if is_ready else 503)
+
+# Prometheus 수집용 메트릭 (prefork 모드에서는 요청을 받은 워커 프로세스의 값)
+@utility_bp.route('/metrics', methods=['GET'])
+def metrics():
+    if not current_app.config.get('METRICS_ENABLED'):
+        return jsonify({'error': '메트릭 수집이 비활성화되어 있습니다'}), 404
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+def _trace_store():
+    tracer = get_tracer()
+    return tracer.get_exporter(InMemoryExporter) if tracer is not None else None
+
+# 최근 요청 trace 목록 (느린 요청 찾기: ?min_duration_ms=5000)
+@utility_bp.route('/traces', methods=['GET'])
+def list_traces():
+    store = _trace_store()
+    if store is None:
+        return jsonify({'error': 'trace 메모리 저장소가 비활성화되어 있습니다'}), 404
+    limit = request.args.get('limit', 50, type=int)
+    min_duration_ms = request.args.get('min_duration_ms', 0, type=float)
+    return jsonify({'traces': store.recent(limit, min_duration_ms)})
+
+# trace 하나의 전체 span (OTLP/JSON)
+@utility_bp.route('/traces/<trace_id>', methods=['GET'])
+def get_trace(trace_id):
+    store = _trace_store()
+    if store is None:
+        return jsonify({'error': 'trace 메모리 저장소가 비활성화되어 있습니다'}), 404
+    trace = store.get(trace_id)
+    if trace is None:
+        return jsonify({'error': 'trace를 찾을 수 없습니다'}), 404
+    return jsonify(trace)
\ No newline at end of file
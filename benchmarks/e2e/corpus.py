@@ -0,0 +1,133 @@
+"""
+종단 간 벤치마크용 고정 코퍼스 (영어 / 일본어 텍스트와 음성, 번역용 한국어 문장).
+
+음성은 stt_parity와 같은 형식의 manifest(JSONL)로 실제 녹음을 지정할 수 있으며,
+지정하지 않으면 텍스트 길이에 맞춘 합성 음성(고정 시드)을 생성합니다. 합성 음성은 인식 결과가 의미 없지만
+길이와 음성 구간이 실행마다 같으므로 커밋 간 지연 비교에는 충분합니다. 인식 정확도까지 보려면 manifest를 사용합니다.
+"""
+import io
+import os
+import wave
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# 언어별 고정 발화 (짧은 질문부터 여러 문장까지)
+TEXTS = {
+    'en': [
+        "Hello, how are you today?",
+        "What did you do last weekend?",
+        "I would like to practice ordering food at a restaurant.",
+        "Can you recommend a good book for learning English?",
+        "Yesterday I went to the park with my friends and we played soccer for two hours.",
+        "I'm planning a trip to Japan next spring. Which cities should I visit first, and how many days do I need?",
+        "My job interview is tomorrow morning and I am a little nervous.",
+        "Could you explain the difference between 'make' and 'do' with some examples?"
+    ],
+    'ja': [
+        "こんにちは、お元気ですか？",
+        "週末は何をしましたか？",
+        "レストランで注文する練習をしたいです。",
+        "日本語を勉強するのにいい本を教えてください。",
+        "昨日は友達と公園に行って、二時間サッカーをしました。",
+        "来年の春に日本へ旅行する予定です。最初にどの町に行けばいいですか？何日くらい必要ですか？",
+        "明日の朝、仕事の面接があるので少し緊張しています。",
+        "「あげる」と「くれる」の違いを例文で説明してもらえますか？"
+    ]
+}
+
+# 번역 요청용 한국어 문장
+TRANSLATION_TEXTS = [
+    "커피 한 잔 주문하고 싶어요.",
+    "지하철역까지 어떻게 가나요?",
+    "내일 회의는 오후 세 시로 변경되었습니다.",
+    "이 근처에 맛있는 식당이 있나요?"
+]
+
+# chat-conversation 모드에 함께 보내는 이전 대화
+HISTORY = {
+    'en': [
+        {"role": "user", "content": "Hi! I want to practice English conversation."},
+        {"role": "assistant", "content": "Sure! What would you like to talk about today?"}
+    ],
+    'ja': [
+        {"role": "user", "content": "こんにちは！日本語の会話を練習したいです。"},
+        {"role": "assistant", "content": "いいですね！今日は何について話しましょうか？"}
+    ]
+}
+
+
+def synthesize_clip(text, language, seed):
+    """
+    텍스트 길이에 비례하는 음절 모양의 합성 음성을 생성합니다.
+
+    Returns:
+        numpy.ndarray: 16kHz mono float32 오디오
+    """
+    rng = np.random.default_rng(seed)
+    # 영어는 단어당 약 2음절, 일본어는 글자당 1음절
+    syllables = len(text.split()) * 2 if language == 'en' else len(text)
+    pieces = [np.zeros(int(0.3 * SAMPLE_RATE), dtype=np.float32)]
+    f0 = rng.uniform(110, 220)
+    for index in range(max(4, syllables)):
+        length = int(rng.uniform(0.12, 0.22) * SAMPLE_RATE)
+        t = np.arange(length) / SAMPLE_RATE
+        pitch = f0 * rng.uniform(0.9, 1.1)
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6))
+        pieces.append((0.3 * np.hanning(length) * voiced).astype(np.float32))
+        # 구절 사이(8음절마다)는 긴 쉼
+        gap = 0.35 if index % 8 == 7 else 0.04
+        pieces.append(np.zeros(int(gap * SAMPLE_RATE), dtype=np.float32))
+    pieces.append(np.zeros(int(0.3 * SAMPLE_RATE), dtype=np.float32))
+    audio = np.concatenate(pieces)
+    audio += rng.normal(0, 0.003, len(audio)).astype(np.float32)
+    return audio
+
+
+def to_wav_bytes(audio, sample_rate=SAMPLE_RATE):
+    """
+    float32 오디오를 16bit PCM WAV 바이트로 변환합니다.
+    """
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype('<i2')
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def load_audio_items(manifest=None):
+    """
+    언어별 음성 항목을 반환합니다.
+
+    Args:
+        manifest (str, optional): stt_parity 형식의 코퍼스 JSONL. 없으면 TEXTS로 합성 음성 생성
+
+    Returns:
+        dict: 언어 → [{'text', 'filename', 'data': WAV/원본 바이트}]
+    """
+    items = {language: [] for language in TEXTS}
+    if manifest:
+        from benchmarks.stt_parity import load_manifest
+
+        for item in load_manifest(manifest):
+            language = item.get('language') or 'en'
+            with open(item['audio'], 'rb') as f:
+                items.setdefault(language, []).append({
+                    'text': item.get('text', ''),
+                    'filename': os.path.basename(item['audio']),
+                    'data': f.read()
+                })
+        return items
+
+    for language, texts in TEXTS.items():
+        for index, text in enumerate(texts):
+            seed = index + (1000 if language == 'ja' else 0)
+            items[language].append({
+                'text': text,
+                'filename': f"{language}_{index:02d}.wav",
+                'data': to_wav_bytes(synthesize_clip(text, language, seed))
+            })
+    return items
@@ -0,0 +1,228 @@
+"""
+벤치마크용 로컬 OpenAI Chat Completions 대체 서버.
+
+/v1/chat/completions 요청에 고정된 형식(대화 / 어휘 섹션 / 예시 응답)의 응답을 돌려주며,
+첫 토큰까지의 지연(latency)과 토큰 생성 속도(token rate)를 설정하여 실제 API와 비슷한 대기 시간을 재현합니다.
+stream=true이면 SSE로 토큰을 나누어 보냅니다. 응답 내용은 요청 언어만으로 결정되므로 실행마다 같습니다.
+
+단독 실행:
+    python -m benchmarks.e2e.mock_openai --port 8089 --latency-ms 300 --token-rate 50
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=bench python run.py
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 언어별 응답 (GPTService의 섹션 구분자와 같은 형식)
+RESPONSES = {
+    'en': {
+        'conversation': "That sounds like a great plan! I usually take a short walk after lunch, and it really helps me focus in the afternoon.",
+        'vocabulary': "VOCABULARY_SECTION:\n"
+                      "1. plan: 계획 - Example 1: We made a plan for the weekend. - Example 2: Is there a plan B?\n"
+                      "2. focus: 집중하다 - Example 1: I can't focus today. - Example 2: Focus on the road.\n"
+                      "3. afternoon: 오후 - Example 1: See you this afternoon. - Example 2: The afternoon was quiet.",
+        'examples': "EXAMPLE_RESPONSES:\n"
+                    "1. That's a good idea, I might try it too.\n"
+                    "2. How long do you usually walk?\n"
+                    "3. I prefer to stretch at my desk instead.",
+        'translation': "I would like to order a coffee, please."
+    },
+    'ja': {
+        'conversation': "それはいい計画ですね！私は昼ご飯の後に少し散歩をします。午後に集中しやすくなりますよ。",
+        'vocabulary': "語彙セクション:\n"
+                      "1. 計画: 계획 - 例文1: 週末の計画を立てました。 - 例文2: 計画どおりに進みました。\n"
+                      "2. 散歩: 산책 - 例文1: 毎朝散歩します。 - 例文2: 犬と散歩に行きます。\n"
+                      "3. 集中: 집중 - 例文1: 勉強に集中します。 - 例文2: 集中できません。",
+        'examples': "応答例:\n"
+                    "1. いい考えですね、私もやってみます。\n"
+                    "2. どのくらい歩きますか？\n"
+                    "3. 私は机でストレッチをします。",
+        'translation': "コーヒーを一つお願いします。"
+    }
+}
+
+
+def _request_language(messages):
+    text = " ".join(str(message.get('content', '')) for message in messages)
+    return 'ja' if any('぀' <= ch <= 'ヿ' for ch in text) else 'en'
+
+
+def build_completion(messages):
+    """
+    요청 메시지에 맞는 응답 텍스트를 만듭니다. (번역 / 확장(예시 응답 포함) / 기본 채팅)
+    """
+    system = str(messages[0].get('content', '')) if messages else ''
+    if 'translator' in system:
+        # 번역 대상 언어는 시스템 메시지에 명시됨 ("... specialized in Korean to Japanese translation")
+        language = 'ja' if 'to Japanese' in system else 'en'
+        return RESPONSES[language]['translation']
+
+    language = _request_language(messages)
+    response = RESPONSES[language]
+    parts = [response['conversation'], response['vocabulary']]
+    if 'EXAMPLE_RESPONSES' in system or '応答例' in system:
+        parts.append(response['examples'])
+    return "\n".join(parts)
+
+
+def split_tokens(text):
+    """
+    응답을 토큰 비슷한 조각으로 나눕니다. (영어는 단어, 일본어는 2글자 단위)
+    """
+    tokens = []
+    for word in text.split(' '):
+        if word.isascii():
+            tokens.append(word + ' ')
+        else:
+            tokens.extend(word[i:i + 2] for i in range(0, len(word), 2))
+            tokens[-1] += ' '
+    tokens[-1] = tokens[-1].rstrip(' ')
+    return tokens
+
+
+class MockOpenAIServer:
+    """
+    백그라운드 스레드에서 실행되는 Chat Completions 대체 서버.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=300.0, token_rate=50.0):
+        """
+        Args:
+            host (str): 바인딩 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            latency_ms (float): 요청부터 첫 토큰까지의 지연
+            token_rate (float): 초당 생성 토큰 수 (0 이하이면 지연 없이 한 번에 생성)
+        """
+        self.latency = latency_ms / 1000.0
+        self.token_interval = 1.0 / token_rate if token_rate > 0 else 0.0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock-openai', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self):
+        with self._lock:
+            self.requests += 1
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive 연결을 재사용하도록 HTTP/1.1로 응답
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, body):
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_chunk(self, data):
+                self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                request = json.loads(self.rfile.read(length) or b'{}')
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send_json(404, {'error': {'message': f"지원하지 않는 경로입니다: {self.path}"}})
+                    return
+
+                server._count()
+                messages = request.get('messages', [])
+                tokens = split_tokens(build_completion(messages))
+                prompt_tokens = sum(len(str(message.get('content', ''))) for message in messages) // 4
+                created = int(time.time())
+                completion_id = f"chatcmpl-bench{server.requests}"
+                model = request.get('model', 'gpt-3.5-turbo')
+
+                time.sleep(server.latency)
+                if not request.get('stream'):
+                    time.sleep(server.token_interval * len(tokens))
+                    self._send_json(200, {
+                        'id': completion_id,
+                        'object': 'chat.completion',
+                        'created': created,
+                        'model': model,
+                        'choices': [{
+                            'index': 0,
+                            'message': {'role': 'assistant', 'content': "".join(tokens)},
+                            'finish_reason': 'stop'
+                        }],
+                        'usage': {
+                            'prompt_tokens': prompt_tokens,
+                            'completion_tokens': len(tokens),
+                            'total_tokens': prompt_tokens + len(tokens)
+                        }
+                    })
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for index, token in enumerate(tokens):
+                    if index:
+                        time.sleep(server.token_interval)
+                    chunk = {
+                        'id': completion_id,
+                        'object': 'chat.completion.chunk',
+                        'created': created,
+                        'model': model,
+                        'choices': [{'index': 0, 'delta': {'content': token}, 'finish_reason': None}]
+                    }
+                    self._send_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+                final = {
+                    'id': completion_id,
+                    'object': 'chat.completion.chunk',
+                    'created': created,
+                    'model': model,
+                    'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]
+                }
+                self._send_chunk(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode('utf-8'))
+                self._send_chunk(b"")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 OpenAI Chat Completions 대체 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency-ms', type=float, default=300.0, help="첫 토큰까지의 지연")
+    parser.add_argument('--token-rate', type=float, default=50.0, help="초당 생성 토큰 수")
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(args.host, args.port, args.latency_ms, args.token_rate).start()
+    print(f"Mock OpenAI server: {server.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
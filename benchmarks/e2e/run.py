@@ -0,0 +1,450 @@
+"""
+종단 간 성능 벤치마크.
+
+create_app으로 만든 앱을 별도 프로세스의 Waitress 서버로 띄우고(run.py와 같은 방식), 로컬 OpenAI 대체 서버에 연결한 뒤
+고정 코퍼스(영어 / 일본어 음성과 텍스트)를 모든 라우트 계열(/stt, /tts, /chat*, /stt-chat*, /translation)에
+지정한 동시성으로 보내 p50/p95/p99 지연, 처리량, 서버 CPU 시간, 최대 RSS를 JSON으로 기록합니다.
+
+GPT 응답 시간은 대체 서버의 --gpt-latency-ms / --gpt-token-rate로 고정되고, TTS / 번역 캐시는 기본으로 꺼지므로
+같은 장비에서 실행한 결과는 커밋 간에 비교할 수 있습니다. --baseline으로 이전 결과와 비교합니다.
+
+사용 예:
+    python -m benchmarks.e2e.run --output bench/base.json
+    python -m benchmarks.e2e.run --family chat --family stt-chat --concurrency 1 --concurrency 8 \\
+        --baseline bench/base.json --output bench/new.json
+    python -m benchmarks.e2e.run --env STT_BACKEND=faster-whisper --env SERVER_WORKERS=2 --manifest corpus/manifest.jsonl
+
+CPU 시간과 RSS는 Linux의 /proc에서 서버 프로세스와 자식 프로세스(prefork 워커, 디코더 / TTS 풀)를 합산합니다.
+"""
+import argparse
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
+
+import httpx  # noqa: E402
+from benchmarks.e2e.corpus import HISTORY, TEXTS, TRANSLATION_TEXTS, load_audio_items  # noqa: E402
+from benchmarks.e2e.mock_openai import MockOpenAIServer  # noqa: E402
+
+# 언어 코드 → URL 경로의 언어 이름
+LANGUAGE_PATHS = {'en': 'english', 'ja': 'japanese'}
+
+
+class Scenario:
+    """
+    벤치마크 대상 엔드포인트 하나 (입력 종류, 스트리밍 여부).
+    """
+
+    def __init__(self, name, family, path, payload, stream=False):
+        self.name = name
+        self.family = family
+        self.path = path          # {language}는 english / japanese로 치환
+        self.payload = payload    # 'audio', 'text', 'translation'
+        self.stream = stream      # SSE / 청크 응답 (첫 바이트까지의 시간도 기록)
+
+
+SCENARIOS = [
+    Scenario('stt', 'stt', '/talk/{language}', 'audio'),
+    Scenario('tts', 'tts', '/talk/tts/{language}', 'text'),
+    Scenario('tts-stream', 'tts', '/talk/tts/{language}/stream', 'text', stream=True),
+    Scenario('chat', 'chat', '/talk/chat/{language}', 'text'),
+    Scenario('chat-extended', 'chat', '/talk/chat-extended/{language}', 'text'),
+    Scenario('chat-conversation', 'chat', '/talk/chat-conversation/{language}', 'text'),
+    Scenario('chat-tts', 'chat', '/talk/chat-tts/{language}', 'text'),
+    Scenario('chat-stream', 'chat', '/talk/chat-stream/{language}', 'text', stream=True),
+    Scenario('stt-chat', 'stt-chat', '/talk/stt-chat/{language}', 'audio'),
+    Scenario('stt-chat-extended', 'stt-chat', '/talk/stt-chat-extended/{language}', 'audio'),
+    Scenario('stt-chat-conversation', 'stt-chat', '/talk/stt-chat-conversation/{language}', 'audio'),
+    Scenario('voice-turn', 'stt-chat', '/talk/voice-turn/{language}', 'audio', stream=True),
+    Scenario('translation', 'translation', '/talk/translate', 'translation')
+]
+
+FAMILIES = sorted({scenario.family for scenario in SCENARIOS})
+
+
+def percentile(values, q):
+    """
+    선형 보간 백분위수 (q: 0~100).
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_latencies(values):
+    if not values:
+        return None
+    return {
+        'p50': round(percentile(values, 50), 1),
+        'p95': round(percentile(values, 95), 1),
+        'p99': round(percentile(values, 99), 1),
+        'mean': round(sum(values) / len(values), 1),
+        'max': round(max(values), 1)
+    }
+
+
+# 서버 프로세스 자원 사용량 (Linux /proc)
+
+def process_tree(pid):
+    pids = [pid]
+    for current in pids:
+        try:
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pids.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def cpu_seconds(pids):
+    ticks = os.sysconf('SC_CLK_TCK')
+    total = 0.0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # comm에 공백이 있을 수 있으므로 마지막 ')' 이후부터 필드를 셈 (utime, stime은 14, 15번째)
+                fields = f.read().rsplit(')', 1)[1].split()
+            total += (int(fields[11]) + int(fields[12])) / ticks
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def memory_mb(pids, field):
+    total = 0.0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith(field + ':'):
+                        total += int(line.split()[1]) / 1024
+        except OSError:
+            continue
+    return total
+
+
+def resource_snapshot(pid):
+    if not os.path.isdir(f"/proc/{pid}"):
+        return None
+    pids = process_tree(pid)
+    return {
+        'processes': len(pids),
+        'cpu_seconds': cpu_seconds(pids),
+        'rss_mb': memory_mb(pids, 'VmRSS'),
+        'peak_rss_mb': memory_mb(pids, 'VmHWM')
+    }
+
+
+# 앱 서버 프로세스
+
+def _serve_app(env, host, port, threads):
+    # Config는 import 시점에 환경 변수를 읽으므로 앱 모듈보다 먼저 설정
+    os.environ.update(env)
+    sys.path.insert(0, ROOT_DIR)
+    from app import create_app
+    from config.settings import Config
+
+    # Docker 이미지에서는 빌드 시 만들어지는 임시 디렉터리 (체크아웃에서 바로 실행하는 경우 대비)
+    os.makedirs(Config.TEMP_DIR, exist_ok=True)
+    if Config.SERVER_WORKERS > 1:
+        from app.prefork import serve_prefork
+        serve_prefork(create_app, host=host, port=port, workers=Config.SERVER_WORKERS, threads=threads)
+    else:
+        from waitress import serve
+        serve(create_app(), host=host, port=port, threads=threads, _quiet=True)
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(process, base_url, timeout):
+    """
+    /talk/ready가 200을 반환할 때까지(모델 워밍업 완료) 기다립니다.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not process.is_alive():
+            raise RuntimeError(f"앱 서버가 종료되었습니다 (exit code {process.exitcode})")
+        try:
+            if httpx.get(f"{base_url}/talk/ready", timeout=5).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(1)
+    raise TimeoutError(f"{timeout}초 안에 앱 서버가 준비되지 않았습니다")
+
+
+# 요청 생성 / 실행
+
+def build_request(scenario, language, index, audio_items):
+    """
+    코퍼스에서 index번째 입력으로 요청 인자를 만듭니다. (같은 index는 항상 같은 입력)
+    """
+    if scenario.payload == 'audio':
+        item = audio_items[language][index % len(audio_items[language])]
+        data = {}
+        if scenario.name in ('stt-chat-conversation', 'voice-turn'):
+            data['history'] = json.dumps(HISTORY[language], ensure_ascii=False)
+        return {'files': {'file': (item['filename'], item['data'], 'audio/wav')}, 'data': data}
+    if scenario.payload == 'translation':
+        return {'json': {
+            'text': TRANSLATION_TEXTS[index % len(TRANSLATION_TEXTS)],
+            'source_language': 'ko',
+            'target_language': language
+        }}
+    body = {'text': TEXTS[language][index % len(TEXTS[language])]}
+    if scenario.name.startswith('chat-conversation'):
+        body['history'] = HISTORY[language]
+    return {'json': body}
+
+
+def send(client, url, request):
+    """
+    요청 하나를 보내고 (성공 여부, 전체 지연 ms, 첫 바이트까지 ms)를 반환합니다.
+    """
+    started = time.perf_counter()
+    first_byte = None
+    failed = False
+    try:
+        with client.stream('POST', url, **request) as response:
+            tail = b''
+            for chunk in response.iter_bytes():
+                if first_byte is None:
+                    first_byte = (time.perf_counter() - started) * 1000
+                # SSE 응답은 200으로 시작한 뒤 error 이벤트로 실패를 알림
+                failed = failed or b'event: error' in tail + chunk
+                tail = chunk[-16:]
+            ok = response.status_code == 200 and not failed
+    except httpx.HTTPError:
+        ok = False
+    return ok, (time.perf_counter() - started) * 1000, first_byte
+
+
+def run_scenario(base_url, scenario, language, audio_items, requests, concurrency, warmup, server_pid):
+    url = base_url + scenario.path.format(language=LANGUAGE_PATHS[language])
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    with httpx.Client(timeout=600, limits=limits) as client:
+        # 첫 요청(지연 로드, 캐시 예열)은 측정에서 제외
+        for index in range(warmup):
+            send(client, url, build_request(scenario, language, index, audio_items))
+
+        counter = itertools.count()
+        lock = threading.Lock()
+        latencies, first_bytes, errors = [], [], []
+
+        def worker():
+            while True:
+                index = next(counter)
+                if index >= requests:
+                    return
+                ok, latency, first_byte = send(client, url, build_request(scenario, language, index, audio_items))
+                with lock:
+                    if ok:
+                        latencies.append(latency)
+                        if scenario.stream and first_byte is not None:
+                            first_bytes.append(first_byte)
+                    else:
+                        errors.append(index)
+
+        before = resource_snapshot(server_pid)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(worker)
+        wall = time.perf_counter() - started
+        after = resource_snapshot(server_pid)
+
+    result = {
+        'path': url[len(base_url):],
+        'concurrency': concurrency,
+        'requests': requests,
+        'errors': len(errors),
+        'wall_seconds': round(wall, 2),
+        'throughput_rps': round(len(latencies) / wall, 2) if wall else None,
+        'latency_ms': summarize_latencies(latencies)
+    }
+    if scenario.stream:
+        result['first_byte_ms'] = summarize_latencies(first_bytes)
+    if before and after:
+        server_cpu = after['cpu_seconds'] - before['cpu_seconds']
+        result['server_cpu_seconds'] = round(server_cpu, 2)
+        result['server_cpu_per_request_ms'] = round(server_cpu * 1000 / len(latencies), 1) if latencies else None
+        result['server_cpu_utilization'] = round(server_cpu / wall, 2) if wall else None
+        result['server_rss_mb'] = round(after['rss_mb'], 1)
+    return result
+
+
+def git_revision():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR, text=True).strip()
+        dirty = bool(subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                             cwd=ROOT_DIR, text=True).strip())
+        return {'commit': commit, 'dirty': dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def compare(report, baseline, max_regression):
+    """
+    기준 결과와 같은 시나리오의 p50/p95, 처리량을 비교합니다.
+
+    Returns:
+        list: 허용치를 넘게 느려진 시나리오 이름
+    """
+    regressions = []
+    print(f"\n{'scenario':<38} {'p50 ms':>18} {'p95 ms':>18} {'rps':>14}")
+    for key, result in report['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(key)
+        if not base or not result.get('latency_ms') or not base.get('latency_ms'):
+            continue
+        deltas = {}
+        for metric in ('p50', 'p95'):
+            old, new = base['latency_ms'][metric], result['latency_ms'][metric]
+            deltas[metric] = (new - old) / old if old else 0.0
+        result['vs_baseline'] = {
+            'p50_change': round(deltas['p50'], 3),
+            'p95_change': round(deltas['p95'], 3),
+            'throughput_change': round((result['throughput_rps'] - base['throughput_rps']) / base['throughput_rps'], 3)
+            if base.get('throughput_rps') else None
+        }
+        print(f"{key:<38} {base['latency_ms']['p50']:>8} → {result['latency_ms']['p50']:<8}"
+              f"{base['latency_ms']['p95']:>8} → {result['latency_ms']['p95']:<8}"
+              f"{base['throughput_rps']:>6} → {result['throughput_rps']:<6}")
+        if max_regression is not None and deltas['p95'] > max_regression:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="종단 간 지연 / 처리량 / CPU / RSS 벤치마크")
+    parser.add_argument('--family', action='append', choices=FAMILIES, help="측정할 라우트 계열 (기본: 전체)")
+    parser.add_argument('--scenario', action='append', choices=[s.name for s in SCENARIOS], help="측정할 시나리오")
+    parser.add_argument('--language', action='append', choices=list(LANGUAGE_PATHS), help="측정할 언어 (기본: en, ja)")
+    parser.add_argument('--requests', type=int, default=20, help="시나리오별 측정 요청 수")
+    parser.add_argument('--concurrency', type=int, action='append', help="동시 요청 수 (여러 번 지정 가능, 기본 4)")
+    parser.add_argument('--warmup', type=int, default=2, help="시나리오별 측정 전 요청 수")
+    parser.add_argument('--manifest', help="음성 코퍼스 JSONL (stt_parity 형식). 없으면 합성 음성 사용")
+    parser.add_argument('--gpt-latency-ms', type=float, default=300.0, help="대체 OpenAI 서버의 첫 토큰 지연")
+    parser.add_argument('--gpt-token-rate', type=float, default=50.0, help="대체 OpenAI 서버의 초당 토큰 수")
+    parser.add_argument('--server-threads', type=int, default=8, help="Waitress 스레드 수 (run.py와 같은 기본값)")
+    parser.add_argument('--env', action='append', default=[], metavar='KEY=VALUE', help="앱 서버 환경 변수 (설정 비교용)")
+    parser.add_argument('--keep-caches', action='store_true', help="TTS / 번역 캐시를 끄지 않음")
+    parser.add_argument('--startup-timeout', type=float, default=900.0, help="모델 워밍업 대기 시간(초)")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    parser.add_argument('--max-regression', type=float, default=None,
+                        help="기준 대비 p95 증가율이 이 값(예: 0.1)을 넘는 시나리오가 있으면 종료 코드 1")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    scenarios = [
+        scenario for scenario in SCENARIOS
+        if (not args.family or scenario.family in args.family)
+        and (not args.scenario or scenario.name in args.scenario)
+    ]
+    languages = args.language or list(LANGUAGE_PATHS)
+    concurrencies = args.concurrency or [4]
+    audio_items = load_audio_items(args.manifest)
+
+    mock = MockOpenAIServer(latency_ms=args.gpt_latency_ms, token_rate=args.gpt_token_rate).start()
+    env = {
+        'OPENAI_API_KEY': 'bench',
+        'OPENAI_BASE_URL': mock.base_url,
+        'MODEL_WARMUP_ENABLED': 'true',
+        'STT_STREAM_ENABLED': 'false'
+    }
+    if not args.keep_caches:
+        env.update(TTS_CACHE_ENABLED='false', TRANSLATION_CACHE_ENABLED='false')
+    overrides = dict(item.split('=', 1) for item in args.env)
+    env.update(overrides)
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    context = multiprocessing.get_context('spawn')
+    server = context.Process(target=_serve_app, args=(env, '127.0.0.1', port, args.server_threads), daemon=True)
+    server.start()
+
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'git': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'corpus': args.manifest or 'synthetic',
+            'gpt_latency_ms': args.gpt_latency_ms,
+            'gpt_token_rate': args.gpt_token_rate,
+            'server_threads': args.server_threads,
+            'warmup': args.warmup,
+            'env': overrides,
+            'caches_disabled': not args.keep_caches
+        },
+        'scenarios': {}
+    }
+    try:
+        started = time.perf_counter()
+        wait_until_ready(server, base_url, args.startup_timeout)
+        report['meta']['startup_seconds'] = round(time.perf_counter() - started, 1)
+
+        for scenario, language, concurrency in itertools.product(scenarios, languages, concurrencies):
+            if scenario.payload == 'audio' and not audio_items.get(language):
+                continue
+            key = f"{scenario.name}/{language}/c{concurrency}"
+            result = run_scenario(base_url, scenario, language, audio_items, args.requests, concurrency,
+                                  args.warmup, server.pid)
+            report['scenarios'][key] = result
+            latency = result['latency_ms'] or {}
+            print(f"{key:<38} p50={latency.get('p50')}ms p95={latency.get('p95')}ms p99={latency.get('p99')}ms "
+                  f"rps={result['throughput_rps']} errors={result['errors']} cpu={result.get('server_cpu_seconds')}s")
+
+        usage = resource_snapshot(server.pid)
+        if usage:
+            report['server'] = {
+                'processes': usage['processes'],
+                'cpu_seconds_total': round(usage['cpu_seconds'], 2),
+                'rss_mb': round(usage['rss_mb'], 1),
+                'peak_rss_mb': round(usage['peak_rss_mb'], 1)
+            }
+        report['mock_openai_requests'] = mock.requests
+    finally:
+        server.terminate()
+        server.join(timeout=30)
+        mock.stop()
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if regressions:
+        print(f"\n기준 대비 p95가 {args.max_regression:.0%} 넘게 증가한 시나리오: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
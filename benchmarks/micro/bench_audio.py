@@ -0,0 +1,62 @@
+"""
+오디오 디코딩 / VAD 구간 분할 마이크로 벤치마크 (입력 포맷 × 길이).
+
+디코딩과 VAD는 torch를 사용하지 않으므로 스레드 수 / 양자화 조합 없이 입력만 바꿔 측정합니다.
+"""
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+# 입력 길이(초)
+CLIP_SECONDS = (10, 60)
+
+# 업로드 포맷: 16kHz WAV(soundfile 경로), 44.1kHz WAV(ffmpeg 리샘플), 브라우저 녹음과 같은 webm/opus(ffmpeg)
+FORMATS = ('wav16k', 'wav44k', 'webm')
+
+
+def _has_soundfile():
+    from app.services import audio_service
+
+    return audio_service.soundfile is not None
+
+
+def _encode(audio, audio_format):
+    from benchmarks.e2e.corpus import SAMPLE_RATE, to_wav_bytes
+
+    if audio_format == 'wav16k':
+        return to_wav_bytes(audio)
+    if audio_format == 'wav44k':
+        positions = np.arange(int(len(audio) * 44100 / SAMPLE_RATE)) * SAMPLE_RATE / 44100
+        return to_wav_bytes(np.interp(positions, np.arange(len(audio)), audio).astype(np.float32), 44100)
+    cmd = ["ffmpeg", "-nostdin", "-loglevel", "error", "-f", "wav", "-i", "pipe:0",
+           "-c:a", "libopus", "-b:a", "32k", "-f", "webm", "pipe:1"]
+    return subprocess.run(cmd, input=to_wav_bytes(audio), capture_output=True, check=True).stdout
+
+
+@pytest.mark.parametrize('seconds', CLIP_SECONDS, ids=[f"{seconds}s" for seconds in CLIP_SECONDS])
+@pytest.mark.parametrize('audio_format', FORMATS)
+def bench_decode(benchmark, make_clip, audio_format, seconds):
+    from app.services.audio_service import decode_audio_bytes
+
+    # soundfile로 처리할 수 없는 입력은 ffmpeg 프로세스로 디코딩
+    if shutil.which('ffmpeg') is None and (audio_format != 'wav16k' or not _has_soundfile()):
+        pytest.skip("ffmpeg가 없어 이 포맷을 디코딩할 수 없습니다.")
+
+    data = _encode(make_clip(seconds), audio_format)
+    benchmark.extra_info.update({'bytes': len(data), 'audio_seconds': seconds})
+    audio = benchmark(decode_audio_bytes, data)
+    assert abs(len(audio) / 16000 - seconds) < 0.25
+
+
+@pytest.mark.parametrize('seconds', CLIP_SECONDS, ids=[f"{seconds}s" for seconds in CLIP_SECONDS])
+def bench_vad_chunk(benchmark, make_clip, seconds):
+    from app.services.vad_service import EnergyVAD
+
+    audio = make_clip(seconds)
+    vad = EnergyVAD()
+    chunks = benchmark(vad.chunk, audio, 30.0)
+    benchmark.extra_info['chunks'] = len(chunks)
@@ -0,0 +1,68 @@
+"""
+확장 응답 파싱 마이크로 벤치마크 (format_extended_response, 스트리밍 섹션 파서 × 언어 × 응답 크기).
+
+파싱은 torch를 사용하지 않으므로 스레드 수 / 양자화 조합 없이 응답 크기만 바꿔 측정합니다.
+"""
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+pytest.importorskip('openai')
+
+# 응답 크기: 어휘 섹션 항목 반복 횟수 (typical은 실제 응답 수준, 나머지는 max_tokens를 크게 잡은 경우)
+SIZES = {'typical': 1, 'large': 50, 'huge': 500}
+
+LANGUAGES = ('en', 'ja')
+
+
+def build_response(language, repeats):
+    """
+    benchmarks.e2e의 대체 서버와 같은 형식의 확장 응답에서 어휘 섹션을 repeats번 반복한 텍스트를 만듭니다.
+    """
+    from benchmarks.e2e.mock_openai import RESPONSES
+
+    response = RESPONSES[language]
+    header, entries = response['vocabulary'].split('\n', 1)
+    vocabulary = header + '\n' + '\n'.join([entries] * repeats)
+    return '\n'.join([response['conversation'], vocabulary, response['examples']])
+
+
+@pytest.fixture(scope='module')
+def gpt_service():
+    # 파싱만 측정하므로 API 호출은 하지 않음 (클라이언트 생성에 키 값만 필요)
+    os.environ.setdefault('OPENAI_API_KEY', 'bench')
+    from app.services.gpt_service import GPTService
+
+    return GPTService()
+
+
+@pytest.mark.parametrize('size', list(SIZES))
+@pytest.mark.parametrize('language', LANGUAGES)
+def bench_format_extended_response(benchmark, gpt_service, language, size):
+    text = build_response(language, SIZES[size])
+    benchmark.extra_info['characters'] = len(text)
+    result = benchmark(gpt_service.format_extended_response, text, language)
+    assert result['vocabulary'] and result['example_responses']
+
+
+@pytest.mark.parametrize('size', list(SIZES))
+@pytest.mark.parametrize('language', LANGUAGES)
+def bench_streaming_parser(benchmark, language, size):
+    from app.services.gpt_service import StreamingResponseParser
+    from benchmarks.e2e.mock_openai import split_tokens
+
+    tokens = split_tokens(build_response(language, SIZES[size]))
+
+    def parse():
+        # 스트리밍 라우트와 같이 토큰 단위로 feed 후 flush
+        parser = StreamingResponseParser(language, extended=True)
+        events = []
+        for token in tokens:
+            events.extend(parser.feed(token))
+        events.extend(parser.flush())
+        return parser, events
+
+    benchmark.extra_info.update({'tokens': len(tokens)})
+    parser, events = benchmark(parse)
+    assert parser.section == 'example_responses' and events
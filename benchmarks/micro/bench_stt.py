@@ -0,0 +1,38 @@
+"""
+Whisper transcribe 마이크로 벤치마크 (2 / 10 / 60초 음성 × torch 스레드 수 × 양자화).
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+pytest.importorskip('torch')
+pytest.importorskip('whisper')
+
+# 입력 음성 길이(초): 짧은 발화, 일반 발화, 마이크로 배치 / VAD 분할 대상인 긴 녹음
+CLIP_SECONDS = (2, 10, 60)
+
+
+@pytest.fixture(scope='module')
+def whisper_backend(request, quantize):
+    """
+    양자화 설정별로 새로 로드한 WhisperBackend. (get_stt_backend 싱글턴과 별도)
+    """
+    from config.settings import Config
+    from app.services.stt_backends import WhisperBackend
+
+    previous = Config.TORCH_QUANTIZE_STT
+    Config.TORCH_QUANTIZE_STT = quantize
+    try:
+        backend = WhisperBackend(model_size=request.config.getoption('--whisper-size'))
+        backend.load()
+    finally:
+        Config.TORCH_QUANTIZE_STT = previous
+    return backend
+
+
+@pytest.mark.parametrize('seconds', CLIP_SECONDS, ids=[f"{seconds}s" for seconds in CLIP_SECONDS])
+def bench_transcribe(benchmark, whisper_backend, torch_threads, make_clip, seconds):
+    audio = make_clip(seconds)
+    benchmark.extra_info.update({'audio_seconds': seconds, 'model_size': whisper_backend.model_size})
+    # 한 번의 인식이 수 초 걸리므로 라운드 수를 고정하고, 첫 실행(메모리 할당)은 워밍업으로 제외
+    result = benchmark.pedantic(whisper_backend.transcribe, args=(audio, 'en'), rounds=3, warmup_rounds=1)
+    assert 'text' in result
@@ -0,0 +1,67 @@
+"""
+Tacotron2-DDC + 보코더 합성 마이크로 벤치마크 (영어 / 일본어, 짧은 / 긴 문장 × torch 스레드 수 × 양자화).
+"""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+pytest.importorskip('torch')
+pytest.importorskip('TTS')
+
+# 언어별 합성 입력 (짧은 응답 한 문장, 확장 응답 수준의 여러 문장)
+TEXTS = {
+    ('en', 'short'): "Hello, how are you today?",
+    ('en', 'long'): (
+        "That sounds like a great plan! I usually take a short walk after lunch, and it really helps me focus "
+        "in the afternoon. If you want, we can practice a conversation about daily routines. "
+        "Try telling me what you usually do on weekday mornings, and I will help you with any new words."
+    ),
+    ('ja', 'short'): "こんにちは、お元気ですか？",
+    ('ja', 'long'): (
+        "それはいい計画ですね！私は昼ご飯の後に少し散歩をします。午後に集中しやすくなりますよ。"
+        "よければ、毎日の習慣について会話の練習をしましょう。"
+        "平日の朝はいつも何をしているか教えてください。新しい言葉があれば一緒に確認します。"
+    )
+}
+
+
+@pytest.fixture(scope='module')
+def tts_models(quantize):
+    """
+    양자화 설정별로 새로 로드한 언어별 TTS 모델. (get_tts_model 싱글턴과 별도, 처음 요청한 언어만 로드)
+    """
+    from TTS.api import TTS
+    from config.settings import Config
+    from app.services.tts_service import TTS_MODEL_NAMES
+    from app.services.torch_optimizer import optimize_tts_model
+
+    models = {}
+
+    def get(language):
+        if language not in models:
+            previous = Config.TORCH_QUANTIZE_TTS
+            Config.TORCH_QUANTIZE_TTS = quantize
+            try:
+                models[language] = optimize_tts_model(TTS(TTS_MODEL_NAMES[language]))
+            finally:
+                Config.TORCH_QUANTIZE_TTS = previous
+        return models[language]
+
+    return get
+
+
+@pytest.mark.parametrize('language,length', list(TEXTS), ids=[f"{language}-{length}" for language, length in TEXTS])
+def bench_synthesize(benchmark, tts_models, torch_threads, language, length):
+    from app.services.tts_service import prepare_text
+    from app.services.torch_optimizer import inference_mode
+
+    model = tts_models(language)
+    # text_to_speech와 같은 전처리 후 합성 (파일 저장 제외)
+    text = prepare_text(TEXTS[(language, length)], language)
+
+    def synthesize():
+        with inference_mode():
+            return model.tts(text=text)
+
+    benchmark.extra_info.update({'language': language, 'characters': len(text)})
+    wav = benchmark.pedantic(synthesize, rounds=3, warmup_rounds=1)
+    benchmark.extra_info['audio_seconds'] = round(len(wav) / model.synthesizer.output_sample_rate, 2)
@@ -0,0 +1,118 @@
+"""
+추론 핫패스 마이크로 벤치마크 (pytest-benchmark).
+
+종단 간 부하(benchmarks/e2e)와 별도로 내부 루프만 반복 측정합니다.
+    bench_stt.py     Whisper transcribe (2 / 10 / 60초 음성)
+    bench_tts.py     Tacotron2-DDC + 보코더 합성 (영어 / 일본어, 짧은 / 긴 문장)
+    bench_audio.py   오디오 디코딩, VAD 구간 분할
+    bench_parsing.py format_extended_response / 스트리밍 섹션 파싱 (큰 응답)
+
+모델 벤치마크는 torch 스레드 수(--torch-threads)와 동적 int8 양자화 여부(--quantize)의 모든 조합으로 실행됩니다.
+양자화 조합마다 모델을 한 번씩 새로 로드하며(TORCH_QUANTIZE_STT / TORCH_QUANTIZE_TTS와 같은 경로), 스레드 수는
+측정 직전에 torch.set_num_threads로 바꿉니다. pytest-benchmark나 모델 라이브러리가 없으면 해당 파일은 건너뜁니다.
+
+사용 예:
+    pip install pytest-benchmark
+    python -m pytest benchmarks/micro --benchmark-autosave
+    python -m pytest benchmarks/micro/bench_stt.py --torch-threads 1,4 --quantize off,on --whisper-size base \\
+        --audio sample.wav --benchmark-compare
+    python -m pytest benchmarks/micro -k "parsing or audio" --benchmark-json micro.json
+
+Whisper는 합성 음성에서 디코딩 길이가 흔들릴 수 있으므로, 커밋 간 비교에는 --audio로 실제 녹음을 지정하는 것이 좋습니다.
+(녹음을 반복 / 잘라서 각 길이의 입력을 만듭니다)
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
+
+QUANTIZE_CHOICES = {'off': False, 'on': True}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('micro', "추론 핫패스 마이크로 벤치마크")
+    group.addoption('--torch-threads', default=None,
+                    help="측정할 torch 스레드 수 목록 (쉼표 구분, 기본: 1과 CPU 코어 수)")
+    group.addoption('--quantize', default='off,on',
+                    help="측정할 동적 int8 양자화 설정 (off, on 중 쉼표 구분)")
+    group.addoption('--whisper-size', default=os.getenv('STT_MODEL_SIZE', 'medium'),
+                    help="Whisper 모델 크기 (기본: STT_MODEL_SIZE 또는 medium)")
+    group.addoption('--audio', default=None,
+                    help="Whisper / 디코딩 입력으로 사용할 녹음 파일 (없으면 합성 음성)")
+
+
+def _thread_counts(config):
+    option = config.getoption('--torch-threads')
+    if option:
+        return sorted({max(1, int(value)) for value in option.split(',') if value.strip()})
+    return sorted({1, os.cpu_count() or 1})
+
+
+def _quantize_settings(config):
+    values = [value.strip() for value in config.getoption('--quantize').split(',') if value.strip()]
+    for value in values:
+        if value not in QUANTIZE_CHOICES:
+            raise pytest.UsageError(f"--quantize는 off, on 중에서 지정합니다: {value}")
+    return [QUANTIZE_CHOICES[value] for value in dict.fromkeys(values)]
+
+
+def pytest_generate_tests(metafunc):
+    # 모델 벤치마크는 스레드 수 × 양자화 조합으로 실행
+    if 'torch_threads' in metafunc.fixturenames:
+        counts = _thread_counts(metafunc.config)
+        metafunc.parametrize('torch_threads', counts, ids=[f"threads{count}" for count in counts], indirect=True)
+    if 'quantize' in metafunc.fixturenames:
+        settings = _quantize_settings(metafunc.config)
+        metafunc.parametrize('quantize', settings, ids=['int8' if value else 'fp32' for value in settings],
+                             scope='module')
+
+
+@pytest.fixture
+def torch_threads(request):
+    """
+    측정하는 동안 torch intra-op 스레드 수를 바꾸고, 끝나면 되돌립니다.
+    """
+    torch = pytest.importorskip('torch')
+    from app.services.torch_optimizer import configure_torch_threads
+
+    # 모델 로드 시의 스레드 설정(프로세스당 한 번)이 측정용 설정을 덮어쓰지 않도록 먼저 적용
+    configure_torch_threads()
+    previous = torch.get_num_threads()
+    torch.set_num_threads(request.param)
+    yield request.param
+    torch.set_num_threads(previous)
+
+
+@pytest.fixture(scope='session')
+def source_audio(request):
+    """
+    길이별 입력을 만들 원본 음성 (16kHz mono float32).
+    """
+    path = request.config.getoption('--audio')
+    if path:
+        from app.services.audio_service import load_audio_file
+
+        return load_audio_file(path)
+
+    from benchmarks.e2e.corpus import TEXTS, synthesize_clip
+
+    return np.concatenate([synthesize_clip(text, 'en', seed) for seed, text in enumerate(TEXTS['en'])])
+
+
+@pytest.fixture(scope='session')
+def make_clip(source_audio):
+    """
+    원본 음성을 반복하거나 잘라서 지정한 길이(초)의 입력을 만듭니다.
+    """
+    from app.services.audio_service import SAMPLE_RATE
+
+    def make(seconds):
+        length = int(seconds * SAMPLE_RATE)
+        repeats = -(-length // len(source_audio))
+        return np.ascontiguousarray(np.tile(source_audio, repeats)[:length], dtype=np.float32)
+
+    return make
@@ -0,0 +1,228 @@
+"""
+STT 백엔드 A/B 비교 스크립트.
+
+공용 테스트 코퍼스로 두 개 이상의 STT 백엔드를 실행하여 정확도(WER/CER)와 발화당 CPU 시간을 비교합니다.
+
+코퍼스 manifest는 한 줄에 하나의 JSON 객체를 담은 JSONL 파일입니다. (audio 경로는 manifest 기준 상대 경로 가능)
+    {"audio": "en/0001.wav", "language": "en", "text": "Hello, how are you?"}
+    {"audio": "ja/0001.wav", "language": "ja", "text": "こんにちは、元気ですか？"}
+
+사용 예:
+    python -m benchmarks.stt_parity --manifest corpus/manifest.jsonl \\
+        --backend whisper:medium --backend faster-whisper:medium:int8 --output parity.json
+
+peak_rss_mb는 프로세스 전체 최대값이므로, 백엔드별 메모리를 정확히 비교하려면 --backend를 하나씩 지정하여 따로 실행합니다.
+"""
+import argparse
+import json
+import os
+import re
+import resource
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 단어 사이 공백이 없는 언어는 문자 단위로 비교 (CER)
+CHARACTER_LEVEL_LANGUAGES = ('ja', 'zh', 'ko')
+
+
+def normalize_transcript(text):
+    """
+    비교용으로 텍스트를 정규화합니다. (NFKC, 소문자, 문장 부호 제거, 공백 정리)
+    """
+    text = unicodedata.normalize('NFKC', text or "").lower()
+    text = "".join(" " if unicodedata.category(ch).startswith('P') else ch for ch in text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def tokenize(text, language):
+    text = normalize_transcript(text)
+    if language in CHARACTER_LEVEL_LANGUAGES:
+        return [ch for ch in text if not ch.isspace()]
+    return text.split()
+
+
+def edit_distance(reference, hypothesis):
+    """
+    토큰 목록 사이의 레벤슈타인 거리를 계산합니다.
+    """
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_token in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp_token in enumerate(hypothesis, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_token != hyp_token)
+            )
+        previous = current
+    return previous[-1]
+
+
+def error_rate(references, hypotheses, language):
+    """
+    코퍼스 전체의 WER(문자 단위 언어는 CER)를 계산합니다.
+    """
+    errors = 0
+    total = 0
+    for reference, hypothesis in zip(references, hypotheses):
+        ref_tokens = tokenize(reference, language)
+        errors += edit_distance(ref_tokens, tokenize(hypothesis, language))
+        total += len(ref_tokens)
+    return errors / total if total else 0.0
+
+
+def max_rss_mb():
+    # Linux에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_manifest(path):
+    base_dir = os.path.dirname(os.path.abspath(path))
+    items = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if not os.path.isabs(item['audio']):
+                item['audio'] = os.path.join(base_dir, item['audio'])
+            items.append(item)
+    return items
+
+
+def parse_backend_spec(spec):
+    """
+    "이름[:모델 크기[:연산 정밀도]]" 형식을 (이름, 옵션) 으로 변환합니다.
+    """
+    parts = spec.split(':')
+    options = {}
+    if len(parts) > 1 and parts[1]:
+        options['model_size'] = parts[1]
+    if len(parts) > 2 and parts[2]:
+        options['compute_type'] = parts[2]
+    return parts[0], options
+
+
+def run_backend(spec, items, audios, args):
+    # stt_service를 먼저 import해야 torch.load 호환 설정이 적용됨
+    import app.services.stt_service  # noqa: F401
+    from app.services.stt_backends import create_stt_backend
+
+    name, options = parse_backend_spec(spec)
+    options.setdefault('model_size', args.model_size)
+    options.setdefault('compute_type', args.compute_type)
+    backend = create_stt_backend(
+        name,
+        cpu_threads=args.cpu_threads,
+        beam_size=args.beam_size or None,
+        **options
+    )
+
+    rss_before = max_rss_mb()
+    started = time.perf_counter()
+    backend.load()
+    load_seconds = time.perf_counter() - started
+
+    # 첫 추론의 초기화 비용은 측정에서 제외
+    backend.transcribe(audios[0], language=items[0].get('language'))
+
+    hypotheses = []
+    cpu_times = []
+    wall_times = []
+    for item, audio in zip(items, audios):
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        result = backend.transcribe(audio, language=item.get('language'))
+        cpu_times.append(time.process_time() - cpu_started)
+        wall_times.append(time.perf_counter() - wall_started)
+        hypotheses.append(result['text'])
+
+    audio_seconds = sum(len(audio) for audio in audios) / 16000
+    return {
+        'backend': backend.describe(),
+        'load_seconds': round(load_seconds, 2),
+        'peak_rss_mb': round(max_rss_mb(), 1),
+        'rss_growth_mb': round(max_rss_mb() - rss_before, 1),
+        'cpu_seconds_per_utterance': round(sum(cpu_times) / len(cpu_times), 3),
+        'wall_seconds_per_utterance': round(sum(wall_times) / len(wall_times), 3),
+        'real_time_factor': round(sum(wall_times) / audio_seconds, 3) if audio_seconds else None,
+        'hypotheses': hypotheses
+    }
+
+
+def summarize(items, runs):
+    languages = sorted({item.get('language') or 'en' for item in items})
+    for run in runs:
+        run['error_rate'] = {}
+        for language in languages:
+            indexes = [i for i, item in enumerate(items) if (item.get('language') or 'en') == language]
+            run['error_rate'][language] = round(error_rate(
+                [items[i]['text'] for i in indexes],
+                [run['hypotheses'][i] for i in indexes],
+                language
+            ), 4)
+
+    # 기준 백엔드(첫 번째) 출력과의 불일치율
+    baseline = runs[0]
+    for run in runs[1:]:
+        run['disagreement_vs_baseline'] = {}
+        for language in languages:
+            indexes = [i for i, item in enumerate(items) if (item.get('language') or 'en') == language]
+            run['disagreement_vs_baseline'][language] = round(error_rate(
+                [baseline['hypotheses'][i] for i in indexes],
+                [run['hypotheses'][i] for i in indexes],
+                language
+            ), 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STT 백엔드 정확도/속도 A/B 비교")
+    parser.add_argument('--manifest', required=True, help="코퍼스 JSONL 파일")
+    parser.add_argument('--backend', action='append', dest='backends',
+                        help="이름[:모델 크기[:연산 정밀도]] (여러 번 지정, 첫 번째가 기준)")
+    parser.add_argument('--model-size', default='medium')
+    parser.add_argument('--compute-type', default='int8')
+    parser.add_argument('--cpu-threads', type=int, default=0)
+    parser.add_argument('--beam-size', type=int, default=0)
+    parser.add_argument('--max-error-rate-delta', type=float, default=None,
+                        help="기준 대비 WER/CER 증가가 이 값을 넘으면 종료 코드 1")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    backends = args.backends or ['whisper', 'faster-whisper']
+    items = load_manifest(args.manifest)
+    if not items:
+        parser.error("코퍼스가 비어 있습니다.")
+
+    from app.services.audio_service import load_audio_file
+    audios = [load_audio_file(item['audio']) for item in items]
+
+    runs = [run_backend(spec, items, audios, args) for spec in backends]
+    summarize(items, runs)
+
+    print(f"{'backend':<40} {'cpu s/utt':>10} {'wall s/utt':>11} {'RTF':>7} {'RSS MB':>8}  error rate")
+    for run in runs:
+        label = ':'.join(str(v) for v in run['backend'].values())
+        print(f"{label:<40} {run['cpu_seconds_per_utterance']:>10} {run['wall_seconds_per_utterance']:>11} "
+              f"{run['real_time_factor']:>7} {run['peak_rss_mb']:>8}  {run['error_rate']}")
+
+    report = {'utterances': len(items), 'runs': runs}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.max_error_rate_delta is not None:
+        baseline = runs[0]['error_rate']
+        for run in runs[1:]:
+            for language, value in run['error_rate'].items():
+                if value - baseline[language] > args.max_error_rate_delta:
+                    print(f"정확도 저하: {run['backend']} {language} {baseline[language]} -> {value}")
+                    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
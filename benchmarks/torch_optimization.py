@@ -0,0 +1,122 @@
+"""
+PyTorch 모델 최적화(스레드 설정, inference_mode, 동적 int8 양자화) 효과 측정 스크립트.
+
+설정 조합마다 새 프로세스에서 모델을 로드하고 같은 입력으로 추론을 반복하여
+로드 시간, 추론 지연(p50/평균), 최대 RSS를 비교합니다. 설정은 환경 변수로 전달되므로
+config/settings.py의 TORCH_* 플래그와 같은 경로로 적용됩니다.
+
+사용 예:
+    python -m benchmarks.torch_optimization --model whisper --audio sample.wav --runs 5
+    python -m benchmarks.torch_optimization --model tts_en --text "Hello, how are you today?"
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 비교할 설정 조합 (이름 → 환경 변수)
+VARIANTS = {
+    'baseline': {'TORCH_INFERENCE_MODE': 'false', 'TORCH_QUANTIZE_STT': 'false', 'TORCH_QUANTIZE_TTS': 'false'},
+    'inference_mode': {'TORCH_INFERENCE_MODE': 'true', 'TORCH_QUANTIZE_STT': 'false', 'TORCH_QUANTIZE_TTS': 'false'},
+    'quantized': {'TORCH_INFERENCE_MODE': 'false', 'TORCH_QUANTIZE_STT': 'true', 'TORCH_QUANTIZE_TTS': 'true'},
+    'all': {'TORCH_INFERENCE_MODE': 'true', 'TORCH_QUANTIZE_STT': 'true', 'TORCH_QUANTIZE_TTS': 'true'}
+}
+
+
+def _run_variant(model_name, env, options, results):
+    # Config는 import 시점에 환경 변수를 읽으므로 앱 모듈보다 먼저 설정
+    os.environ.update(env)
+    sys.path.insert(0, ROOT_DIR)
+
+    started = time.perf_counter()
+    if model_name == 'whisper':
+        from app.services.stt_service import get_stt_backend
+        from app.services.audio_service import load_audio_file
+
+        backend = get_stt_backend()
+        backend.load()
+        audio = load_audio_file(options['audio'])
+
+        def infer():
+            backend.transcribe(audio, language=options.get('language'))
+    else:
+        from app.services.tts_service import get_tts_model
+        from app.services.torch_optimizer import inference_mode
+
+        language = 'ja' if model_name == 'tts_ja' else 'en'
+        model = get_tts_model(language)
+
+        def infer():
+            with inference_mode():
+                model.tts(text=options['text'])
+    load_seconds = time.perf_counter() - started
+
+    # 첫 추론(메모리 할당 등)은 측정에서 제외
+    infer()
+    latencies = []
+    for _ in range(options['runs']):
+        run_started = time.perf_counter()
+        infer()
+        latencies.append(time.perf_counter() - run_started)
+
+    import torch
+    results.put({
+        'load_seconds': round(load_seconds, 2),
+        'latency_p50': round(statistics.median(latencies), 3),
+        'latency_mean': round(statistics.mean(latencies), 3),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'torch_threads': torch.get_num_threads()
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyTorch 모델 최적화 지연/RSS 비교")
+    parser.add_argument('--model', choices=['whisper', 'tts_en', 'tts_ja'], default='whisper')
+    parser.add_argument('--audio', help="Whisper 측정용 오디오 파일")
+    parser.add_argument('--language', default='en')
+    parser.add_argument('--text', default="Hello, how are you today? I hope you are having a great day.")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--variant', action='append', choices=list(VARIANTS), help="측정할 조합 (기본: 전체)")
+    parser.add_argument('--threads', type=int, default=0, help="TORCH_NUM_THREADS (0이면 자동)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if args.model == 'whisper' and not args.audio:
+        parser.error("--model whisper는 --audio가 필요합니다.")
+
+    options = {'audio': args.audio, 'language': args.language, 'text': args.text, 'runs': args.runs}
+    context = multiprocessing.get_context('spawn')
+    report = {}
+    for name in args.variant or list(VARIANTS):
+        env = dict(VARIANTS[name], TORCH_NUM_THREADS=str(args.threads), STT_BACKEND='whisper',
+                   STT_BATCH_ENABLED='false', TTS_CACHE_ENABLED='false', TTS_PARALLEL_ENABLED='false')
+        results = context.Queue()
+        process = context.Process(target=_run_variant, args=(args.model, env, options, results))
+        process.start()
+        process.join()
+        if process.exitcode != 0:
+            report[name] = {'error': f"exit code {process.exitcode}"}
+        else:
+            report[name] = results.get()
+        print(f"{name:<16} {json.dumps(report[name])}")
+
+    baseline = report.get('baseline', {})
+    if 'latency_p50' in baseline:
+        for name, result in report.items():
+            if 'latency_p50' in result:
+                result['speedup_vs_baseline'] = round(baseline['latency_p50'] / result['latency_p50'], 2)
+                result['rss_delta_mb'] = round(result['peak_rss_mb'] - baseline['peak_rss_mb'], 1)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'model': args.model, 'runs': args.runs, 'variants': report}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
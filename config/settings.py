@@ -15,4 +15,126 @@ class Config:
     
     # OpenAI API 설정
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
\ No newline at end of file
+    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+
+    # GPT 클라이언트 레지스트리 설정 (앱 시작 시 클라이언트를 미리 생성)
+    GPT_CLIENT_EAGER_INIT = os.getenv('GPT_CLIENT_EAGER_INIT', 'true').lower() == 'true'
+
+    # 비동기 GPT 클라이언트 설정 (전용 이벤트 루프 + HTTP/2 연결 풀)
+    GPT_ASYNC_ENABLED = os.getenv('GPT_ASYNC_ENABLED', 'false').lower() == 'true'
+    GPT_HTTP2_ENABLED = os.getenv('GPT_HTTP2_ENABLED', 'true').lower() == 'true'
+    GPT_HTTP_MAX_CONNECTIONS = int(os.getenv('GPT_HTTP_MAX_CONNECTIONS', '20'))
+    GPT_HTTP_MAX_KEEPALIVE = int(os.getenv('GPT_HTTP_MAX_KEEPALIVE', '10'))
+    GPT_HTTP_KEEPALIVE_EXPIRY = float(os.getenv('GPT_HTTP_KEEPALIVE_EXPIRY', '60'))
+    GPT_CONNECT_TIMEOUT = float(os.getenv('GPT_CONNECT_TIMEOUT', '5'))
+    GPT_READ_TIMEOUT = float(os.getenv('GPT_READ_TIMEOUT', '60'))
+    GPT_WRITE_TIMEOUT = float(os.getenv('GPT_WRITE_TIMEOUT', '10'))
+    GPT_POOL_TIMEOUT = float(os.getenv('GPT_POOL_TIMEOUT', '5'))
+    GPT_REQUEST_TIMEOUT = float(os.getenv('GPT_REQUEST_TIMEOUT', '120'))
+
+    # STT 마이크로 배치 설정
+    STT_BATCH_ENABLED = os.getenv('STT_BATCH_ENABLED', 'true').lower() == 'true'
+    STT_BATCH_MAX_SIZE = int(os.getenv('STT_BATCH_MAX_SIZE', '8'))
+    STT_BATCH_MAX_WAIT_MS = float(os.getenv('STT_BATCH_MAX_WAIT_MS', '15'))
+
+    # 오디오 디코더 워커 풀 설정
+    AUDIO_DECODER_POOL_ENABLED = os.getenv('AUDIO_DECODER_POOL_ENABLED', 'false').lower() == 'true'
+    AUDIO_DECODER_WORKERS = int(os.getenv('AUDIO_DECODER_WORKERS', '2'))
+    AUDIO_DECODER_MAX_QUEUE = int(os.getenv('AUDIO_DECODER_MAX_QUEUE', '32'))
+    AUDIO_DECODER_TIMEOUT = float(os.getenv('AUDIO_DECODER_TIMEOUT', '30'))
+    AUDIO_DECODER_HEALTH_INTERVAL = float(os.getenv('AUDIO_DECODER_HEALTH_INTERVAL', '30'))
+
+    # TTS 오디오 캐시 설정
+    TTS_CACHE_ENABLED = os.getenv('TTS_CACHE_ENABLED', 'true').lower() == 'true'
+    TTS_CACHE_DIR = os.getenv('TTS_CACHE_DIR', os.path.join(os.path.dirname(BASE_DIR), "cache", "tts"))
+    TTS_CACHE_MAX_MB = int(os.getenv('TTS_CACHE_MAX_MB', '512'))
+
+    # 번역 캐시 설정 (메모리 LRU + SQLite)
+    TRANSLATION_CACHE_ENABLED = os.getenv('TRANSLATION_CACHE_ENABLED', 'true').lower() == 'true'
+    TRANSLATION_CACHE_PATH = os.getenv('TRANSLATION_CACHE_PATH', os.path.join(os.path.dirname(BASE_DIR), "cache", "translation.sqlite3"))
+    TRANSLATION_CACHE_MEMORY_ENTRIES = int(os.getenv('TRANSLATION_CACHE_MEMORY_ENTRIES', '2048'))
+    TRANSLATION_CACHE_TTL = float(os.getenv('TRANSLATION_CACHE_TTL', str(7 * 24 * 3600)))
+    TRANSLATION_CACHE_VERSION = os.getenv('TRANSLATION_CACHE_VERSION', '1')
+
+    # 문장 단위 병렬 TTS 설정 (워커마다 TTS 모델을 따로 로드함)
+    TTS_PARALLEL_ENABLED = os.getenv('TTS_PARALLEL_ENABLED', 'false').lower() == 'true'
+    TTS_PARALLEL_WORKERS = int(os.getenv('TTS_PARALLEL_WORKERS', str(min(4, os.cpu_count() or 1))))
+    TTS_PARALLEL_THREADS_PER_WORKER = int(os.getenv('TTS_PARALLEL_THREADS_PER_WORKER', '1'))
+    TTS_CROSSFADE_MS = float(os.getenv('TTS_CROSSFADE_MS', '10'))  # 문장 사이 무음과 맞닿는 경계의 페이드 길이(ms)
+
+    # STT 백엔드 설정 (whisper: openai-whisper float32, faster-whisper: CTranslate2 양자화)
+    STT_BACKEND = os.getenv('STT_BACKEND', 'whisper')
+    STT_MODEL_SIZE = os.getenv('STT_MODEL_SIZE', 'medium')
+    STT_COMPUTE_TYPE = os.getenv('STT_COMPUTE_TYPE', 'int8')
+    STT_CPU_THREADS = int(os.getenv('STT_CPU_THREADS', '0'))
+    STT_NUM_WORKERS = int(os.getenv('STT_NUM_WORKERS', '1'))
+    STT_BEAM_SIZE = int(os.getenv('STT_BEAM_SIZE', '0'))
+
+    # 음성 구간 검출(VAD) 설정: 인식 전에 무음을 잘라내고 긴 녹음을 음성 덩어리로 분할
+    VAD_ENABLED = os.getenv('VAD_ENABLED', 'true').lower() == 'true'
+    VAD_FRAME_MS = float(os.getenv('VAD_FRAME_MS', '30'))
+    VAD_ENERGY_MARGIN_DB = float(os.getenv('VAD_ENERGY_MARGIN_DB', '12'))  # 잡음 수준 대비 음성 판정 여유값
+    VAD_MIN_ENERGY_DB = float(os.getenv('VAD_MIN_ENERGY_DB', '-50'))  # 이보다 작은 프레임은 항상 무음
+    VAD_MIN_SPEECH_MS = float(os.getenv('VAD_MIN_SPEECH_MS', '200'))
+    VAD_MIN_SILENCE_MS = float(os.getenv('VAD_MIN_SILENCE_MS', '400'))
+    VAD_PADDING_MS = float(os.getenv('VAD_PADDING_MS', '200'))
+    VAD_MAX_CHUNK_SECONDS = float(os.getenv('VAD_MAX_CHUNK_SECONDS', '30'))
+
+    # 장시간 오디오 인식 설정 (VAD 경계로 나눈 덩어리를 워커 풀에서 동시에 인식, faster-whisper 백엔드만 해당)
+    STT_LONG_WORKERS = int(os.getenv('STT_LONG_WORKERS', '2'))
+    STT_LONG_MAX_CHUNK_SECONDS = float(os.getenv('STT_LONG_MAX_CHUNK_SECONDS', '30'))
+    STT_LONG_OVERLAP_SECONDS = float(os.getenv('STT_LONG_OVERLAP_SECONDS', '1'))
+
+    # 스트리밍 STT 설정 (WebSocket 서버는 Waitress와 별도 포트에서 실행, create_app마다 포트를 열므로 기본값은 꺼짐)
+    STT_STREAM_ENABLED = os.getenv('STT_STREAM_ENABLED', 'false').lower() == 'true'
+    STT_STREAM_HOST = os.getenv('STT_STREAM_HOST', '0.0.0.0')
+    STT_STREAM_PORT = int(os.getenv('STT_STREAM_PORT', '5001'))
+    STT_STREAM_PARTIAL_INTERVAL_MS = float(os.getenv('STT_STREAM_PARTIAL_INTERVAL_MS', '1000'))
+    STT_STREAM_ENDPOINT_SILENCE_MS = float(os.getenv('STT_STREAM_ENDPOINT_SILENCE_MS', '600'))
+    STT_STREAM_MAX_SEGMENT_SECONDS = float(os.getenv('STT_STREAM_MAX_SEGMENT_SECONDS', '25'))
+
+    # 여러 크기 Whisper 모델 라우팅 설정 (짧은 발화는 작은 모델, 신뢰도가 낮으면 기본 모델로 재인식)
+    STT_ROUTING_ENABLED = os.getenv('STT_ROUTING_ENABLED', 'false').lower() == 'true'
+    STT_ROUTING_RULES = os.getenv('STT_ROUTING_RULES', 'base:3,small:10')  # 모델:최대 음성 길이(초), 나머지는 STT_MODEL_SIZE
+    STT_QUALITY_SIZES = os.getenv('STT_QUALITY_SIZES', 'fast:base,balanced:small')  # best는 STT_MODEL_SIZE
+    STT_MODEL_MEMORY_BUDGET_MB = float(os.getenv('STT_MODEL_MEMORY_BUDGET_MB', '4096'))
+    STT_ESCALATION_ENABLED = os.getenv('STT_ESCALATION_ENABLED', 'true').lower() == 'true'
+    STT_ESCALATION_LOGPROB = float(os.getenv('STT_ESCALATION_LOGPROB', '-0.8'))
+
+    # 언어 감지 캐시 (오디오 해시 → 감지 결과, 프로세스 내 LRU)
+    LANGUAGE_DETECTION_CACHE_SIZE = int(os.getenv('LANGUAGE_DETECTION_CACHE_SIZE', '256'))
+
+    # PyTorch 모델 최적화 설정 (CPU 추론)
+    SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', '1'))
+    TORCH_NUM_THREADS = int(os.getenv('TORCH_NUM_THREADS', '0'))  # 0이면 CPU 코어 수 / SERVER_WORKERS
+    TORCH_INTEROP_THREADS = int(os.getenv('TORCH_INTEROP_THREADS', '0'))  # 0이면 torch 기본값
+    TORCH_INFERENCE_MODE = os.getenv('TORCH_INFERENCE_MODE', 'true').lower() == 'true'
+    TORCH_QUANTIZE_STT = os.getenv('TORCH_QUANTIZE_STT', 'false').lower() == 'true'
+    TORCH_QUANTIZE_TTS = os.getenv('TORCH_QUANTIZE_TTS', 'false').lower() == 'true'
+
+    # 시작 시 모델 워밍업 설정 (모델 로드 + 더미 추론)
+    MODEL_WARMUP_ENABLED = os.getenv('MODEL_WARMUP_ENABLED', 'true').lower() == 'true'
+    MODEL_WARMUP_MODELS = os.getenv('MODEL_WARMUP_MODELS', 'whisper,tts_en,tts_ja,gpt')
+    MODEL_WARMUP_INFERENCE = os.getenv('MODEL_WARMUP_INFERENCE', 'true').lower() == 'true'
+
+    # 단계별 지연 시간 메트릭 (Prometheus 형식, /talk/metrics)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+    # 요청별 trace (STT / GPT / TTS 구간, /talk/traces, OTLP/JSON 파일)
+    TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'true').lower() == 'true'
+    TRACING_EXPORTERS = os.getenv('TRACING_EXPORTERS', 'memory')  # memory, file (쉼표로 여러 개)
+    TRACING_FILE_PATH = os.getenv('TRACING_FILE_PATH', os.path.join(os.path.dirname(BASE_DIR), "traces", "traces.jsonl"))
+    TRACING_MEMORY_MAX_TRACES = int(os.getenv('TRACING_MEMORY_MAX_TRACES', '200'))
+    TRACING_MIN_DURATION_MS = float(os.getenv('TRACING_MIN_DURATION_MS', '0'))  # 이보다 빠른 요청은 내보내지 않음
+    TRACING_SERVICE_NAME = os.getenv('TRACING_SERVICE_NAME', 'talk')
+
+
+def get_setting(name, default=None):
+    """
+    설정 값을 반환합니다.
+    앱 컨텍스트가 있으면 current_app.config를, 없으면(백그라운드 스레드 등) Config 클래스 값을 사용합니다.
+    """
+    from flask import current_app, has_app_context
+    if has_app_context():
+        return current_app.config.get(name, default)
+    return getattr(Config, name, default)
@@ -1,8 +1,20 @@
 from app import create_app
 from waitress import serve
+from config.settings import Config
 
-app = create_app()
+if __name__ not in ('__main__', '__mp_main__'):
+    # WSGI 서버(gunicorn run:app, waitress-serve run:app 등)에서 import할 때 사용하는 앱
+    # (직접 실행할 때는 prefork 부모가 fork 전에 앱을 만들지 않도록 아래에서 생성하며,
+    #  spawn 방식 자식 프로세스(오디오 디코더 / TTS 워커 풀)가 이 파일을 __mp_main__으로 다시 import할 때는 만들지 않음)
+    app = create_app()
 
 if __name__ == '__main__':
-    print("Starting Waitress server...")
-    serve(app, host="0.0.0.0", port=5000, threads=8)
\ No newline at end of file
+    if Config.SERVER_WORKERS > 1:
+        # 여러 워커 프로세스가 부모에서 로드한 모델을 copy-on-write로 공유
+        from app.prefork import serve_prefork
+        print(f"Starting prefork Waitress server ({Config.SERVER_WORKERS} workers)...")
+        serve_prefork(create_app, host="0.0.0.0", port=5000, workers=Config.SERVER_WORKERS, threads=8)
+    else:
+        app = create_app()
+        print("Starting Waitress server...")
+        serve(app, host="0.0.0.0", port=5000, threads=8)